@@ -1,12 +1,14 @@
 """Asynchronous channels and utilities."""
 
-__all__ = ('ProhibitedOperationError', 'complete_one',
+__all__ = ('ProhibitedOperationError', 'combine_latest', 'complete_one',
            'create_blocking_buffer', 'create_dropping_buffer',
            'create_sliding_buffer', 'create_channel', 'create_mix',
-           'create_multiple', 'create_publication', 'itermerge',
-           'iterzip', 'merge', 'map', 'onto_channel', 'to_channel',
-           'pipe', 'reduce', 'shield_from_close', 'shield_from_read',
-           'shield_from_write', 'split')
+           'create_multiple', 'create_pipeline', 'create_publication',
+           'create_selector', 'create_shared_channel',
+           'create_threadsafe_channel', 'itermerge', 'iterzip', 'merge',
+           'map', 'map_batches', 'onto_channel', 'to_channel', 'partition',
+           'pipe', 'reduce', 'scan', 'shield_from_close', 'shield_from_read',
+           'shield_from_write', 'split', 'window_reduce')
 
 __version__ = '0.9.1'
 
@@ -16,13 +18,21 @@ from ._buffer import (create_blocking_buffer, create_dropping_buffer,
 from ._create_channel import create_channel
 from ._create_mix import create_mix
 from ._create_multiple import create_multiple
+from ._create_pipeline import create_pipeline
 from ._create_publication import create_publication
-from ._iter import itermerge, iterzip
+from ._create_selector import create_selector
+from ._create_shared_channel import create_shared_channel
+from ._create_threadsafe_channel import create_threadsafe_channel
+from ._iter import combine_latest, itermerge, iterzip
 from ._merge import merge
 from ._map import map
+from ._map_batches import map_batches
 from ._onto_channel import onto_channel, to_channel
+from ._partition import partition
 from ._pipe import pipe
 from ._reduce import reduce
+from ._scan import scan
 from ._shield import (ProhibitedOperationError, shield_from_close,
                       shield_from_read, shield_from_write)
 from ._split import split
+from ._window_reduce import window_reduce
@@ -4,22 +4,156 @@ __all__ = (
     'create_sliding_buffer'
 )
 
-from asyncio import Queue
+from asyncio import QueueEmpty, QueueFull
+from collections import deque
 
-from ._dropping_queue import DroppingQueue
-from ._sliding_queue import SlidingQueue
+
+class BlockingBuffer:
+    """A bounded FIFO buffer.
+
+    When the buffer is full it reports so, and attempts to add an item
+    raise QueueFull.
+    """
+
+    __slots__ = ('maxsize', '_items')
+
+    def __init__(self, maxsize, *, _deque=deque):
+        self.maxsize = maxsize
+        self._items = _deque()
+
+    def empty(self):
+        """Return True if the buffer has no items, False otherwise."""
+        return not self._items
+
+    def full(self):
+        """Return True if adding an item would block, False otherwise."""
+        return len(self._items) >= self.maxsize
+
+    def qsize(self):
+        """Return the number of items in the buffer."""
+        return len(self._items)
+
+    def get_nowait(self, *, _QueueEmpty=QueueEmpty):
+        """Remove and return the oldest item.
+
+        Raises QueueEmpty if the buffer is empty.
+        """
+        try:
+            return self._items.popleft()
+        except IndexError:
+            raise _QueueEmpty from None
+
+    def put_nowait(self, x, *, _QueueFull=QueueFull):
+        """Add x to the buffer.
+
+        Raises QueueFull if the buffer is full.
+        """
+        items = self._items
+        if len(items) >= self.maxsize:
+            raise _QueueFull
+        items.append(x)
+
+    def get_many_nowait(self, n):
+        """Remove and return up to n of the oldest items, as a list."""
+        items = self._items
+        popleft = items.popleft
+        return [popleft() for _ in range(min(n, len(items)))]
+
+    def put_many_nowait(self, xs, *, _QueueFull=QueueFull):
+        """Add all items in sequence xs to the buffer.
+
+        Raises QueueFull, and adds nothing, if they do not all fit.
+        """
+        items = self._items
+        if len(items) + len(xs) > self.maxsize:
+            raise _QueueFull
+        items.extend(xs)
+
+
+class DroppingBuffer(BlockingBuffer):
+    """A bounded buffer that maintains a "fixed window".
+
+    When an item is added to a full buffer, instead of blocking it is
+    discarded.
+    """
+
+    __slots__ = ()
+
+    def full(self):
+        """Return True if "put" will block, False otherwise."""
+        return False
+
+    def put_nowait(self, x):
+        """Add x to the buffer.
+
+        May drop x.
+        """
+        items = self._items
+        if len(items) < self.maxsize:
+            items.append(x)
+
+    def put_many_nowait(self, xs):
+        """Add items in sequence xs to the buffer.
+
+        Items that do not fit are dropped.
+        """
+        items = self._items
+        room = self.maxsize - len(items)
+        items.extend(xs if len(xs) <= room else xs[:room])
+
+
+class SlidingBuffer(BlockingBuffer):
+    """A bounded buffer that maintains a "sliding window".
+
+    When an item is added to a full buffer, instead of blocking the oldest
+    item in the buffer is discarded.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, maxsize, *, _deque=deque):
+        self.maxsize = maxsize
+        # The deque discards its oldest item once maxlen is reached.
+        self._items = _deque(maxlen=maxsize)
+
+    def full(self):
+        """Return True if "put" will block, False otherwise."""
+        return False
+
+    def put_nowait(self, x):
+        """Add x to the buffer.
+
+        May discard the oldest item from the buffer.
+        """
+        self._items.append(x)
+
+    def put_many_nowait(self, xs):
+        """Add items in sequence xs to the buffer.
+
+        May discard the oldest items from the buffer.
+        """
+        self._items.extend(xs)
+
+
+def _check_size(n, minimum=1):
+    if not isinstance(n, int):
+        raise TypeError(f'n must be an integer, not a {type(n)}')
+    if n < minimum:
+        raise ValueError(
+            f'n must be a {"positive" if minimum else "non-negative"} '
+            f'integer, not {n}')
 
 
 def create_blocking_buffer(n):
     """Get a buffer of size n.
 
     If buffer is full then attempts to add an item will block.
+
+    If n is zero then the buffer never holds an item, and a channel using
+    it hands each item directly from a producer to a consumer.
     """
-    if not isinstance(n, int):
-        raise TypeError(f'n must be an integer, not a {type(n)}')
-    if n < 1:
-        raise ValueError(f'n must be a positive integer, not {n}')
-    return Queue(n)
+    _check_size(n, minimum=0)
+    return BlockingBuffer(n)
 
 
 def create_dropping_buffer(n):
@@ -28,7 +162,8 @@ def create_dropping_buffer(n):
     If buffer is full then adding an item will not block, but the item
     will be discarded.
     """
-    return DroppingQueue(create_blocking_buffer(n))
+    _check_size(n)
+    return DroppingBuffer(n)
 
 
 def create_sliding_buffer(n):
@@ -37,4 +172,5 @@ def create_sliding_buffer(n):
     If buffer is full then adding an item will not block, but the oldest
     item in the buffer will be removed and discarded.
     """
-    return SlidingQueue(create_blocking_buffer(n))
+    _check_size(n)
+    return SlidingBuffer(n)
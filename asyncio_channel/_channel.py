@@ -1,9 +1,122 @@
 __all__ = ('Channel',)
 
-from asyncio import Event
+from asyncio import CancelledError, Event, get_running_loop
+from collections import deque
+from functools import partial
+from itertools import islice
+from operator import is_
 
 from ._mixin import ReprMixin
-from ._util import wait_first
+
+# Result given to a blocked take() when the channel is closed.
+_CLOSED = object()
+# Result given to a blocked call when its deadline passes.
+_TIMEOUT = object()
+# Marks the end of an iterator.
+_END = object()
+
+_is_none = partial(is_, None)
+
+# Waiter lists at least this long are purged of finished waiters whenever
+# their length reaches a power of two.
+_PURGE_MIN = 64
+
+
+def _get_many_nowait(get_nowait, qsize, n):
+    """Remove up to n items from a buffer without bulk support."""
+    return [get_nowait() for _ in range(min(n, qsize()))]
+
+
+def _put_many_nowait(put_nowait, xs):
+    """Add items to a buffer without bulk support."""
+    for x in xs:
+        put_nowait(x)
+
+
+def _is_done(fut):
+    return fut.done()
+
+
+def _is_put_done(entry):
+    return entry[0].done()
+
+
+def _append_waiter(waiters, entry, is_done=_is_done, *,
+                   _PURGE_MIN=_PURGE_MIN):
+    """Add entry to the end of a list of waiters.
+
+    Finished waiters are only discarded once they reach the front, so purge
+    them whenever the list's length reaches a power of two, at amortized
+    O(1) cost.
+    """
+    waiters.append(entry)
+    n = len(waiters)
+    if n >= _PURGE_MIN and not n & (n - 1):
+        live = [w for w in waiters if not is_done(w)]
+        waiters.clear()
+        waiters.extend(live)
+
+
+def _get_deadline(loop, timeout, deadline):
+    """Get the earlier of a relative timeout and an absolute deadline.
+
+    Return None if neither is given.
+    """
+    if timeout is not None:
+        at = loop.time() + timeout
+        if deadline is None or at < deadline:
+            return at
+    return deadline
+
+
+def _expire(fut):
+    """Resolve fut with _TIMEOUT, unless it is already resolved."""
+    if not fut.done():
+        fut.set_result(_TIMEOUT)
+
+
+async def _wait(fut, loop, deadline, *, _expire=_expire):
+    """Wait for fut to resolve.
+
+    Return fut's result, or _TIMEOUT if the deadline passes first.
+    """
+    if deadline is None:
+        return await fut
+
+    # A single timer resolves the future in place, so the waiter is
+    # discarded like any other finished waiter.
+    handle = loop.call_at(deadline, _expire, fut)
+    try:
+        return await fut
+    finally:
+        handle.cancel()
+
+
+def _wake(waiters, n):
+    """Wake up to n of the oldest waiters that are still waiting."""
+    while n and waiters:
+        fut = waiters.popleft()
+        if not fut.done():
+            fut.set_result(True)
+            n -= 1
+
+
+class _BatchIterator:
+    """Asynchronous iterator of lists of items, see Channel.batches()."""
+
+    def __init__(self, take_batch, max_items, max_delay):
+        self._take_batch = take_batch
+        self._max_items = max_items
+        self._max_delay = max_delay
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        xs = await self._take_batch(self._max_items, self._max_delay)
+        if not xs:
+            raise StopAsyncIteration
+        return xs
 
 
 class Channel(ReprMixin):
@@ -11,78 +124,139 @@ class Channel(ReprMixin):
 
     Similary to asyncio.Queue, but adds asynchronous iteration support and
     the ability to "close" a channel, thus preventing adding more items.
+
+    If the queue has zero capacity then the channel is unbuffered, i.e. a
+    rendezvous: items pass directly from put() to a consumer.
     """
 
-    def __init__(self, queue, *, _Event=Event):
+    def __init__(self, queue, *, _Event=Event, _deque=deque,
+                 _partial=partial):
         self.empty = queue.empty
         self.full = queue.full
-        self._get = queue.get
         self._get_nowait = queue.get_nowait
-        self._put = queue.put
         self._put_nowait = queue.put_nowait
         self._size = queue.qsize
         self._maxsize = queue.maxsize
 
+        try:
+            self._get_many_nowait = queue.get_many_nowait
+            self._put_many_nowait = queue.put_many_nowait
+        except AttributeError:
+            self._get_many_nowait = _partial(
+                _get_many_nowait, queue.get_nowait, queue.qsize)
+            self._put_many_nowait = _partial(
+                _put_many_nowait, queue.put_nowait)
+
         closed = _Event()
         self.closed = closed.wait
-        self.close = closed.set
         self.is_closed = closed.is_set
+        self._set_closed = closed.set
+
+        # Blocked put() and take() calls, in arrival order.  A putter is a
+        # (future, item) pair, a taker is a future that will receive the
+        # item directly.  Putters only wait while the buffer is full and
+        # takers only wait while it is empty, so an item is always handed
+        # over to the oldest waiter.  Abandoned (done) futures are skipped
+        # when they reach the front.
+        self._putters = _deque()
+        self._takers = _deque()
+
+        # Blocked capacity() and item() calls.  They are woken in a batch,
+        # at most once per event loop iteration, by _notify().
+        self._capacity_waiters = _deque()
+        self._item_waiters = _deque()
+        self._notify_pending = False
+
+        # Waiters on the channel being closed, other than closed() calls.
+        self._close_waiters = _deque()
+
+        if queue.empty() and queue.full():
+            # Zero capacity, so items only exist as blocked put() calls and
+            # capacity only exists as blocked take() calls.
+            self.empty = self._no_putters
+            self.full = self._no_takers
+            self.poll = self._poll_putter
+            self.poll_many = self._poll_many_putters
+
+    def close(self):
+        """Close the channel.
+
+        Blocked put() calls fail and blocked take() calls return their
+        default value.
+        """
+        if self.is_closed():
+            return
 
-        self._capacity = _Event()
-        self._item = _Event()
-
-        self._update_state()
+        self._set_closed()
+        self._release_waiters()
 
-    async def capacity(self, *, timeout=None, _wait_first=wait_first):
+    async def capacity(self, *, timeout=None, deadline=None,
+                       _get_running_loop=get_running_loop):
         """Block until the channel has capacity or is closed.
 
         If timeout is an int or float then unblock after that time has
-        elapse.
+        elapse.  If deadline is given then unblock once the event loop's
+        time() reaches it.
 
         Returns True if the channel is open and has capacity, otherwise
         False.
         """
-        is_closed = self.is_closed
         full = self.full
-        capacity = self._capacity.wait
-        closed = self.closed
-
-        # The capacity Event will wake all blocked coroutines.  If the
-        # channel still has capacity when unblocked then return, otherwise
-        # block again.  If the caller doesn't utilize the capacity then
-        # the next unblocked coroutines will get a chance.
+        is_closed = self.is_closed
+        waiters = self._capacity_waiters
+        add_waiter = self._add_capacity_waiter
+        if full() and not is_closed():
+            loop = _get_running_loop()
+            deadline = _get_deadline(loop, timeout, deadline)
+
+        # Only one waiter is woken per free slot.  If the capacity is
+        # gone by the time it runs, e.g. another producer used it, then
+        # wait again.
         while full() and not is_closed():
-            done, _ = await _wait_first(capacity(), closed(),
-                                        timeout=timeout)
-            if not done:
+            fut = loop.create_future()
+            add_waiter(fut)
+            if await self._wait_ready(fut, loop, deadline) is _TIMEOUT:
                 return False
 
-        return not (full() or is_closed())
+        ready = not (full() or is_closed())
+        if ready and waiters:
+            # The caller may not use the capacity, so give the next waiter
+            # a chance once the caller has had its turn.
+            self._schedule_notify()
+        return ready
 
-    async def item(self, *, timeout=None, _wait_first=wait_first):
+    async def item(self, *, timeout=None, deadline=None,
+                   _get_running_loop=get_running_loop):
         """Block until the channel has an item or is closed.
 
         If timeout is an int or float then unblock after that time has
-        elapse.
+        elapse.  If deadline is given then unblock once the event loop's
+        time() reaches it.
 
         Returns True if the channel has an item, otherwise False.
         """
         empty = self.empty
         is_closed = self.is_closed
-        item = self._item.wait
-        closed = self.closed
-
-        # The item Event will wake all blocked coroutines.  If the
-        # channel still has an item when unblocked then return, otherwise
-        # block again.  If the caller doesn't take the item then
-        # the next unblocked coroutines will get a chance.
+        waiters = self._item_waiters
+        add_waiter = self._add_item_waiter
+        if empty() and not is_closed():
+            loop = _get_running_loop()
+            deadline = _get_deadline(loop, timeout, deadline)
+
+        # Only one waiter is woken per added item.  If the item is gone by
+        # the time it runs, e.g. another consumer took it, then wait again.
         while empty() and not is_closed():
-            done, _ = await _wait_first(item(), closed(),
-                                        timeout=timeout)
-            if not done:
+            fut = loop.create_future()
+            add_waiter(fut)
+            if await self._wait_ready(fut, loop, deadline) is _TIMEOUT:
                 return False
 
-        return not empty()
+        ready = not empty()
+        if ready and waiters:
+            # The caller may not take the item, so give the next waiter
+            # a chance once the caller has had its turn.
+            self._schedule_notify()
+        return ready
 
     def offer(self, x):
         """Synchronously add x to the channel.
@@ -94,13 +268,23 @@ class Channel(ReprMixin):
         if x is None:
             raise ValueError('None is not allowed on channel')
 
-        if self.is_closed() or self.full():
+        if self.is_closed():
+            return False
+
+        if self._takers and self._hand_to_taker(x):
+            return True
+
+        if self.full():
             return False
 
         self._put_nowait(x)
-        self._update_state()
+        if self._item_waiters:
+            self._notify_item()
         return True
 
+    # A private copy, so that put() is unaffected by a subclass's offer().
+    __offer = offer
+
     def poll(self, *, default=None):
         """Synchronously get an item from the channel.
 
@@ -110,42 +294,492 @@ class Channel(ReprMixin):
             return default
 
         x = self._get_nowait()
-        self._update_state()
+        if not (self._putters and self._admit_putter()):
+            if self._capacity_waiters:
+                self._notify_capacity()
         return x
 
-    async def put(self, x, *, timeout=None):
+    def offer_many(self, xs, *, _islice=islice, _any=any, _map=map,
+                   _is_none=_is_none):
+        """Synchronously add as many items from iterable xs as will fit.
+
+        Items are taken from xs in order, and no more are taken from it
+        once the channel is full.
+
+        Return the number of items added to the channel.
+
+        Raises ValueError if an item is None, after adding the items
+        preceding it.
+        """
+        if self.is_closed():
+            return 0
+
+        it = iter(xs)
+        n = self._hand_many_to_takers(it) if self._takers else 0
+
+        full = self.full
+        size = self._size
+        maxsize = self._maxsize
+        put_many_nowait = self._put_many_nowait
+        buffered = 0
+        while not full():
+            # Buffers which never report full accept everything.
+            room = maxsize - size()
+            chunk = list(_islice(it, room if room > 0 else None))
+            if _any(_map(_is_none, chunk)):
+                del chunk[next(i for i, x in enumerate(chunk) if x is None):]
+                put_many_nowait(chunk)
+                if chunk and self._item_waiters:
+                    self._notify_item()
+                raise ValueError('None is not allowed on channel')
+
+            put_many_nowait(chunk)
+            buffered += len(chunk)
+            if room <= 0 or len(chunk) < room:
+                break
+
+        if buffered and self._item_waiters:
+            self._notify_item()
+        return n + buffered
+
+    def poll_many(self, max_n):
+        """Synchronously get up to max_n items from the channel.
+
+        Return a list of items, which is empty if none are available.
+        """
+        xs = []
+        empty = self.empty
+        get_many_nowait = self._get_many_nowait
+        putters = self._putters
+        admit_putter = self._admit_putter
+        while len(xs) < max_n and not empty():
+            got = get_many_nowait(max_n - len(xs))
+            xs += got
+            # Refill the freed slots from blocked put() calls.
+            if putters:
+                for _ in range(len(got)):
+                    if not admit_putter():
+                        break
+
+        if xs and self._capacity_waiters:
+            self._notify_capacity()
+        return xs
+
+    async def put(self, x, *, timeout=None, deadline=None):
         """Asynchronously add x to the channel.
 
-        Return True if x was added to the channel, False otherwise.
+        Return True if x was added to the channel, False otherwise, i.e.
+        the channel was closed, timeout elapsed, or the event loop's time()
+        reached deadline.
 
         Raises a ValueError if attempting to put None.
         """
-        return (self.offer(x)
-                or (await self.capacity(timeout=timeout)
-                    and self.offer(x)))
+        if self.__offer(x):
+            return True
+        if self.is_closed():
+            return False
+        return await self._block_put(x, timeout, deadline)
 
-    async def take(self, *, timeout=None, default=None):
+    async def take(self, *, timeout=None, deadline=None, default=None):
         """Asynchronously get an item from the channel.
 
         Return an item, if available, otherwise block until an item becomes
-        available.  Return default if timeout is given and has expired.
+        available.  Return default if the channel is closed, timeout is
+        given and has expired, or the event loop's time() reached deadline.
+        """
+        x = self.poll(default=_CLOSED)
+        if x is not _CLOSED:
+            return x
+        if self.is_closed():
+            return default
+        return await self._block_take(timeout, deadline, default)
+
+    async def put_many(self, xs, *, all=False, timeout=None, deadline=None,
+                       _get_running_loop=get_running_loop):
+        """Asynchronously add items from iterable xs to the channel.
+
+        Block until at least one item is added, or if all is True then
+        until every item is added.  Stop early if the channel is closed,
+        timeout elapses, or the event loop's time() reaches deadline.
+
+        Return the number of items added to the channel.
+
+        Raises ValueError if an item is None.
+        """
+        it = iter(xs)
+        n = self.offer_many(it)
+        if timeout is not None:
+            deadline = _get_deadline(_get_running_loop(), timeout, deadline)
+
+        while (all or not n) and not self.is_closed():
+            x = next(it, _END)
+            if x is _END:
+                break
+            if not await self.put(x, deadline=deadline):
+                break
+            n += 1 + self.offer_many(it)
+
+        return n
+
+    async def take_many(self, max_n, *, all=False, timeout=None,
+                        deadline=None, _get_running_loop=get_running_loop):
+        """Asynchronously get up to max_n items from the channel.
+
+        Block until at least one item is available, or if all is True then
+        until max_n items are taken.  Stop early if the channel is closed
+        and empty, timeout elapses, or the event loop's time() reaches
+        deadline.
+
+        Return a list of items.
         """
-        x = self.poll(default=default)
-        if x is default and await self.item(timeout=timeout):
-            x = self.poll(default=default)
+        xs = self.poll_many(max_n)
+        if timeout is not None:
+            deadline = _get_deadline(_get_running_loop(), timeout, deadline)
+
+        while len(xs) < max_n and (all or not xs):
+            x = await self.take(deadline=deadline, default=_CLOSED)
+            if x is _CLOSED:
+                break
+            xs.append(x)
+            xs += self.poll_many(max_n - len(xs))
+
+        return xs
+
+    def batches(self, max_items, *, max_delay=None,
+                _BatchIterator=_BatchIterator):
+        """Get an asynchronous iterator of lists of items.
+
+        Each list has at least one and at most max_items items.  If
+        max_delay is given then wait up to that many seconds after the
+        first item of a list for it to fill, otherwise only take the items
+        already available.
+
+        Once the channel is closed, a final partial list is returned, then
+        iteration is stopped.
+
+        Raises ValueError if max_items is less than 1, or max_delay is
+        negative.
+        """
+        if max_items < 1:
+            raise ValueError('max_items must be a positive integer')
+        if max_delay is not None and max_delay < 0:
+            raise ValueError('max_delay must not be negative')
+        return _BatchIterator(self._take_batch, max_items, max_delay)
+
+    async def _block_put(self, x, timeout, deadline, *,
+                         _get_running_loop=get_running_loop):
+        """Wait to add x to the channel, once put() finds it full."""
+        loop = _get_running_loop()
+        deadline = _get_deadline(loop, timeout, deadline)
+        if deadline is not None and deadline <= loop.time():
+            return False
+
+        fut = loop.create_future()
+        self._add_putter(fut, x)
+        result = await _wait(fut, loop, deadline)
+        return result is True
+
+    async def _block_take(self, timeout, deadline, default, *,
+                          _get_running_loop=get_running_loop,
+                          _CancelledError=CancelledError):
+        """Wait to get an item, once take() finds the channel empty."""
+        loop = _get_running_loop()
+        deadline = _get_deadline(loop, timeout, deadline)
+        if deadline is not None and deadline <= loop.time():
+            return default
+
+        fut = loop.create_future()
+        self._add_taker(fut)
+        try:
+            x = await _wait(fut, loop, deadline)
+        except _CancelledError:
+            if fut.done() and not fut.cancelled():
+                x = fut.result()
+                if x is not _CLOSED:
+                    # The item was handed over as the caller was cancelled,
+                    # return it to the channel rather than losing it.
+                    self._requeue(x)
+            raise
+
+        if x is _CLOSED or x is _TIMEOUT:
+            return default
         return x
 
-    def _update_state(self):
-        """Update waitable state flags."""
-        if self.full():
-            self._capacity.clear()
-        else:
-            self._capacity.set()
+    async def _take_batch(self, max_n, max_delay, *,
+                          _get_running_loop=get_running_loop,
+                          _CancelledError=CancelledError):
+        """Take up to max_n items, for batches().
 
-        if self.empty():
-            self._item.clear()
+        Wait for a first item, then up to max_delay seconds for more.
+        Return a list of items, which is empty once the channel is closed
+        and empty.
+        """
+        xs = self.poll_many(max_n)
+        if not xs:
+            x = await self.take(default=_CLOSED)
+            if x is _CLOSED:
+                return xs
+            xs.append(x)
+            xs += self.poll_many(max_n - 1)
+        if len(xs) >= max_n or not max_delay or self.is_closed():
+            return xs
+
+        # A single timer for the batch resolves whichever wait is current.
+        loop = _get_running_loop()
+        fut = None
+        expired = False
+
+        def expire():
+            nonlocal expired
+            expired = True
+            _expire(fut)
+
+        handle = loop.call_later(max_delay, expire)
+        try:
+            while len(xs) < max_n and not expired:
+                if self.is_closed():
+                    # No more items will be added, so flush the batch.
+                    break
+                fut = loop.create_future()
+                self._add_taker(fut)
+                try:
+                    x = await fut
+                except _CancelledError:
+                    if fut.done() and not fut.cancelled():
+                        x = fut.result()
+                        if x is not _CLOSED and x is not _TIMEOUT:
+                            self._requeue(x)
+                    raise
+                if x is _CLOSED or x is _TIMEOUT:
+                    break
+                xs.append(x)
+                xs += self.poll_many(max_n - len(xs))
+        finally:
+            handle.cancel()
+        return xs
+
+    def _add_putter(self, fut, x, *, _append_waiter=_append_waiter):
+        """Register fut to be resolved with True once x is admitted.
+
+        fut need only have the done() and set_result() methods of a future.
+        """
+        _append_waiter(self._putters, (fut, x), _is_put_done)
+        if self._item_waiters:
+            # Only possible for an unbuffered channel.
+            self._notify_item()
+
+    def _add_taker(self, fut, *, _append_waiter=_append_waiter):
+        """Register fut to be resolved with the next item.
+
+        fut need only have the done() and set_result() methods of a future.
+        """
+        _append_waiter(self._takers, fut)
+        if self._capacity_waiters:
+            # Only possible for an unbuffered channel.
+            self._notify_capacity()
+
+    def _add_capacity_waiter(self, fut, *, _append_waiter=_append_waiter):
+        """Register fut to be woken once the channel may have capacity.
+
+        fut need only have the done() and set_result() methods of a future.
+        """
+        _append_waiter(self._capacity_waiters, fut)
+
+    def _add_item_waiter(self, fut, *, _append_waiter=_append_waiter):
+        """Register fut to be woken once the channel may have an item.
+
+        fut need only have the done() and set_result() methods of a future.
+        """
+        _append_waiter(self._item_waiters, fut)
+
+    def _add_close_waiter(self, fut, *, _append_waiter=_append_waiter):
+        """Register fut to be woken once the channel is closed.
+
+        fut need only have the done() and set_result() methods of a future.
+        """
+        _append_waiter(self._close_waiters, fut)
+
+    def _release_waiters(self):
+        """Resolve every blocked call, once the channel is closed."""
+        putters = self._putters
+        for fut, _ in putters:
+            if not fut.done():
+                fut.set_result(False)
+        putters.clear()
+
+        takers = self._takers
+        for fut in takers:
+            if not fut.done():
+                fut.set_result(_CLOSED)
+        takers.clear()
+
+        for waiters in (self._capacity_waiters, self._item_waiters,
+                        self._close_waiters):
+            for fut in waiters:
+                if not fut.done():
+                    fut.set_result(False)
+            waiters.clear()
+
+    def _hand_many_to_takers(self, it):
+        """Give items from iterator it directly to blocked take() calls.
+
+        Return the number of items taken.
+        """
+        takers = self._takers
+        n = 0
+        while takers:
+            fut = takers[0]
+            if fut.done():
+                takers.popleft()
+                continue
+
+            x = next(it, _END)
+            if x is _END:
+                break
+            if x is None:
+                raise ValueError('None is not allowed on channel')
+            takers.popleft()
+            fut.set_result(x)
+            n += 1
+        return n
+
+    def _hand_to_taker(self, x):
+        """Give x directly to the oldest blocked take() call.
+
+        Return True if x was taken, False otherwise.
+        """
+        takers = self._takers
+        while takers:
+            fut = takers.popleft()
+            if not fut.done():
+                fut.set_result(x)
+                return True
+        return False
+
+    def _admit_putter(self):
+        """Move the oldest blocked put() call's item into the buffer.
+
+        Return True if an item was moved, False otherwise.
+        """
+        putters = self._putters
+        while putters:
+            fut, x = putters.popleft()
+            if not fut.done():
+                self._put_nowait(x)
+                fut.set_result(True)
+                return True
+        return False
+
+    def _no_putters(self):
+        """Return True if no put() call is blocked, False otherwise."""
+        putters = self._putters
+        while putters and putters[0][0].done():
+            putters.popleft()
+        return not putters
+
+    def _no_takers(self):
+        """Return True if no take() call is blocked, False otherwise."""
+        takers = self._takers
+        while takers and takers[0].done():
+            takers.popleft()
+        return not takers
+
+    def _poll_putter(self, *, default=None):
+        """Synchronously take the item of the oldest blocked put() call.
+
+        Return the item, if available, or default.
+        """
+        putters = self._putters
+        while putters:
+            fut, x = putters.popleft()
+            if not fut.done():
+                fut.set_result(True)
+                return x
+        return default
+
+    def _poll_many_putters(self, max_n):
+        """Synchronously take the items of up to max_n blocked put() calls.
+
+        Return a list of items.
+        """
+        xs = []
+        poll = self._poll_putter
+        while len(xs) < max_n:
+            x = poll()
+            if x is None:
+                break
+            xs.append(x)
+        return xs
+
+    def _requeue(self, x, *, _get_running_loop=get_running_loop):
+        """Return an item, handed to a cancelled taker, to the channel."""
+        if self._hand_to_taker(x):
+            return
+        if not self.full():
+            self._put_nowait(x)
+            if self._item_waiters:
+                self._notify_item()
         else:
-            self._item.set()
+            # Queue it ahead of any blocked put() call.
+            fut = _get_running_loop().create_future()
+            self._putters.appendleft((fut, x))
+
+    async def _wait_ready(self, fut, loop, deadline,
+                          _CancelledError=CancelledError):
+        """Wait for a capacity() or item() wakeup."""
+        try:
+            return await _wait(fut, loop, deadline)
+        except _CancelledError:
+            if fut.done() and not fut.cancelled():
+                # Woken as the caller was cancelled, so wake another
+                # waiter instead.
+                self._schedule_notify()
+            raise
+
+    def _notify_item(self, *, _wake=_wake):
+        """Wake item() waiters after items were added.
+
+        The first change in an event loop iteration wakes one waiter
+        immediately, any further waiters are left to a single _notify().
+        """
+        if not self._notify_pending:
+            _wake(self._item_waiters, 1)
+            if self._item_waiters:
+                self._schedule_notify()
+
+    def _notify_capacity(self, *, _wake=_wake):
+        """Wake capacity() waiters after capacity was freed.
+
+        The first change in an event loop iteration wakes one waiter
+        immediately, any further waiters are left to a single _notify().
+        """
+        if not self._notify_pending:
+            _wake(self._capacity_waiters, 1)
+            if self._capacity_waiters:
+                self._schedule_notify()
+
+    def _schedule_notify(self, *, _get_running_loop=get_running_loop):
+        """Arrange for _notify() to run, unless it already will."""
+        if not self._notify_pending:
+            self._notify_pending = True
+            _get_running_loop().call_soon(self._notify)
+
+    def _notify(self, *, _wake=_wake):
+        """Wake as many capacity() and item() waiters as may proceed.
+
+        Any number of state changes during an event loop iteration result
+        in a single batch of wakeups.
+        """
+        self._notify_pending = False
+
+        if self._item_waiters and not self.empty():
+            # An unbuffered channel has no size, items are handed over one
+            # at a time.
+            _wake(self._item_waiters, self._size() or 1)
+
+        if self._capacity_waiters and not (self.full() or self.is_closed()):
+            room = self._maxsize - self._size()
+            _wake(self._capacity_waiters, room if room > 0 else 1)
 
     def __aiter__(self):
         """Return an asynchronous iterator."""
@@ -1,9 +1,8 @@
 __all__ = ('complete_one',)
 
-from asyncio import create_task
+from asyncio import CancelledError, get_running_loop
 
-from ._channel import Channel
-from ._util import wait_first
+from ._channel import _CLOSED, Channel
 
 
 def _exec_first_ready(ch_ops, channel=Channel):
@@ -21,71 +20,61 @@ def _exec_first_ready(ch_ops, channel=Channel):
                 return True, ch
 
 
-def _get_tasks_waiting_for_ready(
-        ch_ops,
-        channel=Channel,
-        create_task=create_task):
-    """Get tasks which wait for each ch_op to be ready."""
-    tasks = []
-    for ch_op in ch_ops:
-        if isinstance(ch_op, Channel):
-            tasks.append(create_task(ch_op.item()))
-        else:
-            ch, _ = ch_op
-            tasks.append(create_task(ch.capacity()))
-    return tasks
+class _Select:
+    """A blocked complete_one() call, shared by its operations."""
+
+    __slots__ = ('fut', 'pending')
 
+    def __init__(self, fut):
+        self.fut = fut
+        self.pending = 0
 
-def _exec_first_ready_in_order(
-        ready_tasks,
-        ordered_tasks,
-        ch_ops,
-        _exec_first_ready=_exec_first_ready):
-    """Execute the first ready task from ordered_task.
 
-    Returns a tuple of (execution_output, retry_ch_opts), one element will be
-    None.
+class _Take:
+    """A complete_one() read, registered as a channel's blocked taker.
+
+    It stands in for a future: the first operation to be resolved resolves
+    the shared future, so the rest are done, and their channels discard them
+    like any other finished waiter.
     """
-    next_ch_opts = []
-    for i, task in enumerate(ordered_tasks):
-        if task in ready_tasks:
-            ready = ch_ops[i]
-            out = _exec_first_ready((ready,))
-            if out:
-                return out, None
-        else:
-            next_ch_opts.append(ch_ops[i])
-    return None, next_ch_opts
 
+    __slots__ = ('_select', '_ch')
 
-def _exec_first_available_ready(
-        ready_tasks,
-        all_tasks,
-        ch_ops,
-        _exec_first_ready=_exec_first_ready):
-    """Execute the first ready task.
+    # Result given to the operation when its channel is closed.
+    _failed = _CLOSED
 
-    Returns a tuple of (execution_output, retry_ch_opts), one element will be
-    None.
-    """
-    duds = []
-    for task in ready_tasks:
-        index = all_tasks.index(task)
-        ready = ch_ops[index]
-        out = _exec_first_ready((ready,))
-        if out:
-            return out, None
-        duds.append(ch_ops[index])
-    return None, list(frozenset(ch_ops).difference(duds))
+    def __init__(self, select, ch):
+        self._select = select
+        self._ch = ch
+
+    def done(self):
+        return self._select.fut.done()
+
+    def set_result(self, x):
+        select = self._select
+        if x is not self._failed:
+            select.fut.set_result((x, self._ch, self))
+            return
+        # The channel closed, leave the other operations waiting.
+        select.pending -= 1
+        if not select.pending:
+            select.fut.set_result((None, None, None))
+
+
+class _Put(_Take):
+    """A complete_one() write, registered as a channel's blocked putter."""
+
+    __slots__ = ()
+
+    _failed = False
 
 
 async def complete_one(
         *ch_ops, priority=False,
         _exec_first_ready=_exec_first_ready,
-        _exec_first_ready_in_order=_exec_first_ready_in_order,
-        _exec_first_available_ready=_exec_first_available_ready,
-        _get_tasks_waiting_for_ready=_get_tasks_waiting_for_ready,
-        _wait_first=wait_first,
+        _channel=Channel,
+        _get_running_loop=get_running_loop,
+        _CancelledError=CancelledError,
         **kwargs):
     """Complete at most one channel operation.
 
@@ -101,6 +90,9 @@ async def complete_one(
     If keyword argument "priority" is True then the first ch_op ready from the
     ordered list of arguments will be run.  Otherwise, if more than one ch_op
     is ready the selection will be non-deterministic.
+
+    Returns (None, None) if every channel is closed before an operation
+    completes.
     """
     out = _exec_first_ready(ch_ops)
     if out:
@@ -108,18 +100,33 @@ async def complete_one(
     elif 'default' in kwargs:
         return kwargs['default'], 'default'
 
-    ch_ops = list(ch_ops)
-    while ch_ops:
-        # Get this round's list of ready operations.
-        tasks = _get_tasks_waiting_for_ready(ch_ops)
-        done, _ = await _wait_first(*tasks)
-
-        exec_ = _exec_first_available_ready
-        if priority and len(done) > 1:
-            exec_ = _exec_first_ready_in_order
-
-        out, ch_ops = exec_(done, tasks, ch_ops)
-        if out:
-            return out
-
-    return None, None
+    # Nothing is ready, so wait on every channel at once.  Each operation
+    # joins its channel's blocked takers or putters, and the first to be
+    # resolved completes the call.
+    select = _Select(_get_running_loop().create_future())
+    for ch_op in ch_ops:
+        if isinstance(ch_op, _channel):
+            ch = ch_op
+            if not ch.is_closed():
+                ch._add_taker(_Take(select, ch))
+                select.pending += 1
+        else:
+            ch, x = ch_op
+            if not ch.is_closed():
+                ch._add_putter(_Put(select, ch), x)
+                select.pending += 1
+    if not select.pending:
+        return None, None
+
+    fut = select.fut
+    try:
+        x, ch, op = await fut
+    except _CancelledError:
+        if fut.done() and not fut.cancelled():
+            x, ch, op = fut.result()
+            if type(op) is _Take:
+                # The item was handed over as the caller was cancelled,
+                # return it to the channel rather than losing it.
+                ch._requeue(x)
+        raise
+    return x, ch
@@ -2,17 +2,36 @@ __all__ = ('create_channel',)
 
 from ._buffer import create_blocking_buffer
 from ._channel import Channel
+from ._instrumented_channel import InstrumentedChannel
+from ._transform_channel import InstrumentedTransformChannel, TransformChannel
 
 
-def create_channel(n_or_buffer=1):
+def create_channel(n_or_buffer=1, *, stats=False, xform=None,
+                   _Channel=Channel):
     """Create a new channel.
 
-    As a conveinence, if n_or_buffer is a positive integer then creates a
-    blocking buffer for the new channel.
+    As a conveinence, if n_or_buffer is a non-negative integer then creates
+    a blocking buffer for the new channel.  If it is zero then the channel
+    is unbuffered: a put completes only once a consumer takes the item.
+
+    If stats is True then the channel keeps statistics about its use,
+    available from its stats() method.
+
+    If xform is given then items are transformed as they are added, see
+    TransformChannel.  It is called with a list of items, and returns a
+    list of the items to add in their place.
     """
     buf = n_or_buffer
     if isinstance(n_or_buffer, int):
         buf = create_blocking_buffer(n_or_buffer)
-    elif buf.maxsize < 1:
+    elif buf.maxsize < 1 and not (buf.maxsize == 0 and buf.full()):
+        # A zero capacity buffer is always full, whereas e.g. an
+        # asyncio.Queue with maxsize 0 is unbounded.
         raise ValueError('buffer maxsize must be a positive integer')
-    return Channel(buf)
+    if xform is not None:
+        if stats:
+            return InstrumentedTransformChannel(buf, xform)
+        return TransformChannel(buf, xform)
+    if stats:
+        _Channel = InstrumentedChannel
+    return _Channel(buf)
@@ -31,16 +31,16 @@ async def _mix(out, mix, restart, notify, *,
         restart.clear()
 
         # Wait for one of the following conditions:
-        await _wait_first(
-            # 1. restart flag is set.
-            restart.wait(),
-            # 2. out channel is closed.
-            out.closed(),
-            # 3. out channel has capacity and at least one mix channel
-            #    has an item.
-            _wait_all(
+        # 1. restart flag is set.
+        # 2. out channel is closed.
+        # 3. out channel has capacity and at least one mix channel
+        #    has an item.
+        conditions = [restart.wait(), out.closed()]
+        if mix:
+            conditions.append(_wait_all(
                 out.capacity(),
                 _wait_first(*(ch.item() for ch in mix))))
+        await _wait_first(*conditions)
 
         if out.is_closed():
             break  # End transfer task.
@@ -75,13 +75,13 @@ async def _drain(out, mute, restart, *,
         restart.clear()
 
         # Wait for one of the following conditions:
-        await _wait_first(
-            # 1. restart flag is set.
-            restart.wait(),
-            # 2. out channel is closed.
-            out.closed(),
-            # 3. At least one mute channel has an item.
-            _wait_first(*(ch.item() for ch in mute)))
+        # 1. restart flag is set.
+        # 2. out channel is closed.
+        # 3. At least one mute channel has an item.
+        conditions = [restart.wait(), out.closed()]
+        if mute:
+            conditions.append(_wait_first(*(ch.item() for ch in mute)))
+        await _wait_first(*conditions)
 
         if out.is_closed():
             break  # End drain task.
@@ -0,0 +1,144 @@
+__all__ = ('create_pipeline',)
+
+from asyncio import create_task
+
+from ._create_channel import create_channel
+from ._mixin import ReprMixin
+
+
+def _map_stage(fn, xs):
+    return [fn(x) for x in xs]
+
+
+def _filter_stage(fn, xs):
+    return [x for x in xs if fn(x)]
+
+
+def _flat_map_stage(fn, xs):
+    return [y for x in xs for y in fn(x)]
+
+
+def _apply(stages, xs):
+    """Run a batch of items through every stage."""
+    for stage, fn in stages:
+        xs = stage(fn, xs)
+        if not xs:
+            break
+    return xs
+
+
+async def _run_onto(src, stages, dest, close, max_batch, *, _apply=_apply):
+    """Transfer items from src to dest, through the stages."""
+    while True:
+        # As pipe(), only take items while dest has capacity for them.
+        if src.empty() and not await src.item():
+            break
+        if dest.full() and not await dest.capacity():
+            break
+        if dest.is_closed():
+            break
+
+        xs = _apply(stages, src.poll_many(max_batch))
+        if xs and await dest.put_many(xs, all=True) < len(xs):
+            break
+
+    if close and src.is_closed():
+        dest.close()
+
+
+async def _run_split(src, stages, predicate, true_out, false_out, max_batch,
+                     *, _apply=_apply):
+    """Sort items from src by predicate, through the stages."""
+    async for xs in src.batches(max_batch):
+        trues = []
+        falses = []
+        for x in _apply(stages, xs):
+            if predicate(x):
+                trues.append(x)
+            else:
+                falses.append(x)
+        await true_out.put_many(trues, all=True)
+        await false_out.put_many(falses, all=True)
+
+    true_out.close()
+    false_out.close()
+
+
+class Pipeline(ReprMixin):
+    """A chain of stateless stages over the items of a channel.
+
+    map(), filter() and flat_map() return a new pipeline with a stage
+    added.  Stages are fused: a terminal method, onto(), channel() or
+    split(), starts a single task which takes items from ch in batches of
+    up to max_batch, and runs each batch through every stage in turn, with
+    no channel between stages.
+
+    Each terminal call starts its own task taking from ch.
+    """
+
+    def __init__(self, ch, *, max_batch=64, _stages=()):
+        if max_batch < 1:
+            raise ValueError('max_batch must be a positive integer')
+
+        self._ch = ch
+        self._max_batch = max_batch
+        self._stages = _stages
+
+    def __len__(self):
+        return len(self._stages)
+
+    def map(self, fn, *, _map_stage=_map_stage):
+        """Add a stage which replaces each item with fn(item)."""
+        return self._add(_map_stage, fn)
+
+    def filter(self, fn, *, _filter_stage=_filter_stage):
+        """Add a stage which drops items for which fn(item) is false."""
+        return self._add(_filter_stage, fn)
+
+    def flat_map(self, fn, *, _flat_map_stage=_flat_map_stage):
+        """Add a stage which replaces each item with those of fn(item)."""
+        return self._add(_flat_map_stage, fn)
+
+    def onto(self, ch, *, close=True,
+             _create_task=create_task, _run_onto=_run_onto):
+        """Put the items out of the last stage on ch.
+
+        As pipe(), items are only taken while ch has capacity.  When the
+        input channel is closed, and "close" is True, then ch will be
+        closed.
+        """
+        _create_task(_run_onto(self._ch, self._stages, ch, close,
+                               self._max_batch))
+
+    def channel(self, n_or_buffer=1, *, _create_channel=create_channel):
+        """Get a new channel of the items out of the last stage.
+
+        The channel is created with n_or_buffer, and will be closed when
+        the input channel is closed.
+        """
+        out = _create_channel(n_or_buffer)
+        self.onto(out)
+        return out
+
+    def split(self, predicate, true_n_or_buffer=1, false_n_or_buffer=1, *,
+              _create_channel=create_channel, _create_task=create_task,
+              _run_split=_run_split):
+        """Sort the items out of the last stage using predicate.
+
+        Returns a tuple of two channels, as split().
+        """
+        true_out = _create_channel(true_n_or_buffer)
+        false_out = _create_channel(false_n_or_buffer)
+        _create_task(_run_split(self._ch, self._stages, predicate, true_out,
+                                false_out, self._max_batch))
+        return true_out, false_out
+
+    def _add(self, stage, fn):
+        return type(self)(self._ch, max_batch=self._max_batch,
+                          _stages=self._stages + ((stage, fn),))
+
+    def _format(self):
+        return f'stages={len(self._stages)}'
+
+
+create_pipeline = Pipeline
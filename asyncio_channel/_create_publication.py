@@ -1,10 +1,12 @@
 __all__ = ('create_publication',)
 
 from asyncio import create_task
+from functools import partial
 
 from ._create_channel import create_channel
 from ._create_multiple import create_multiple
 from ._mixin import ReprMixin
+from ._offload import _call_each, _submit, run_ordered
 
 
 async def _start(src, get_topic, topics, notify):
@@ -19,20 +21,50 @@ async def _start(src, get_topic, topics, notify):
     notify()
 
 
+async def _start_chunks(src, get_topic, topics, notify, executor, chunksize,
+                        concurrency, *, _run=run_ordered):
+    """Takes chunks of items and put on topic channels, in executor."""
+    async def emit(xs, xs_topics):
+        for x, topic in zip(xs, xs_topics):
+            out = topics.get(topic)
+
+            if out is not None:
+                await out.put(x)
+
+    start = partial(_submit, executor, _call_each, get_topic)
+    await _run(start, src.batches(chunksize), emit, concurrency)
+    notify()
+
+
 class Publication(ReprMixin):
     """Get a publication of the src channel.
 
     Items will be assigned a topic by the supplied topic_fn and then
     distributed to all channels subscribed to that topic.  If a topic
     has no subscribed channels then the item is dropped.
+
+    If executor is given then topic_fn is run in it on chunks of up to
+    chunksize items, with up to concurrency chunks in flight.  Items are
+    still distributed in order.
+
+    Raises ValueError if chunksize or concurrency is less than 1.
     """
 
-    def __init__(self, src, topic_fn, *, n_or_buffer=1,
-                 _create_task=create_task):
+    def __init__(self, src, topic_fn, *, n_or_buffer=1, executor=None,
+                 chunksize=64, concurrency=1, _create_task=create_task):
+        if chunksize < 1:
+            raise ValueError('chunksize must be a positive integer')
+        if concurrency < 1:
+            raise ValueError('concurrency must be a positive integer')
+
         self._n_or_buffer = n_or_buffer
         self._mults = {}
         self._topics = topics = {}
-        _create_task(_start(src, topic_fn, topics, self._notify))
+        if executor is None:
+            _create_task(_start(src, topic_fn, topics, self._notify))
+        else:
+            _create_task(_start_chunks(src, topic_fn, topics, self._notify,
+                                       executor, chunksize, concurrency))
 
     def subscribe(self, topic, ch, *, close=True,
                   _create_channel=create_channel,
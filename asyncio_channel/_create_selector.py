@@ -0,0 +1,281 @@
+__all__ = ('create_selector',)
+
+from asyncio import get_running_loop
+from collections import deque
+from functools import partial
+from heapq import heappop, heappush
+from itertools import count
+
+from ._channel import _TIMEOUT, Channel, _get_deadline, _wait
+from ._mixin import ReprMixin
+from ._shield import ChannelDecoratorBase
+
+
+class _Op:
+    """An operation of a selector.
+
+    Stands in for a future among its channel's item() or capacity()
+    waiters.  Once woken it joins the selector's ready operations, and it
+    only watches the channel again once select() finds it is not ready.
+    """
+
+    __slots__ = ('_selector', 'ch', 'seq', 'watching', 'removed')
+
+    def __init__(self, selector, ch, seq):
+        self._selector = selector
+        self.ch = ch
+        self.seq = seq
+        self.watching = False
+        self.removed = False
+
+    def __lt__(self, other):
+        return self.seq < other.seq
+
+    def done(self):
+        return not self.watching
+
+    def set_result(self, _):
+        self.watching = False
+        self._selector._add_ready(self)
+
+
+class _Take(_Op):
+    __slots__ = ()
+
+    def complete(self):
+        """Take an item, return (item, channel) or None if not ready."""
+        ch = self.ch
+        x = ch.poll()
+        if x is not None:
+            return x, ch
+
+    def is_ready(self):
+        return not self.ch.empty()
+
+    def watch(self):
+        self.watching = True
+        self.ch._add_item_waiter(self)
+
+
+class _Put(_Op):
+    __slots__ = ('x',)
+
+    def __init__(self, selector, ch, seq, x):
+        super().__init__(selector, ch, seq)
+        self.x = x
+
+    def complete(self):
+        """Add the item, return (True, channel) or None if not ready."""
+        ch = self.ch
+        if ch.offer(self.x):
+            return True, ch
+
+    def is_ready(self):
+        ch = self.ch
+        return not (ch.full() or ch.is_closed())
+
+    def watch(self):
+        self.watching = True
+        self.ch._add_capacity_waiter(self)
+
+
+class Selector(ReprMixin):
+    """Repeatedly complete one of a set of channel operations.
+
+    Operations are given as to complete_one(), and stay registered with
+    their channels between select() calls.  So a select() call only checks
+    operations that became ready since the last, not every operation.
+
+    A selector has at most one take and one put operation on each channel.
+    A put operation adds the same item each time it completes, until it is
+    replaced or removed.  An operation is removed once its channel is
+    closed, and has no items for a take.
+
+    If priority is True then select() completes the first ready operation
+    in the order they were added.  Otherwise ready operations take turns.
+    """
+
+    def __init__(self, *ch_ops, priority=False,
+                 _count=count, _deque=deque):
+        self._ops = {}
+        self._seq = _count()
+        self._waiter = None
+        if priority:
+            self._ready = ready = []
+            self._pop_ready = partial(heappop, ready)
+            self._push_ready = partial(heappush, ready)
+        else:
+            self._ready = ready = _deque()
+            self._pop_ready = ready.popleft
+            self._push_ready = ready.append
+        for ch_op in ch_ops:
+            self.add(ch_op)
+
+    def __len__(self):
+        return len(self._ops)
+
+    def add(self, ch_op, *, _channel=(Channel, ChannelDecoratorBase)):
+        """Add a channel operation.
+
+        A put operation replaces any put operation on the same channel,
+        keeping its place in priority order.
+        """
+        ops = self._ops
+        if isinstance(ch_op, _channel):
+            key = ch_op, False
+            old = ops.get(key)
+            if old is not None:
+                return
+            op = _Take(self, ch_op, next(self._seq))
+        else:
+            ch, x = ch_op
+            key = ch, True
+            old = ops.get(key)
+            if old is not None:
+                self._discard(old)
+                op = _Put(self, ch, old.seq, x)
+            else:
+                op = _Put(self, ch, next(self._seq), x)
+        ops[key] = op
+        # Whether it is ready is checked by the next select().
+        self._add_ready(op)
+
+    def remove(self, ch_op, *,
+               _channel=(Channel, ChannelDecoratorBase)):
+        """Remove a channel operation.
+
+        Any put operation on the channel is removed, whatever its item.
+        """
+        if isinstance(ch_op, _channel):
+            key = ch_op, False
+        else:
+            key = ch_op[0], True
+        op = self._ops.pop(key, None)
+        if op is not None:
+            self._discard(op)
+
+    def remove_all(self):
+        """Remove every channel operation."""
+        for op in self._ops.values():
+            self._discard(op)
+        self._ops.clear()
+        self._ready.clear()
+
+    async def select(self, *, timeout=None, deadline=None,
+                     _get_running_loop=get_running_loop):
+        """Complete one channel operation, waiting until one is ready.
+
+        If timeout is an int or float then unblock after that time has
+        elapse.  If deadline is given then unblock once the event loop's
+        time() reaches it.
+
+        Returns a tuple (value, channel) as complete_one().  Returns
+        (None, None) if the time runs out, or if the selector has no
+        operations, e.g. once every channel is closed.
+        """
+        loop = None
+        while True:
+            out = self._complete_ready()
+            if out is not None:
+                return out
+            if not self._ops:
+                return None, None
+
+            if loop is None:
+                loop = _get_running_loop()
+                deadline = _get_deadline(loop, timeout, deadline)
+            if not await self._wait_ready(loop, deadline):
+                return None, None
+
+    async def _take_many(self, max_n, *,
+                         _get_running_loop=get_running_loop):
+        """Take up to max_n items from ready take operations.
+
+        Wait until at least one item is taken, return a list of items which
+        is only empty once the selector has no operations.  Operations are
+        assumed to all be takes.
+        """
+        xs = []
+        while True:
+            self._poll_ready(xs, max_n)
+            if xs or not self._ops:
+                return xs
+            await self._wait_ready(_get_running_loop(), None)
+
+    async def _wait_ready(self, loop, deadline):
+        """Wait until an operation may have become ready.
+
+        Return False if the deadline passes first, otherwise True.
+        """
+        if self._waiter is not None:
+            raise RuntimeError('select() is already waiting on this selector')
+        if deadline is not None and deadline <= loop.time():
+            return False
+
+        self._waiter = fut = loop.create_future()
+        try:
+            return await _wait(fut, loop, deadline) is not _TIMEOUT
+        finally:
+            self._waiter = None
+
+    def _complete_ready(self):
+        """Complete the next ready operation.
+
+        Return (value, channel), or None if no operation is ready.
+        """
+        pop = self._pop_ready
+        for _ in range(len(self._ready)):
+            op = pop()
+            if op.removed:
+                continue
+            out = op.complete()
+            if out is None:
+                self._unready(op)
+                continue
+            if op.is_ready():
+                self._push_ready(op)
+            else:
+                self._unready(op)
+            return out
+
+    def _poll_ready(self, xs, max_n):
+        """Add items from ready take operations to list xs, up to max_n."""
+        pop = self._pop_ready
+        for _ in range(len(self._ready)):
+            if len(xs) >= max_n:
+                break
+            op = pop()
+            if op.removed:
+                continue
+            xs += op.ch.poll_many(max_n - len(xs))
+            if op.is_ready():
+                # Stopped at max_n, the rest wait their turn.
+                self._push_ready(op)
+            else:
+                self._unready(op)
+
+    def _unready(self, op):
+        """Watch op's channel for it to be ready again, if it may be."""
+        if op.ch.is_closed():
+            del self._ops[op.ch, type(op) is _Put]
+            op.removed = True
+        else:
+            op.watch()
+
+    def _add_ready(self, op):
+        """Queue op to be checked by select()."""
+        self._push_ready(op)
+        waiter = self._waiter
+        if waiter is not None and not waiter.done():
+            waiter.set_result(True)
+
+    def _discard(self, op):
+        # Its channel drops it once it is done.
+        op.removed = True
+        op.watching = False
+
+    def _format(self):
+        return f'operations={len(self._ops)} ready={len(self._ready)}'
+
+
+create_selector = Selector
@@ -0,0 +1,456 @@
+__all__ = ('create_shared_channel',)
+
+from asyncio import Event, QueueEmpty, QueueFull, get_running_loop
+from ctypes import Structure, addressof, c_char, c_uint64, sizeof
+from multiprocessing import Pipe
+from os import read, set_blocking, write
+from pickle import HIGHEST_PROTOCOL, dumps, loads
+from struct import Struct
+from weakref import WeakSet
+
+try:
+    from multiprocessing.shared_memory import SharedMemory
+except ImportError:  # Python < 3.8
+    SharedMemory = None
+try:
+    from os import register_at_fork
+except ImportError:  # Windows
+    register_at_fork = None
+
+from ._channel import _END, Channel
+
+
+# Shared memory layout: a header, then the ring.  Each end only writes the
+# counters for the items it adds, or the items it removes, and they are
+# kept on separate cache lines.
+class _Header(Structure):
+    _fields_ = [
+        ('head', c_uint64),         # Total bytes written.
+        ('put', c_uint64),          # Total items written.
+        ('_pad0', c_uint64 * 6),
+        ('tail', c_uint64),         # Total bytes read.
+        ('got', c_uint64),          # Total items read.
+        ('_pad1', c_uint64 * 6),
+        ('closed', c_uint64),       # Non-zero once either end closes.
+        ('capacity', c_uint64),     # Size of the ring, in bytes.
+        ('max_item', c_uint64),     # Largest pickled item, in bytes.
+        ('_pad2', c_uint64 * 5),
+    ]
+
+
+_DATA = sizeof(_Header)
+
+
+def _map_header(shm, *, _Header=_Header):
+    """Get the header of a shared channel's memory."""
+    # Mapped by address, as an exported buffer would stop the memory being
+    # closed.  The caller must keep shm open while the header is used.
+    view = c_char.from_buffer(shm.buf)
+    address = addressof(view)
+    del view
+    return _Header.from_address(address)
+
+
+# A frame is a 4 byte length and a pickled item.  A frame never wraps
+# around the end of the ring, this length marks the rest of the ring as
+# unused.
+_U32 = Struct('I')
+_WRAP = 0xFFFFFFFF
+
+# Ends of shared channels created by this process, see _after_fork().
+_owned = WeakSet()
+
+
+class SharedBuffer:
+    """A ring of pickled items in shared memory.
+
+    There must be at most one process adding items, and one removing them.
+    Each only ever writes its own counters, after the frames they cover,
+    so no lock is needed.
+    """
+
+    __slots__ = ('maxsize', 'max_item_size', '_header', '_shm', '_buf')
+
+    def __init__(self, shm, *, _Header=_Header):
+        self._shm = shm
+        self._buf = shm.buf
+        header = self._header = _map_header(shm)
+        self.maxsize = header.capacity
+        self.max_item_size = header.max_item
+
+    @property
+    def name(self):
+        """The name of the shared memory block."""
+        return self._shm.name
+
+    def empty(self):
+        """Return True if the buffer has no items, False otherwise."""
+        header = self._header
+        return header.head == header.tail
+
+    def full(self):
+        """Return True if an item of max_item_size may not fit."""
+        header = self._header
+        size = self.maxsize
+        head = header.head
+        need = 4 + self.max_item_size
+        end = size - head % size
+        if end < need:
+            # The frame would be placed at the start of the ring.
+            need += end
+        return size - (head - header.tail) < need
+
+    def qsize(self):
+        """Return the number of items in the buffer."""
+        # The other end's counter may lag behind its frames.
+        header = self._header
+        return max(header.put - header.got, 0)
+
+    def nbytes(self):
+        """Return the number of bytes of the ring in use."""
+        header = self._header
+        return header.head - header.tail
+
+    def get_nowait(self, *, _QueueEmpty=QueueEmpty):
+        """Remove and return the oldest item.
+
+        Raises QueueEmpty if the buffer is empty.
+        """
+        xs = self.get_many_nowait(1)
+        if not xs:
+            raise _QueueEmpty
+        return xs[0]
+
+    def get_many_nowait(self, n, *, _loads=loads,
+                        _unpack_from=_U32.unpack_from):
+        """Remove and return up to n of the oldest items, as a list."""
+        header = self._header
+        buf = self._buf
+        size = self.maxsize
+        head = header.head
+        tail = header.tail
+        xs = []
+        while len(xs) < n and tail != head:
+            pos = tail % size
+            end = size - pos
+            if end < 4:
+                tail += end
+                continue
+            length, = _unpack_from(buf, _DATA + pos)
+            if length == _WRAP:
+                tail += end
+                continue
+            start = _DATA + pos + 4
+            xs.append(_loads(buf[start:start + length]))
+            tail += 4 + length
+
+        if xs:
+            header.tail = tail
+            header.got += len(xs)
+        return xs
+
+    def put_nowait(self, x, *, _dumps=dumps, _pack_into=_U32.pack_into,
+                   _QueueFull=QueueFull):
+        """Add x to the buffer.
+
+        Raises ValueError if x pickles to more than max_item_size bytes,
+        and QueueFull if the buffer is full.
+        """
+        frame = _dumps(x, HIGHEST_PROTOCOL)
+        length = len(frame)
+        if length > self.max_item_size:
+            raise ValueError(f'item is {length} bytes when pickled, the '
+                             f'maximum is {self.max_item_size}')
+        if self.full():
+            raise _QueueFull
+
+        header = self._header
+        buf = self._buf
+        size = self.maxsize
+        head = header.head
+        pos = head % size
+        end = size - pos
+        if end < 4 + length:
+            if end >= 4:
+                _pack_into(buf, _DATA + pos, _WRAP)
+            head += end
+            pos = 0
+
+        start = _DATA + pos + 4
+        _pack_into(buf, start - 4, length)
+        buf[start:start + length] = frame
+        header.head = head + 4 + length
+        header.put += 1
+
+    def set_closed(self):
+        """Mark the buffer closed, for both ends."""
+        self._header.closed = 1
+
+    def is_closed(self):
+        """Return True if either end closed the buffer, False otherwise."""
+        return self._header.closed != 0
+
+
+class SharedChannel(Channel):
+    """A channel between two processes, backed by shared memory.
+
+    The process that creates the channel holds one end, and the process it
+    is passed to, by pickling or by fork, holds the other.  One end puts
+    items and the other takes them.
+
+    Each end wakes the other by writing to a pipe, at most once per event
+    loop iteration.  An end registers its pipe with the event loop the
+    first time it waits.
+    """
+
+    def __init__(self, shm, inbox, outbox, peer=None, *,
+                 _SharedBuffer=SharedBuffer):
+        buf = _SharedBuffer(shm)
+        super().__init__(buf)
+        self._buffer = buf
+        self._put_nowait = self._put_and_signal
+        self._get_nowait = self._get_and_signal
+        self._get_many_nowait = self._get_many_and_signal
+
+        # Either end may close the channel, so is_closed() also checks the
+        # shared flag.  The local state catches up in _on_signal().
+        self._closed_locally = self.is_closed
+        self.is_closed = self._is_closed
+        self._wait_closed = self.closed
+        self.closed = self._closed
+
+        # Pipe connections are kept, rather than their file descriptors,
+        # so that they stay open and may be pickled.  The other end's
+        # connections are kept by the creating end until passed on.
+        self._inbox = inbox
+        self._outbox = outbox
+        self._peer = peer
+        for conn in (inbox, outbox):
+            set_blocking(conn.fileno(), False)
+        self._loop = None
+        self._signal_pending = False
+        if peer is not None:
+            _owned.add(self)
+
+    def __reduce__(self):
+        if self._peer is None:
+            raise TypeError('only the creating end of a shared channel may '
+                            'be passed to another process')
+        return (_attach, (self._buffer.name,) + self._peer)
+
+    def close(self):
+        """Close the channel, for both ends.
+
+        Blocked put() calls fail and blocked take() calls return their
+        default value.  Items already in the channel may still be taken.
+        """
+        if self._closed_locally():
+            return
+
+        self._buffer.set_closed()
+        self._signal()
+        self._set_closed()
+        self._release_waiters()
+
+    def offer_many(self, xs):
+        """Synchronously add as many items from iterable xs as will fit.
+
+        Items are taken from xs in order, and no more are taken from it
+        once the channel is full.
+
+        Return the number of items added to the channel.
+
+        Raises ValueError if an item is None, after adding the items
+        preceding it.
+        """
+        # Items vary in size, so whether the next one fits is only known
+        # once it is pickled.
+        n = 0
+        it = iter(xs)
+        offer = self.offer
+        while not self.full():
+            x = next(it, _END)
+            if x is _END or not offer(x):
+                break
+            n += 1
+        return n
+
+    def unlink(self):
+        """Free the shared memory.
+
+        Call from the creating process once neither end uses the channel.
+        """
+        self._buffer._shm.unlink()
+
+    async def _closed(self):
+        self._watch()
+        return await self._wait_closed()
+
+    def _is_closed(self):
+        return self._closed_locally() or self._buffer.is_closed()
+
+    def _admit_putter(self):
+        # Freeing an item's bytes does not always make room for another.
+        return not self.full() and super()._admit_putter()
+
+    def _put_and_signal(self, x):
+        self._buffer.put_nowait(x)
+        self._signal()
+
+    def _get_and_signal(self):
+        x = self._buffer.get_nowait()
+        self._signal()
+        return x
+
+    def _get_many_and_signal(self, n):
+        xs = self._buffer.get_many_nowait(n)
+        if xs:
+            self._signal()
+        return xs
+
+    def _signal(self, *, _get_running_loop=get_running_loop):
+        """Arrange for the other end to be woken, unless it already will."""
+        if self._signal_pending:
+            return
+        try:
+            loop = _get_running_loop()
+        except RuntimeError:
+            self._wake_peer()
+            return
+        self._signal_pending = True
+        loop.call_soon(self._wake_peer)
+
+    def _wake_peer(self, *, _write=write):
+        self._signal_pending = False
+        try:
+            _write(self._outbox.fileno(), b'\0')
+        except (BlockingIOError, BrokenPipeError):
+            # The pipe is full, so the other end will wake anyway, or the
+            # other end has gone.
+            pass
+
+    def _add_putter(self, fut, x):
+        self._watch()
+        super()._add_putter(fut, x)
+
+    def _add_taker(self, fut):
+        self._watch()
+        super()._add_taker(fut)
+
+    def _add_capacity_waiter(self, fut):
+        self._watch()
+        super()._add_capacity_waiter(fut)
+
+    def _add_item_waiter(self, fut):
+        self._watch()
+        super()._add_item_waiter(fut)
+
+    def _add_close_waiter(self, fut):
+        self._watch()
+        super()._add_close_waiter(fut)
+
+    def _watch(self, *, _get_running_loop=get_running_loop):
+        """Register the pipe with the running event loop, if not already."""
+        loop = _get_running_loop()
+        if self._loop is not loop:
+            loop.add_reader(self._inbox.fileno(), self._on_signal)
+            self._loop = loop
+
+    def _on_signal(self, *, _read=read):
+        """Catch up with the changes made by the other end."""
+        try:
+            if not _read(self._inbox.fileno(), 4096):
+                # Every process holding the other end has exited.
+                self._loop.remove_reader(self._inbox.fileno())
+                self._buffer.set_closed()
+        except BlockingIOError:
+            pass
+
+        empty = self.empty
+        while not (empty() or self._no_takers()):
+            self._hand_to_taker(self._get_nowait())
+        if self._item_waiters and not empty():
+            self._notify_item()
+
+        while self._putters and self._admit_putter():
+            pass
+        if self._capacity_waiters and not self.full():
+            self._notify_capacity()
+
+        if self._buffer.is_closed() and not self._closed_locally():
+            self._set_closed()
+            self._release_waiters()
+
+    def _after_fork(self, *, _Event=Event):
+        """Become the other end, in a forked child process."""
+        self._inbox, self._outbox = self._peer
+        self._peer = None
+        self._loop = None
+        self._signal_pending = False
+        self._notify_pending = False
+        for waiters in (self._putters, self._takers,
+                        self._capacity_waiters, self._item_waiters,
+                        self._close_waiters):
+            waiters.clear()
+
+        # The event may be bound to the parent's event loop.
+        closed = _Event()
+        if self._closed_locally():
+            closed.set()
+        self._wait_closed = closed.wait
+        self._closed_locally = closed.is_set
+        self._set_closed = closed.set
+
+    def _format(self):
+        buf = self._buffer
+        return ' '.join((
+            'closed' if self.is_closed() else 'open',
+            f'items={buf.qsize()}',
+            f'bytes={buf.nbytes()}/{buf.maxsize}'
+        ))
+
+
+def _attach(name, inbox, outbox, *, _SharedMemory=SharedMemory):
+    """Open the other end of a shared channel."""
+    return SharedChannel(_SharedMemory(name), inbox, outbox)
+
+
+def _after_fork():
+    for ch in list(_owned):
+        ch._after_fork()
+    _owned.clear()
+
+
+if register_at_fork is not None:
+    register_at_fork(after_in_child=_after_fork)
+
+
+def create_shared_channel(nbytes=65536, *, max_item_size=None,
+                          _Pipe=Pipe, _SharedMemory=SharedMemory):
+    """Create a new channel to another process.
+
+    Items are pickled into a ring of nbytes of shared memory.  No item may
+    pickle to more than max_item_size bytes, by default nbytes // 16.
+
+    Pass the channel to exactly one other process, e.g. as an argument of a
+    multiprocessing.Process.  Call its unlink() method once both ends are
+    done with it.
+    """
+    if _SharedMemory is None:
+        raise RuntimeError('shared channels require Python 3.8 or later')
+    if not isinstance(nbytes, int):
+        raise TypeError(f'nbytes must be an integer, not a {type(nbytes)}')
+    if max_item_size is None:
+        max_item_size = nbytes // 16
+    if not 0 < max_item_size <= nbytes // 2 - 4:
+        raise ValueError(f'max_item_size must be positive and at most half '
+                         f'of nbytes, not {max_item_size}')
+
+    shm = _SharedMemory(create=True, size=_DATA + nbytes)
+    header = _map_header(shm)
+    header.capacity = nbytes
+    header.max_item = max_item_size
+    # Each end reads its own pipe and writes to the other's.
+    inbox, peer_outbox = _Pipe(duplex=False)
+    peer_inbox, outbox = _Pipe(duplex=False)
+    return SharedChannel(shm, inbox, outbox, (peer_inbox, peer_outbox))
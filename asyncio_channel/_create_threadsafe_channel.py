@@ -0,0 +1,183 @@
+__all__ = ('create_threadsafe_channel',)
+
+from asyncio import get_running_loop, run_coroutine_threadsafe
+from collections import deque
+from itertools import islice
+from threading import Condition
+from time import monotonic
+
+from ._channel import Channel
+from ._create_channel import create_channel
+
+
+class ThreadSafeChannel(Channel):
+    """A channel which also accepts items from, and gives items to, threads.
+
+    Coroutines on the event loop use the regular channel methods.  Other
+    threads use put_blocking(), take_blocking() and close_threadsafe().
+
+    Items put by threads are staged and moved onto the channel by the event
+    loop in batches, so a burst of puts costs a single loop wakeup.  At
+    most max(n, 1) staged items may be waiting to enter the channel, after
+    which put_blocking() blocks.
+    """
+
+    def __init__(self, queue, *, _Condition=Condition, _deque=deque,
+                 _get_running_loop=get_running_loop):
+        super().__init__(queue)
+        self._loop = _get_running_loop()
+        self._cond = _Condition()
+        self._inbox = _deque()
+        # Items accepted from threads which have not entered the channel.
+        self._pending = 0
+        self._max_pending = max(queue.maxsize, 1)
+        self._drain_scheduled = False
+        self._closing = False
+
+    def put_blocking(self, x, *, timeout=None, _monotonic=monotonic):
+        """Add x to the channel from a thread.
+
+        Block while the channel is backed up.  Return True if x was
+        accepted, False if the channel is closed or timeout elapsed.
+
+        Raises ValueError if x is None, and RuntimeError if called from the
+        event loop's thread.
+        """
+        if x is None:
+            raise ValueError('None is not allowed on channel')
+        self._check_thread()
+
+        cond = self._cond
+        with cond:
+            if timeout is not None:
+                deadline = _monotonic() + timeout
+            while self._pending >= self._max_pending:
+                if self._closing or self.is_closed():
+                    return False
+                if timeout is None:
+                    cond.wait()
+                else:
+                    remaining = deadline - _monotonic()
+                    if remaining <= 0:
+                        return False
+                    cond.wait(remaining)
+
+            if self._closing or self.is_closed():
+                return False
+
+            self._pending += 1
+            self._inbox.append(x)
+            if not self._drain_scheduled:
+                self._drain_scheduled = True
+                self._loop.call_soon_threadsafe(self._drain)
+        return True
+
+    def take_blocking(self, *, timeout=None, default=None,
+                      _run_coroutine_threadsafe=run_coroutine_threadsafe):
+        """Get an item from the channel from a thread.
+
+        Block until an item is available.  Return default if the channel is
+        closed or timeout elapsed.
+
+        Raises RuntimeError if called from the event loop's thread.
+        """
+        self._check_thread()
+        coro = self.take(timeout=timeout, default=default)
+        return _run_coroutine_threadsafe(coro, self._loop).result()
+
+    def close_threadsafe(self):
+        """Close the channel from a thread.
+
+        Items already accepted by put_blocking() are moved onto the channel
+        before it is closed.
+        """
+        cond = self._cond
+        with cond:
+            if self._closing:
+                return
+            self._closing = True
+            cond.notify_all()
+        self._loop.call_soon_threadsafe(self._close_if_drained)
+
+    def close(self):
+        """Close the channel.
+
+        Blocked put() calls fail, blocked take() calls return their default
+        value, and items staged by threads are discarded.
+        """
+        super().close()
+        cond = self._cond
+        with cond:
+            self._inbox.clear()
+            self._pending = 0
+            cond.notify_all()
+
+    def _check_thread(self, *, _get_running_loop=get_running_loop):
+        """Raise RuntimeError if called on the event loop's thread."""
+        try:
+            loop = _get_running_loop()
+        except RuntimeError:
+            return
+        if loop is self._loop:
+            raise RuntimeError('blocking call from the event loop thread')
+
+    def _drain(self, *, _islice=islice):
+        """Move items staged by threads onto the channel."""
+        cond = self._cond
+        with cond:
+            self._drain_scheduled = False
+            xs = list(self._inbox)
+            self._inbox.clear()
+
+        if not xs or self.is_closed():
+            return
+
+        n = self.offer_many(xs)
+        if n < len(xs):
+            # The channel is full, so queue the rest as blocked puts.  They
+            # keep their order and enter the channel as capacity frees up.
+            create_future = self._loop.create_future
+            putters = self._putters
+            for x in _islice(xs, n, None):
+                fut = create_future()
+                fut.add_done_callback(self._admitted)
+                putters.append((fut, x))
+            if self._item_waiters:
+                # Only possible for an unbuffered channel.
+                self._notify_item()
+
+        if n:
+            self._release(n)
+
+    def _admitted(self, fut):
+        """Count a staged item queued as a blocked put as delivered."""
+        self._release(1)
+
+    def _release(self, n):
+        """Count n staged items as delivered."""
+        cond = self._cond
+        with cond:
+            if self.is_closed():
+                return
+            self._pending -= n
+            cond.notify(n)
+            close = self._closing and not self._pending
+        if close:
+            self.close()
+
+    def _close_if_drained(self):
+        """Close the channel if no staged items remain."""
+        with self._cond:
+            close = not self._pending
+        if close:
+            self.close()
+
+
+def create_threadsafe_channel(n_or_buffer=1, *,
+                              _create_channel=create_channel):
+    """Create a new channel which other threads may use.
+
+    Must be called from a coroutine, or callback, running on the event loop
+    that will consume the channel.  n_or_buffer is as for create_channel().
+    """
+    return _create_channel(n_or_buffer, _Channel=ThreadSafeChannel)
@@ -0,0 +1,151 @@
+__all__ = ('InstrumentedChannel',)
+
+from time import monotonic
+
+from ._channel import Channel
+
+# Marks that no blocked put() call was found.
+_MISSING = object()
+
+
+class InstrumentedChannel(Channel):
+    """A channel which keeps statistics about its use.
+
+    Statistics are kept by overriding methods, and wrapping the buffer's
+    methods, so a plain Channel does no extra work.
+    """
+
+    def __init__(self, queue):
+        super().__init__(queue)
+        self._items_in = 0
+        self._items_out = 0
+        self._offers_rejected = 0
+        self._puts_blocked = 0
+        self._takes_blocked = 0
+        self._capacity_wait_time = 0.0
+        self._item_wait_time = 0.0
+        self._high_water = 0
+        self._closed_at = None
+
+        self._buffer_put_nowait = self._put_nowait
+        self._buffer_get_nowait = self._get_nowait
+        self._buffer_put_many_nowait = self._put_many_nowait
+        self._buffer_get_many_nowait = self._get_many_nowait
+        self._put_nowait = self._count_put_nowait
+        self._get_nowait = self._count_get_nowait
+        self._put_many_nowait = self._count_put_many_nowait
+        self._get_many_nowait = self._count_get_many_nowait
+
+    def stats(self):
+        """Return a dict of statistics.
+
+        items_in, items_out: Items added to, and removed from, the channel.
+        offers_rejected: offer() calls that failed as the channel was full.
+        puts_blocked, takes_blocked: put() and take() calls that waited.
+        capacity_wait_time, item_wait_time: Total seconds spent in
+            capacity() and item() calls.
+        high_water: The most items buffered at once.
+        closed_at: time.monotonic() when the channel was closed, or None.
+        """
+        return {
+            'items_in': self._items_in,
+            'items_out': self._items_out,
+            'offers_rejected': self._offers_rejected,
+            'puts_blocked': self._puts_blocked,
+            'takes_blocked': self._takes_blocked,
+            'capacity_wait_time': self._capacity_wait_time,
+            'item_wait_time': self._item_wait_time,
+            'high_water': self._high_water,
+            'closed_at': self._closed_at
+        }
+
+    def close(self, *, _monotonic=monotonic):
+        if not self.is_closed():
+            self._closed_at = _monotonic()
+        super().close()
+
+    async def capacity(self, *, timeout=None, deadline=None,
+                       _monotonic=monotonic):
+        start = _monotonic()
+        try:
+            return await super().capacity(timeout=timeout, deadline=deadline)
+        finally:
+            self._capacity_wait_time += _monotonic() - start
+
+    async def item(self, *, timeout=None, deadline=None,
+                   _monotonic=monotonic):
+        start = _monotonic()
+        try:
+            return await super().item(timeout=timeout, deadline=deadline)
+        finally:
+            self._item_wait_time += _monotonic() - start
+
+    def offer(self, x):
+        if super().offer(x):
+            return True
+        if not self.is_closed():
+            self._offers_rejected += 1
+        return False
+
+    async def _block_put(self, x, timeout, deadline):
+        self._puts_blocked += 1
+        return await super()._block_put(x, timeout, deadline)
+
+    async def _block_take(self, timeout, deadline, default):
+        self._takes_blocked += 1
+        return await super()._block_take(timeout, deadline, default)
+
+    def _hand_to_taker(self, x):
+        if super()._hand_to_taker(x):
+            self._items_in += 1
+            self._items_out += 1
+            return True
+        return False
+
+    def _hand_many_to_takers(self, it):
+        n = super()._hand_many_to_takers(it)
+        self._items_in += n
+        self._items_out += n
+        return n
+
+    def _poll_putter(self, *, default=None):
+        x = super()._poll_putter(default=_MISSING)
+        if x is _MISSING:
+            return default
+        self._items_in += 1
+        self._items_out += 1
+        return x
+
+    def _count_put_nowait(self, x):
+        self._buffer_put_nowait(x)
+        self._items_in += 1
+        self._update_high_water()
+
+    def _count_get_nowait(self):
+        x = self._buffer_get_nowait()
+        self._items_out += 1
+        return x
+
+    def _count_put_many_nowait(self, xs):
+        self._buffer_put_many_nowait(xs)
+        self._items_in += len(xs)
+        self._update_high_water()
+
+    def _count_get_many_nowait(self, n):
+        xs = self._buffer_get_many_nowait(n)
+        self._items_out += len(xs)
+        return xs
+
+    def _update_high_water(self):
+        size = self._size()
+        if size > self._high_water:
+            self._high_water = size
+
+    def _format(self):
+        return ' '.join((
+            super()._format(),
+            f'in={self._items_in}',
+            f'out={self._items_out}',
+            f'rejected={self._offers_rejected}',
+            f'high_water={self._high_water}'
+        ))
@@ -1,61 +1,53 @@
-__all__ = ('itermerge', 'iterzip')
+__all__ = ('combine_latest', 'itermerge', 'iterzip')
 
-from asyncio import create_task
-from itertools import chain
+from asyncio import get_running_loop
+from sys import maxsize
 
-from ._util import wait_all, wait_first
+from ._create_selector import create_selector
 
-SENTINEL = object()
+# Marks a channel which has not had an item taken.
+_MISSING = object()
 
 
 class MergeIterator:
     """Get an asynchronous iterator.
 
     .__anext__() will return the next item available on any channel.
-    If more than one channel has an item, then a non-deterministic
-    selection will be made.
+    If more than one channel has an item, then they take turns.
 
-    Iteration is stopped when all channels are closed.
+    If batch is True then .__anext__() will instead return a list of every
+    item available on any channel, once there is at least one, but no more
+    than max_batch items.
+
+    Iteration is stopped when all channels are closed and empty.
     """
 
-    def __init__(self, *chs):
-        self._chs = chs
+    def __init__(self, *chs, batch=False, max_batch=None,
+                 _create_selector=create_selector, _maxsize=maxsize):
+        if max_batch is not None and max_batch < 1:
+            raise ValueError('max_batch must be a positive integer')
+        # The selector watches each channel, and keeps a queue of those
+        # with items, so an item that is already available is taken in
+        # O(1) however many channels there are.
+        selector = _create_selector(*chs)
+        self._select = selector.select
+        self._take_many = selector._take_many
+        self._batch = batch
+        self._max_batch = _maxsize if max_batch is None else max_batch
 
     def __aiter__(self):
         return self
 
-    async def __anext__(self, *,
-                        _chain=chain,
-                        _create_task=create_task,
-                        _sentinel=SENTINEL,
-                        _wait_first=wait_first,):
-        tasks = []
-        task_to_ch = {}
-        add_task = tasks.append
-        for ch in self._chs:
-            task = _create_task(ch.item())
-            task_to_ch[id(task)] = ch
-            add_task(task)
-
-        done, pending = await _wait_first(*tasks)
-
-        x = _sentinel
-        next_chs = []
-        add_to_next = next_chs.append
-        for task in _chain(done, pending):
-            ch = task_to_ch[id(task)]
-            if task in done:
-                if not task.result():
-                    # Associated channel is closed, so drop it from
-                    # the next iteration.
-                    continue
-                if x is _sentinel:
-                    # Store the first available item for return.
-                    x = ch.poll()
-            add_to_next(ch)
-
-        if x is _sentinel:
-            # Didn't find an item, so stop.
+    async def __anext__(self):
+        if self._batch:
+            xs = await self._take_many(self._max_batch)
+            if not xs:
+                raise StopAsyncIteration
+            return xs
+
+        x, ch = await self._select()
+        if ch is None:
+            # Every channel is closed and empty.
             raise StopAsyncIteration
         return x
 
@@ -63,6 +55,48 @@ class MergeIterator:
 itermerge = MergeIterator
 
 
+class _ItemWatch:
+    """Stands in for a future among a channel's item() waiters."""
+
+    __slots__ = ('_wake', 'ch', 'watching')
+
+    def __init__(self, wake, ch):
+        self._wake = wake
+        self.ch = ch
+        self.watching = False
+
+    def done(self):
+        return not self.watching
+
+    def set_result(self, _):
+        self.watching = False
+        self._wake()
+
+    def watch(self):
+        self.watching = True
+        self.ch._add_item_waiter(self)
+
+
+class _CloseWatch:
+    """Stands in for a future among channels' close waiters.
+
+    Each wait has its own, which is done once the wait ends, so channels
+    drop it whether or not they were closed.
+    """
+
+    __slots__ = ('_wake', 'watching')
+
+    def __init__(self, wake):
+        self._wake = wake
+        self.watching = True
+
+    def done(self):
+        return not self.watching
+
+    def set_result(self, _):
+        self._wake()
+
+
 class ZipIterator:
     """Get an asynchronous zip object.
 
@@ -71,35 +105,116 @@ class ZipIterator:
     match the index of the channel in the zip() argument list from
     which it was taken.
 
-    Iteration is stopped when any channel is closed.
+    Iteration is stopped when any channel is closed and empty.
     """
 
     def __init__(self, *chs):
         self._chs = chs
+        self._watches = [_ItemWatch(self._on_item, ch) for ch in chs]
+        # The number of channels waited on for an item.
+        self._pending = 0
+        self._waiter = None
 
     def __aiter__(self):
         return self
 
-    async def __anext__(self, *,
-                        _create_task=create_task,
-                        _wait_all=wait_all,
-                        _wait_first=wait_first):
+    async def __anext__(self, *, _get_running_loop=get_running_loop,
+                        _CloseWatch=_CloseWatch):
         """Return a tuple with the next items from each channel."""
         chs = self._chs
+        while True:
+            if any(ch.is_closed() and ch.empty() for ch in chs):
+                self._stop()
+                raise StopAsyncIteration
+
+            pending = 0
+            for watch in self._watches:
+                if watch.ch.empty():
+                    pending += 1
+                    if not watch.watching:
+                        watch.watch()
+            if not pending:
+                return tuple(ch.poll() for ch in chs)
+
+            # Only resume once every channel was woken, or one is closed.
+            if self._waiter is not None:
+                raise RuntimeError('__anext__() is already waiting on this '
+                                   'iterator')
+            self._pending = pending
+            self._waiter = fut = _get_running_loop().create_future()
+            close_watch = _CloseWatch(self._wake)
+            for ch in chs:
+                if not ch.is_closed():
+                    ch._add_close_waiter(close_watch)
+            try:
+                await fut
+            finally:
+                self._waiter = None
+                close_watch.watching = False
+
+    def _on_item(self):
+        self._pending -= 1
+        if not self._pending:
+            self._wake()
+
+    def _wake(self):
+        fut = self._waiter
+        if fut is not None and not fut.done():
+            fut.set_result(None)
+
+    def _stop(self):
+        # Channels drop the watches once they are done.
+        for watch in self._watches:
+            watch.watching = False
 
-        closed_coro = _wait_first(*(ch.closed() for ch in chs))
-        closed_task = _create_task(closed_coro)
-        # Wait for one of the following:
-        done, _ = await _wait_first(
-            # 1. Any channel is closed.
-            closed_task,
-            # 2. All channels contain an item.
-            _wait_all(*(ch.item() for ch in chs)))
 
-        if closed_task in done:
-            raise StopAsyncIteration
+iterzip = ZipIterator
 
-        return tuple(ch.poll() for ch in chs)
 
+class CombineLatestIterator:
+    """Get an asynchronous iterator of the latest items on channels.
 
-iterzip = ZipIterator
+    Once every channel has had an item taken, .__anext__() will return a
+    tuple of the latest item taken from each channel, each time an item is
+    taken from any channel.  Each item's index within the tuple will match
+    the index of the channel in the argument list.  If more than one
+    channel has an item, then they take turns.
+
+    Iteration is stopped when all channels are closed and empty, or once
+    a channel is found closed before an item was taken from it.
+    """
+
+    def __init__(self, *chs, _create_selector=create_selector):
+        self._select = _create_selector(*chs).select
+        self._latest = [_MISSING] * len(chs)
+        self._indexes = indexes = {}
+        for i, ch in enumerate(chs):
+            indexes.setdefault(ch, []).append(i)
+        # Channels yet to have an item taken.
+        self._missing = set(indexes)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        latest = self._latest
+        missing = self._missing
+        while True:
+            x, ch = await self._select()
+            if ch is None:
+                # Every channel is closed and empty.
+                raise StopAsyncIteration
+
+            for i in self._indexes[ch]:
+                latest[i] = x
+            if not missing:
+                return tuple(latest)
+
+            missing.discard(ch)
+            if not missing:
+                return tuple(latest)
+            if any(ch.is_closed() and ch.empty() for ch in missing):
+                raise StopAsyncIteration
+
+
+combine_latest = CombineLatestIterator
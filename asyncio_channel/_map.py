@@ -1,9 +1,13 @@
 __all__ = ('map',)
 
 from asyncio import create_task
+from functools import partial
+from inspect import iscoroutinefunction
 
 from ._create_channel import create_channel
 from ._iter import iterzip
+from ._offload import (_call_each, _chunks, _star_call_each, _submit,
+                       run_ordered, run_unordered)
 
 
 async def _map(fn, chs, out, iterzip=iterzip):
@@ -14,17 +18,75 @@ async def _map(fn, chs, out, iterzip=iterzip):
     out.close()
 
 
-def map(fn, chs, n_or_buffer=1, *,
+async def _map_async(fn, chs, out, iterzip=iterzip):
+    """Map with a coroutine function, one call at a time."""
+    async for items in iterzip(*chs):
+        x = await fn(*items)
+        await out.put(x)
+
+    out.close()
+
+
+async def _map_each(run, start, args, emit, out, concurrency):
+    """Map with up to concurrency calls in flight, see run_ordered()."""
+    await run(start, args, emit, concurrency)
+    out.close()
+
+
+def map(fn, chs, n_or_buffer=1, *, concurrency=1, ordered=True,
+        executor=None, chunksize=64,
         _create_channel=create_channel, _create_task=create_task,
-        _map=_map):
+        _iscoroutinefunction=iscoroutinefunction, _chunks=_chunks,
+        _iterzip=iterzip, _map=_map, _map_async=_map_async,
+        _map_each=_map_each):
     """Get a channel with mapped values.
 
     fn is applied to each set of items taken from all input channels.
     The result is put on the output channel.
 
+    fn may be a coroutine function, in which case up to concurrency calls
+    run at once.  If ordered is True then results are put in the order of
+    their items, otherwise in the order the calls finish.  Items are only
+    taken while the output channel accepts results.
+
+    If executor is given, e.g. a concurrent.futures.ProcessPoolExecutor,
+    then fn is run in it on chunks of up to chunksize sets of items, those
+    available when a chunk is started.  Up to concurrency chunks are in
+    flight, and ordered applies to chunks.  fn must not be a coroutine
+    function, and must be picklable for a process pool.
+
     The output channel will be closed when any of the input channels
-    is closed.
+    is closed, and the calls in flight have finished.
+
+    Raises ValueError if concurrency or chunksize is less than 1, or fn
+    is a coroutine function and executor is given.
     """
+    if concurrency < 1:
+        raise ValueError('concurrency must be a positive integer')
+    if chunksize < 1:
+        raise ValueError('chunksize must be a positive integer')
+    if executor is not None and _iscoroutinefunction(fn):
+        raise ValueError('fn must not be a coroutine function with executor')
+
     out = _create_channel(n_or_buffer)
-    _create_task(_map(fn, chs, out))
+    run = run_ordered if ordered else run_unordered
+    if executor is not None:
+        call = _call_each if len(chs) == 1 else _star_call_each
+        start = partial(_submit, executor, call, fn)
+
+        async def emit(_, xs):
+            await out.put_many(xs, all=True)
+
+        _create_task(_map_each(run, start, _chunks(chs, chunksize), emit,
+                               out, concurrency))
+    elif not _iscoroutinefunction(fn):
+        _create_task(_map(fn, chs, out))
+    elif concurrency == 1:
+        _create_task(_map_async(fn, chs, out))
+    else:
+        async def emit(_, x):
+            await out.put(x)
+
+        _create_task(_map_each(run, lambda items: fn(*items),
+                               _iterzip(*chs), emit, out, concurrency))
     return out
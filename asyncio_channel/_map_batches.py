@@ -0,0 +1,64 @@
+__all__ = ('map_batches',)
+
+from asyncio import create_task
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from ._create_channel import create_channel
+
+
+async def _map_batches(fn, batches, out):
+    async for xs in batches:
+        await out.put_many(fn(xs), all=True)
+
+    out.close()
+
+
+async def _map_arrays(fn, batches, out, *, _numpy=numpy):
+    """Map batches stacked into NumPy arrays."""
+    asarray = _numpy.asarray
+    ndarray = _numpy.ndarray
+    async for xs in batches:
+        ys = fn(asarray(xs))
+        if isinstance(ys, ndarray):
+            # Put Python values, not NumPy scalars.
+            ys = ys.tolist()
+        await out.put_many(ys, all=True)
+
+    out.close()
+
+
+def map_batches(fn, ch, n_or_buffer=1, *, batch_size=64, max_delay=None,
+                as_array=False,
+                _create_channel=create_channel, _create_task=create_task,
+                _map_arrays=_map_arrays, _map_batches=_map_batches,
+                _numpy=numpy):
+    """Get a channel with values mapped a batch at a time.
+
+    fn is called with a list of up to batch_size items taken from the
+    input channel, as from its batches() method with max_delay.  It returns
+    an iterable of results, usually one per item, which are put on the
+    output channel in order.
+
+    If as_array is True then fn is called with the items stacked into a
+    NumPy array, and an array it returns is put as Python values.
+
+    The output channel will be closed when the input channel is closed.
+
+    Raises ValueError if batch_size is less than 1 or max_delay is
+    negative, and RuntimeError if as_array is True and NumPy is not
+    installed.
+    """
+    if as_array and _numpy is None:
+        raise RuntimeError('as_array requires NumPy to be installed')
+
+    batches = ch.batches(batch_size, max_delay=max_delay)
+    out = _create_channel(n_or_buffer)
+    if as_array:
+        _create_task(_map_arrays(fn, batches, out))
+    else:
+        _create_task(_map_batches(fn, batches, out))
+    return out
@@ -13,17 +13,31 @@ async def _wait(chs, out, itermerge=itermerge):
     out.close()
 
 
-def merge(chs, n_or_buffer=1, *,
+async def _wait_batches(batches, out):
+    async for xs in batches:
+        await out.put_many(xs, all=True)
+
+    out.close()
+
+
+def merge(chs, n_or_buffer=1, *, batch=False, max_batch=None,
           _create_channel=create_channel, _create_task=create_task,
-          _wait=_wait):
+          _itermerge=itermerge, _wait=_wait, _wait_batches=_wait_batches):
     """Merge multiple channels into a single channel.
 
     Return a new channel, created with n_or_buffer.  Item put on the
     input channels will be taken and put on the output channel.
 
+    If batch is True then items are moved in batches of every item
+    available, up to max_batch, with a bulk put.
+
     The returned channel will be closed when all input channels are
     closed.
     """
     out = _create_channel(n_or_buffer)
-    _create_task(_wait(chs, out))
+    if batch:
+        batches = _itermerge(*chs, batch=True, max_batch=max_batch)
+        _create_task(_wait_batches(batches, out))
+    else:
+        _create_task(_wait(chs, out))
     return out
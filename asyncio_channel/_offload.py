@@ -0,0 +1,115 @@
+__all__ = ('run_ordered', 'run_unordered')
+
+from asyncio import ensure_future, get_running_loop
+from collections import deque
+
+from ._create_channel import create_channel
+from ._iter import iterzip
+
+
+def _call_each(fn, xs):
+    """Apply fn to each item of xs, run in an executor."""
+    return [fn(x) for x in xs]
+
+
+def _star_call_each(fn, xs):
+    """Apply fn to each tuple of items of xs, run in an executor."""
+    return [fn(*x) for x in xs]
+
+
+def _fold(fn, acc, xs):
+    """Reduce the items of xs onto acc, run in an executor."""
+    for x in xs:
+        acc = fn(acc, x)
+    return acc
+
+
+def _submit(executor, call, fn, xs, *, _get_running_loop=get_running_loop):
+    """Run call(fn, xs) in executor, return an asyncio future."""
+    return _get_running_loop().run_in_executor(executor, call, fn, xs)
+
+
+class _ZipChunks:
+    """Asynchronous iterator of lists of up to n tuples from iterzip()."""
+
+    def __init__(self, chs, n, *, _iterzip=iterzip):
+        self._chs = chs
+        self._n = n
+        self._zip = _iterzip(*chs)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        chunk = [await self._zip.__anext__()]
+        chs = self._chs
+        n = self._n
+        # Fill the chunk while every channel has an item, as iterzip()
+        # would, without waiting.
+        while len(chunk) < n and not any(ch.empty() for ch in chs):
+            chunk.append(tuple(ch.poll() for ch in chs))
+        return chunk
+
+
+def _chunks(chs, n, *, _ZipChunks=_ZipChunks):
+    """Get an asynchronous iterator of lists of items available now.
+
+    Lists hold single items from one channel, or tuples from several.
+    """
+    if len(chs) == 1:
+        return chs[0].batches(n)
+    return _ZipChunks(chs, n)
+
+
+async def run_ordered(start, args, emit, concurrency, *,
+                      _deque=deque, _ensure_future=ensure_future):
+    """Run calls with up to concurrency in flight, in input order.
+
+    start(a) returns an awaitable for each a from asynchronous iterable
+    args, and emit(a, result) is awaited with its result.
+    """
+    # A result is only emitted once those before it are, so at most
+    # concurrency results wait to be emitted.
+    pending = _deque()
+    try:
+        async for a in args:
+            if len(pending) >= concurrency:
+                a0, fut = pending.popleft()
+                await emit(a0, await fut)
+            pending.append((a, _ensure_future(start(a))))
+            while pending and pending[0][1].done():
+                a0, fut = pending.popleft()
+                await emit(a0, fut.result())
+        while pending:
+            a0, fut = pending.popleft()
+            await emit(a0, await fut)
+    finally:
+        for _, fut in pending:
+            fut.cancel()
+
+
+async def run_unordered(start, args, emit, concurrency, *,
+                        _create_channel=create_channel,
+                        _ensure_future=ensure_future):
+    """Run calls with up to concurrency in flight, in completion order.
+
+    As run_ordered(), but emit() is awaited as each call finishes.
+    """
+    # Calls are added to done as they finish, which never fills as no
+    # more than concurrency are in flight.
+    done = _create_channel(concurrency)
+    running = {}
+    try:
+        async for a in args:
+            if len(running) >= concurrency:
+                fut = await done.take()
+                await emit(running.pop(fut), fut.result())
+            fut = _ensure_future(start(a))
+            running[fut] = a
+            fut.add_done_callback(done.offer)
+        while running:
+            fut = await done.take()
+            await emit(running.pop(fut), fut.result())
+    finally:
+        for fut in running:
+            fut.cancel()
@@ -1,45 +1,119 @@
 __all__ = ('onto_channel', 'to_channel')
 
-from asyncio import create_task
+from asyncio import create_task, get_running_loop
+from itertools import islice
 
 from ._create_channel import create_channel
 
 
 async def _onto_channel(coll, dest, done, close):
     """Copy items from src to dest channel."""
-    for x in coll:
-        if dest.is_closed():
-            break
-
-        await dest.put(x)
+    # Bulk offers consume the iterator only as far as dest has capacity.
+    await dest.put_many(coll, all=True)
 
     if close:
         dest.close()
     done.close()  # Signal that all items have been copied.
 
 
-def onto_channel(collection, ch, *, close=True,
-                 _create_channel=create_channel, _create_task=create_task,
-                 _onto_channel=_onto_channel):
+async def _onto_channel_async(coll, dest, done, close):
+    """Copy items from asynchronous iterable src to dest channel."""
+    it = coll.__aiter__()
+    try:
+        async for x in it:
+            if not await dest.put(x):
+                break
+    finally:
+        aclose = getattr(it, 'aclose', None)
+        if aclose is not None:
+            await aclose()
+
+    if close:
+        dest.close()
+    done.close()
+
+
+def _next_chunk(it, n, *, _islice=islice):
+    """Get a list of up to n items from iterator it, run in an executor."""
+    return list(_islice(it, n))
+
+
+async def _onto_channel_executor(coll, dest, done, close, executor,
+                                 chunksize, *,
+                                 _get_running_loop=get_running_loop,
+                                 _next_chunk=_next_chunk):
+    """Copy items from src to dest channel, iterated in executor."""
+    loop = _get_running_loop()
+    it = iter(coll)
+    # The next chunk is read while the current one is put.
+    fut = loop.run_in_executor(executor, _next_chunk, it, chunksize)
+    try:
+        while True:
+            xs = await fut
+            fut = None
+            if not xs:
+                break
+            fut = loop.run_in_executor(executor, _next_chunk, it, chunksize)
+            if await dest.put_many(xs, all=True) < len(xs):
+                break
+    finally:
+        if fut is not None:
+            fut.cancel()
+
+    if close:
+        dest.close()
+    done.close()
+
+
+def onto_channel(collection, ch, *, close=True, executor=None,
+                 chunksize=1024, _create_channel=create_channel,
+                 _create_task=create_task, _onto_channel=_onto_channel,
+                 _onto_channel_async=_onto_channel_async,
+                 _onto_channel_executor=_onto_channel_executor):
     """Copy items from collection to channel.
 
+    collection may be an iterable or an asynchronous iterable.  Items of
+    an iterable are added with bulk offers, as many at a time as channel
+    has capacity for.
+
+    If executor is given then the iterable is read in it, chunksize items
+    at a time, for iterators which block, e.g. file readers or database
+    cursors.
+
     If "close" is True then channel will be closed when done.
 
     Returns a new channel that will be closed after all items have been
     copied.
+
+    Raises ValueError if chunksize is less than 1, or executor is given
+    with an asynchronous iterable.
     """
+    if chunksize < 1:
+        raise ValueError('chunksize must be a positive integer')
+
     done = _create_channel()
-    _create_task(_onto_channel(collection, ch, done, close))
+    if hasattr(collection, '__aiter__'):
+        if executor is not None:
+            raise ValueError('executor cannot read an asynchronous iterable')
+        _create_task(_onto_channel_async(collection, ch, done, close))
+    elif executor is not None:
+        _create_task(_onto_channel_executor(collection, ch, done, close,
+                                            executor, chunksize))
+    else:
+        _create_task(_onto_channel(collection, ch, done, close))
     return done
 
 
-def to_channel(collection, *,
+def to_channel(collection, n_or_buffer=1, *, executor=None, chunksize=1024,
                _create_channel=create_channel, _onto_channel=onto_channel):
     """Copy items from collection to a new channel.
 
+    The channel is created with n_or_buffer, and collection is copied as
+    by onto_channel().
+
     Returns a new channel that will be closed after all items have been
     copied.
     """
-    out = _create_channel()
-    _onto_channel(collection, out)
+    out = _create_channel(n_or_buffer)
+    _onto_channel(collection, out, executor=executor, chunksize=chunksize)
     return out
@@ -0,0 +1,158 @@
+__all__ = ('partition',)
+
+from asyncio import create_task
+from bisect import bisect
+
+from ._create_channel import create_channel
+from ._mixin import ReprMixin
+
+_MASK = (1 << 64) - 1
+
+
+def _mix64(h, *, _mask=_MASK):
+    """Spread the bits of hash h, so nearby hashes land far apart.
+
+    Used to place the ring's points, keys are hashed in a 1-tuple which
+    spreads as well at a fraction of the cost.
+    """
+    h = (h + 0x9E3779B97F4A7C15) & _mask
+    h = ((h ^ (h >> 30)) * 0xBF58476D1CE4E5B9) & _mask
+    h = ((h ^ (h >> 27)) * 0x94D049BB133111EB) & _mask
+    return h ^ (h >> 31)
+
+
+class _Ring:
+    """A consistent hash ring of output indexes.
+
+    Each output has replicas points on the ring, and a key belongs to the
+    output of the next point after its hash.  Points only depend on their
+    output's index, so resizing only moves keys to or from the outputs
+    added or removed.
+    """
+
+    def __init__(self, replicas):
+        self._replicas = replicas
+        self._points = []
+        self._owners = []
+
+    def resize(self, n, *, _mix64=_mix64):
+        nodes = sorted((_mix64(hash((i, r))), i)
+                       for i in range(n) for r in range(self._replicas))
+        self._points = [p for p, _ in nodes]
+        self._owners = [i for _, i in nodes]
+
+    def owner(self, key, *, _bisect=bisect, _mask=_MASK):
+        """Return the index of the output for key."""
+        owners = self._owners
+        i = _bisect(self._points, hash((key,)) & _mask)
+        return owners[i] if i < len(owners) else owners[0]
+
+
+async def _route(src, key_fn, ring, outs, max_batch, notify):
+    """Take batches of items and put each on its key's output channel."""
+    async for xs in src.batches(max_batch):
+        while xs:
+            groups = {}
+            for x in xs:
+                ch = outs[ring.owner(key_fn(x))]
+                ys = groups.get(ch)
+                if ys is None:
+                    groups[ch] = [x]
+                else:
+                    ys.append(x)
+
+            xs = []
+            for ch, ys in groups.items():
+                n = await ch.put_many(ys, all=True)
+                if n < len(ys) and ch not in outs:
+                    # Removed by resize() while waiting, route the rest
+                    # again.  Items for a closed output are dropped.
+                    xs += ys[n:]
+
+    notify()
+
+
+class Partition(ReprMixin):
+    """Route items from ch to one of n output channels by key.
+
+    key_fn is applied to each item, and items with equal keys are put on
+    the same output channel, in order.  Keys are assigned to outputs by
+    consistent hashing, with replicas points per output, so resize() only
+    moves about 1/n of the keys for each output added or removed.
+
+    Items are moved in batches of up to max_batch, those already available,
+    with a bulk put per output.  Output channels are created with
+    n_or_buffer, and are closed when ch is closed.
+
+    Raises ValueError if n, replicas or max_batch is less than 1.
+    """
+
+    def __init__(self, key_fn, ch, n, n_or_buffer=1, *, replicas=128,
+                 max_batch=64, _create_task=create_task, _Ring=_Ring,
+                 _route=_route):
+        if replicas < 1:
+            raise ValueError('replicas must be a positive integer')
+        if max_batch < 1:
+            raise ValueError('max_batch must be a positive integer')
+
+        self._n_or_buffer = n_or_buffer
+        self._ring = ring = _Ring(replicas)
+        self._outs = outs = []
+        self._done = False
+        self.resize(n)
+        _create_task(_route(ch, key_fn, ring, outs, max_batch, self._notify))
+
+    def __len__(self):
+        return len(self._outs)
+
+    @property
+    def outputs(self):
+        """A tuple of the output channels."""
+        return tuple(self._outs)
+
+    def output(self, key):
+        """Return the output channel for key."""
+        return self._outs[self._ring.owner(key)]
+
+    def resize(self, n, *, _create_channel=create_channel):
+        """Change the number of output channels to n.
+
+        Outputs are added or removed at the end, and removed outputs are
+        closed.  Their consumers may still take the items already on them,
+        and later items for their keys go to the remaining outputs.
+
+        Returns the tuple of output channels.  Once ch is closed, the
+        outputs are no longer changed.
+
+        Raises ValueError if n is less than 1.
+        """
+        if n < 1:
+            raise ValueError('n must be a positive integer')
+
+        outs = self._outs
+        if self._done:
+            return tuple(outs)
+
+        while len(outs) < n:
+            outs.append(_create_channel(self._n_or_buffer))
+        removed = outs[n:]
+        del outs[n:]
+        self._ring.resize(n)
+        for ch in removed:
+            ch.close()
+        return tuple(outs)
+
+    def lag(self):
+        """Return a list of the number of items waiting on each output."""
+        return [ch._size() for ch in self._outs]
+
+    def _notify(self):
+        self._done = True
+        for ch in self._outs:
+            ch.close()
+
+    def _format(self):
+        return 'done' if self._done else f'outputs={len(self._outs)}'
+
+
+partition = Partition
@@ -2,28 +2,40 @@ __all__ = ('pipe',)
 
 from asyncio import create_task
 
-from ._util import wait_all
 
-
-async def _pipe(src, dest, close, _wait_all=wait_all):
+async def _pipe(src, dest, close, max_batch):
     """Transfer items from src to dest."""
     while True:
-        await _wait_all(src.item(), dest.capacity())
-
-        if src.empty() or dest.is_closed():
+        # Only wait while src is empty or dest is full, so a backlog is
+        # moved without yielding to the event loop while dest accepts it.
+        if src.empty() and not await src.item():
+            break
+        if dest.full() and not await dest.capacity():
+            break
+        if dest.is_closed():
             break
 
-        x = src.poll()
-        dest.offer(x)
+        xs = src.poll_many(max_batch)
+        n = dest.offer_many(xs)
+        if n < len(xs):
+            # dest filled up part way, wait for it to take the rest.
+            rest = xs[n:]
+            if await dest.put_many(rest, all=True) < len(rest):
+                break
 
     if close and src.is_closed():
         dest.close()
 
 
-def pipe(src, dest, *, close=True,
+def pipe(src, dest, *, close=True, max_batch=64,
          _create_task=create_task, _pipe=_pipe):
     """Transfer items from src to dest.
 
+    Items are moved in bulk, up to max_batch at a time.  Any of a batch
+    which dest has no capacity for are held until it does.
+
     When src is closed, and "close" is True, then dest will be closed.
     """
-    _create_task(_pipe(src, dest, close))
+    if max_batch < 1:
+        raise ValueError('max_batch must be a positive integer')
+    _create_task(_pipe(src, dest, close, max_batch))
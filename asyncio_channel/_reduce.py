@@ -1,8 +1,9 @@
 __all__ = ('reduce',)
 
-from asyncio import create_task
+from asyncio import create_task, get_running_loop
 
 from ._create_channel import create_channel
+from ._offload import _fold
 
 
 async def _reduce(out, fn, ch, init):
@@ -15,7 +16,19 @@ async def _reduce(out, fn, ch, init):
     out.close()
 
 
-def reduce(fn, ch, init=None, *,
+async def _reduce_chunks(out, fn, ch, init, executor, chunksize, *,
+                         _get_running_loop=get_running_loop, _fold=_fold):
+    """Reduce chunks of items from channel, run in executor."""
+    loop = _get_running_loop()
+    acc = init
+    async for xs in ch.batches(chunksize):
+        acc = await loop.run_in_executor(executor, _fold, fn, acc, xs)
+
+    await out.put(acc)
+    out.close()
+
+
+def reduce(fn, ch, init=None, *, executor=None, chunksize=64,
            _create_channel=create_channel, _create_task=create_task):
     """Reduce items taken from channel.
 
@@ -26,7 +39,19 @@ def reduce(fn, ch, init=None, *,
     channel, then that result and the second item taken from channel,
     and so on until the channel closes.  The final result will be put
     on the returned channel.
+
+    If executor is given then fn is run in it over chunks of up to
+    chunksize items.  Each chunk needs the result of the one before, so
+    one chunk is in flight at a time.
+
+    Raises ValueError if chunksize is less than 1.
     """
+    if chunksize < 1:
+        raise ValueError('chunksize must be a positive integer')
+
     out = _create_channel()
-    _create_task(_reduce(out, fn, ch, init))
+    if executor is None:
+        _create_task(_reduce(out, fn, ch, init))
+    else:
+        _create_task(_reduce_chunks(out, fn, ch, init, executor, chunksize))
     return out
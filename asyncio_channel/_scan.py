@@ -0,0 +1,39 @@
+__all__ = ('scan',)
+
+from asyncio import create_task
+
+from ._create_channel import create_channel
+
+
+async def _scan(out, fn, ch, init, max_batch):
+    """Put the running reduction of items from channel."""
+    acc = init
+    async for xs in ch.batches(max_batch):
+        accs = []
+        for x in xs:
+            acc = fn(acc, x)
+            accs.append(acc)
+        await out.put_many(accs, all=True)
+
+    out.close()
+
+
+def scan(fn, ch, init=None, n_or_buffer=1, *, max_batch=64,
+         _create_channel=create_channel, _create_task=create_task):
+    """Get a channel of running reductions of items taken from channel.
+
+    fn is called as for reduce(), and each result is put on the returned
+    channel, which is created with n_or_buffer.  Items are taken in
+    batches of up to max_batch, those already available, and their
+    results are added with a bulk put.
+
+    The returned channel will be closed when channel is closed.
+
+    Raises ValueError if max_batch is less than 1.
+    """
+    if max_batch < 1:
+        raise ValueError('max_batch must be a positive integer')
+
+    out = _create_channel(n_or_buffer)
+    _create_task(_scan(out, fn, ch, init, max_batch))
+    return out
@@ -1,7 +1,7 @@
 __all__ = ('ProhibitedOperationError', 'shield_from_close',
            'shield_from_read', 'shield_from_write')
 
-from ._channel import Channel
+from ._channel import Channel, _BatchIterator
 from ._mixin import ReprMixin
 
 
@@ -9,6 +9,10 @@ class ProhibitedOperationError(Exception):
     pass
 
 
+async def _no_batch(max_n, max_delay):
+    return []
+
+
 def _delegate_methods(receiver, target):
     """Delegate target's public methods to receiver."""
     receiver_methods = frozenset(dir(receiver))
@@ -30,6 +34,18 @@ class ChannelDecoratorBase(ReprMixin):
         self._channel = channel
         self._silent = silent
 
+    # Waiters are only woken, the operation they wait for is then made
+    # through the decorator, so these are forwarded for the combinators.
+
+    def _add_capacity_waiter(self, fut):
+        self._channel._add_capacity_waiter(fut)
+
+    def _add_item_waiter(self, fut):
+        self._channel._add_item_waiter(fut)
+
+    def _add_close_waiter(self, fut):
+        self._channel._add_close_waiter(fut)
+
     def _format(self):
         return f'channel={self._channel!r}'
 
@@ -57,8 +73,9 @@ shield_from_close = CloseShield
 class ReadShield(ChannelDecoratorBase):
     """Shield a channel from having items read.
 
-    If silent is false then calling .item(), .poll(), or
-    .take() will raise a ProhibitedOperationError.
+    If silent is false then calling .item(), .poll(), .poll_many(),
+    .take(), .take_many(), or .batches() will raise a
+    ProhibitedOperationError.
     """
 
     def __init__(self, channel, *, silent=False,
@@ -66,7 +83,7 @@ class ReadShield(ChannelDecoratorBase):
         super().__init__(channel, silent=silent)
         _delegate_methods(receiver=self, target=channel)
 
-    async def item(self, *, timeout=None):
+    async def item(self, *, timeout=None, deadline=None):
         if not self._silent:
             raise ProhibitedOperationError('item')
         return False
@@ -76,11 +93,28 @@ class ReadShield(ChannelDecoratorBase):
             raise ProhibitedOperationError('poll')
         return default
 
-    async def take(self, *, default=None, timeout=None):
+    async def take(self, *, default=None, timeout=None, deadline=None):
         if not self._silent:
             raise ProhibitedOperationError('take')
         return default
 
+    def poll_many(self, max_n):
+        if not self._silent:
+            raise ProhibitedOperationError('poll_many')
+        return []
+
+    async def take_many(self, max_n, *, all=False, timeout=None,
+                        deadline=None):
+        if not self._silent:
+            raise ProhibitedOperationError('take_many')
+        return []
+
+    def batches(self, max_items, *, max_delay=None,
+                _BatchIterator=_BatchIterator, _no_batch=_no_batch):
+        if not self._silent:
+            raise ProhibitedOperationError('batches')
+        return _BatchIterator(_no_batch, max_items, max_delay)
+
 
 shield_from_read = ReadShield
 
@@ -88,8 +122,8 @@ shield_from_read = ReadShield
 class WriteShield(ChannelDecoratorBase):
     """Shield a channel from having items written.
 
-    If silent is false then calling .capacit(), .offer(), or
-    .put() will raise a ProhibitedOperationError.
+    If silent is false then calling .capacit(), .offer(), .offer_many(),
+    .put(), or .put_many() will raise a ProhibitedOperationError.
     """
 
     def __init__(self, channel, *, silent=False,
@@ -97,7 +131,7 @@ class WriteShield(ChannelDecoratorBase):
         super().__init__(channel, silent=silent)
         _delegate_methods(receiver=self, target=channel)
 
-    async def capacity(self, *, timeout=None):
+    async def capacity(self, *, timeout=None, deadline=None):
         if not self._silent:
             raise ProhibitedOperationError('capacity')
         return False
@@ -107,10 +141,21 @@ class WriteShield(ChannelDecoratorBase):
             raise ProhibitedOperationError('offer')
         return False
 
-    async def put(self, x, default=None, timeout=None):
+    async def put(self, x, default=None, timeout=None, deadline=None):
         if not self._silent:
             raise ProhibitedOperationError('put')
         return False
 
+    def offer_many(self, xs):
+        if not self._silent:
+            raise ProhibitedOperationError('offer_many')
+        return 0
+
+    async def put_many(self, xs, *, all=False, timeout=None,
+                       deadline=None):
+        if not self._silent:
+            raise ProhibitedOperationError('put_many')
+        return 0
+
 
 shield_from_write = WriteShield
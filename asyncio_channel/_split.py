@@ -1,8 +1,10 @@
 __all__ = ('split',)
 
 from asyncio import create_task
+from functools import partial
 
 from ._create_channel import create_channel
+from ._offload import _call_each, _submit, run_ordered
 
 
 async def _split(predicate, ch, true_out, false_out):
@@ -15,19 +17,50 @@ async def _split(predicate, ch, true_out, false_out):
     false_out.close()
 
 
+async def _split_chunks(predicate, ch, true_out, false_out, executor,
+                        chunksize, concurrency, *, _run=run_ordered):
+    """Sort chunks of items by predicate, run in executor."""
+    async def emit(xs, flags):
+        trues = [x for x, flag in zip(xs, flags) if flag]
+        falses = [x for x, flag in zip(xs, flags) if not flag]
+        await true_out.put_many(trues, all=True)
+        await false_out.put_many(falses, all=True)
+
+    start = partial(_submit, executor, _call_each, predicate)
+    await _run(start, ch.batches(chunksize), emit, concurrency)
+    true_out.close()
+    false_out.close()
+
+
 def split(predicate, ch, true_n_or_buffer=1, false_n_or_buffer=1, *,
+          executor=None, chunksize=64, concurrency=1,
           _create_channel=create_channel, _create_task=create_task,
-          _split=_split):
+          _split=_split, _split_chunks=_split_chunks):
     """Sort channel items using predicate.
 
     Returns a tuple of two channels.  The first will contains items
     from input channel for which predicate returned True, other items
     will be put on the second channel.
 
+    If executor is given then predicate is run in it on chunks of up to
+    chunksize items, with up to concurrency chunks in flight.  Items keep
+    their order on each output channel.
+
     The output channels will be closed when the input channel is
     closed.
+
+    Raises ValueError if chunksize or concurrency is less than 1.
     """
+    if chunksize < 1:
+        raise ValueError('chunksize must be a positive integer')
+    if concurrency < 1:
+        raise ValueError('concurrency must be a positive integer')
+
     true_out = _create_channel(true_n_or_buffer)
     false_out = _create_channel(false_n_or_buffer)
-    _create_task(_split(predicate, ch, true_out, false_out))
+    if executor is None:
+        _create_task(_split(predicate, ch, true_out, false_out))
+    else:
+        _create_task(_split_chunks(predicate, ch, true_out, false_out,
+                                   executor, chunksize, concurrency))
     return true_out, false_out
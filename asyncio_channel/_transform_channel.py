@@ -0,0 +1,194 @@
+__all__ = ('InstrumentedTransformChannel', 'TransformChannel')
+
+from itertools import islice
+
+from ._channel import Channel, _is_none
+from ._instrumented_channel import InstrumentedChannel
+
+
+class _Held:
+    """Stands in for the future of a blocked put() call.
+
+    Holds an item of an expansion which did not fit, so it is admitted to
+    the channel in order as capacity frees up, like a blocked put().
+    """
+
+    __slots__ = ()
+
+    def done(self):
+        return False
+
+    def set_result(self, _):
+        pass
+
+
+_HELD = _Held()
+
+
+class _Lead:
+    """Stands in for the future of a blocked put() with an expansion.
+
+    Records whether the first item was admitted, so the rest follow it, or
+    are dropped if it timed out or was cancelled.
+    """
+
+    __slots__ = ('_fut', 'admitted')
+
+    def __init__(self, fut):
+        self._fut = fut
+        self.admitted = False
+
+    def done(self):
+        return self._fut.done()
+
+    def set_result(self, x):
+        self.admitted = x is True
+        self._fut.set_result(x)
+
+
+class _Follow:
+    """Stands in for a future, for the rest of a _Lead's expansion."""
+
+    __slots__ = ('_lead',)
+
+    def __init__(self, lead):
+        self._lead = lead
+
+    def done(self):
+        lead = self._lead
+        return lead.done() and not lead.admitted
+
+    def set_result(self, _):
+        pass
+
+
+class TransformChannel(Channel):
+    """A channel which transforms items as they are added.
+
+    xform is called with a list of items and returns a list of items to
+    add in their place, so it may map, filter or expand them.  It runs in
+    offer() and put(), and once per chunk in offer_many() and put_many(),
+    before items reach the buffer.  Items it drops never use capacity.
+
+    An item is accepted if the channel has capacity for at least one item.
+    Any of its expansion which does not fit waits as a blocked put() would,
+    and so is dropped if the channel is closed first.  An item which must
+    wait, for put() or complete_one(), is transformed as it starts waiting.
+
+    Only the methods items enter by are overridden, so a plain Channel
+    does no extra work.
+    """
+
+    def __init__(self, queue, xform):
+        super().__init__(queue)
+        self._xform = xform
+
+    def offer(self, x):
+        if x is None:
+            raise ValueError('None is not allowed on channel')
+        if self.is_closed() or not self._has_room():
+            # Rejected whatever xform would give, so it is not called.
+            return super().offer(x)
+
+        ys = self._xform([x])
+        if ys:
+            self._add_transformed(ys)
+        return True
+
+    def offer_many(self, xs, *, _islice=islice, _any=any, _map=map,
+                   _is_none=_is_none):
+        """Synchronously add as many items from iterable xs as will fit.
+
+        Items are transformed a chunk at a time, and no more are taken from
+        xs once the channel is full.
+
+        Return the number of items taken from xs.
+
+        Raises ValueError if an item is None, before transforming its
+        chunk.
+        """
+        if self.is_closed():
+            return 0
+
+        it = iter(xs)
+        n = 0
+        while True:
+            room = self._room()
+            if room == 0:
+                break
+            chunk = list(_islice(it, room))
+            if not chunk:
+                break
+            if _any(_map(_is_none, chunk)):
+                raise ValueError('None is not allowed on channel')
+            n += len(chunk)
+            ys = self._xform(chunk)
+            if ys:
+                self._add_transformed(ys)
+        return n
+
+    async def put(self, x, *, timeout=None, deadline=None):
+        if x is None:
+            raise ValueError('None is not allowed on channel')
+        if self.is_closed():
+            return False
+        if not self._has_room():
+            # x is transformed once it is held, by _add_putter().
+            return await self._block_put(x, timeout, deadline)
+
+        ys = self._xform([x])
+        if ys:
+            self._add_transformed(ys)
+        return True
+
+    def _has_room(self):
+        """Return True if an item would be accepted, False otherwise."""
+        return not self.full() or not self._no_takers()
+
+    def _room(self):
+        """Return the number of items there is capacity for, or None."""
+        takers = sum(1 for fut in self._takers if not fut.done())
+        if self._maxsize == 0 or self.full():
+            return takers
+        room = self._maxsize - self._size()
+        return room + takers if room > 0 else None
+
+    def _add_transformed(self, ys, *, _HELD=_HELD):
+        """Add transformed items ys, holding any which do not fit."""
+        n = super().offer_many(ys)
+        add_putter = super()._add_putter
+        for y in ys[n:]:
+            if y is None:
+                raise ValueError('None is not allowed on channel')
+            add_putter(_HELD, y)
+
+    def _add_putter(self, fut, x, *, _any=any, _map=map, _is_none=_is_none,
+                    _Lead=_Lead, _Follow=_Follow):
+        """Transform x, and hold its items until there is capacity.
+
+        fut is resolved once the first item is admitted, or at once if
+        xform drops x.  The rest of the items follow the first, and are
+        dropped with it.
+        """
+        if fut.done():
+            return
+        ys = self._xform([x])
+        if not ys:
+            fut.set_result(True)
+            return
+        if _any(_map(_is_none, ys)):
+            raise ValueError('None is not allowed on channel')
+
+        add_putter = super()._add_putter
+        if len(ys) == 1:
+            add_putter(fut, ys[0])
+            return
+        lead = _Lead(fut)
+        add_putter(lead, ys[0])
+        follow = _Follow(lead)
+        for y in ys[1:]:
+            add_putter(follow, y)
+
+
+class InstrumentedTransformChannel(TransformChannel, InstrumentedChannel):
+    """A transforming channel which keeps statistics about its use."""
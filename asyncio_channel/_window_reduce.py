@@ -0,0 +1,188 @@
+__all__ = ('window_reduce',)
+
+from asyncio import create_task, get_running_loop
+from collections import deque
+from functools import reduce as _fold
+
+from ._channel import _expire
+from ._create_channel import create_channel
+
+
+class _Window:
+    """The items of a sliding window, and their reduction.
+
+    With inverse, the reduction is kept up to date as items are added and
+    removed, at O(1) per item.  Otherwise it is folded from init on each
+    reduction.
+    """
+
+    __slots__ = ('_fn', '_init', '_inverse', 'items', '_acc')
+
+    def __init__(self, fn, init, inverse, *, _deque=deque):
+        self._fn = fn
+        self._init = init
+        self._inverse = inverse
+        self.items = _deque()
+        self._acc = init
+
+    def add(self, x):
+        self.items.append(x)
+        if self._inverse is not None:
+            self._acc = self._fn(self._acc, x)
+
+    def remove(self):
+        x = self.items.popleft()
+        if self._inverse is not None:
+            self._acc = self._inverse(self._acc, x)
+        return x
+
+    def reduction(self, *, _fold=_fold):
+        if self._inverse is not None:
+            return self._acc
+        return _fold(self._fn, self.items, self._init)
+
+
+async def _window_count(out, fn, ch, init, inverse, count, slide,
+                        max_batch, *, _Window=_Window):
+    """Put the reduction of every slide items, over the last count."""
+    tumbling = slide == count
+    window = None if tumbling else _Window(fn, init, inverse)
+    acc = init
+    fresh = 0
+    async for xs in ch.batches(max_batch):
+        accs = []
+        for x in xs:
+            fresh += 1
+            if tumbling:
+                acc = fn(acc, x)
+            else:
+                window.add(x)
+                if len(window.items) > count:
+                    window.remove()
+            if fresh == slide:
+                accs.append(acc if tumbling else window.reduction())
+                acc = init
+                fresh = 0
+        await out.put_many(accs, all=True)
+
+    if fresh:
+        await out.put(acc if tumbling else window.reduction())
+    out.close()
+
+
+async def _window_time(out, fn, ch, init, inverse, duration, slide,
+                       max_batch, *, _get_running_loop=get_running_loop,
+                       _Window=_Window):
+    """Put the reduction of the last duration seconds, every slide."""
+    loop = _get_running_loop()
+    tumbling = slide == duration
+    window = None if tumbling else _Window(fn, init, inverse)
+    times = None if tumbling else deque()
+    acc = init
+    fresh = False
+    fut = None
+    tick = loop.time() + slide
+
+    # A single timer for the stage resolves whichever wait is current, and
+    # is only rescheduled once it fires.
+    def expire():
+        if fut is not None:
+            _expire(fut)
+
+    handle = loop.call_at(tick, expire)
+    try:
+        while True:
+            if loop.time() >= tick:
+                if tumbling:
+                    x, acc = acc, init
+                else:
+                    start = tick - duration
+                    while times and times[0] <= start:
+                        times.popleft()
+                        window.remove()
+                    x = window.reduction()
+                fresh = False
+                tick += slide
+                handle = loop.call_at(tick, expire)
+                await out.put(x)
+                continue
+
+            xs = ch.poll_many(max_batch)
+            if not xs:
+                if ch.is_closed() and ch.empty():
+                    break
+                # Wait for an item, the timer, or the channel to close, then
+                # check again.  Items are only taken by poll_many().
+                fut = loop.create_future()
+                ch._add_item_waiter(fut)
+                await fut
+                continue
+
+            now = loop.time()
+            fresh = True
+            for x in xs:
+                if tumbling:
+                    acc = fn(acc, x)
+                else:
+                    times.append(now)
+                    window.add(x)
+    finally:
+        handle.cancel()
+
+    if fresh:
+        await out.put(acc if tumbling else window.reduction())
+    out.close()
+
+
+def window_reduce(fn, ch, init=None, n_or_buffer=1, *, count=None,
+                  duration=None, slide=None, inverse=None, max_batch=64,
+                  _create_channel=create_channel, _create_task=create_task,
+                  _window_count=_window_count, _window_time=_window_time):
+    """Get a channel of reductions of windows of items taken from channel.
+
+    Windows hold the last count items, or the items taken in the last
+    duration seconds; exactly one must be given.  fn is called as for
+    reduce(), from init for each window, and a window's result is put on
+    the returned channel every slide items, or seconds.  If slide is None
+    the windows are tumbling, i.e. slide is the window size, otherwise they
+    are sliding and overlap.
+
+    For sliding windows inverse may be given, to remove an item from a
+    result: inverse(fn(acc, x), x) == acc.  Results are then kept up to
+    date at O(1) cost per item, rather than folding each window again.
+
+    Time windows put a result every slide seconds, including for windows
+    without items, with a single timer per stage.  Items belong to the
+    windows of the time they are taken.
+
+    Items are taken in batches of up to max_batch, those already
+    available.
+
+    The returned channel, created with n_or_buffer, will be closed when
+    channel is closed, after a result for any items since the last.
+
+    Raises ValueError if not exactly one of count and duration is given,
+    if count, duration or slide is not positive, or if slide is larger
+    than the window.
+    """
+    if (count is None) == (duration is None):
+        raise ValueError('exactly one of count and duration must be given')
+    size = count if duration is None else duration
+    if size <= 0:
+        raise ValueError('the window size must be positive')
+    if slide is None:
+        slide = size
+    if not 0 < slide <= size:
+        raise ValueError('slide must be positive and at most the window '
+                         'size')
+    if max_batch < 1:
+        raise ValueError('max_batch must be a positive integer')
+
+    out = _create_channel(n_or_buffer)
+    if duration is None:
+        _create_task(_window_count(out, fn, ch, init, inverse, count, slide,
+                                   max_batch))
+    else:
+        _create_task(_window_time(out, fn, ch, init, inverse, duration,
+                                  slide, max_batch))
+    return out
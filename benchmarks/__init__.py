@@ -0,0 +1,9 @@
+"""Performance benchmarks for asyncio_channel.
+
+Run them all, and write the results to a JSON file, from the repository
+root:
+
+    $ python -m benchmarks
+
+Benchmark modules register functions with _suite.benchmark().
+"""
@@ -0,0 +1,116 @@
+"""
+Run the benchmarks and write the results to a JSON file.
+
+Run from the repository root:
+
+    $ python -m benchmarks
+    $ python -m benchmarks -k topology --scale 0.1
+    $ python -m benchmarks --compare bench-1a2b3c4.json
+"""
+
+import json
+import platform
+import re
+import subprocess
+import sys
+from argparse import ArgumentParser
+from datetime import datetime, timezone
+from importlib import import_module
+from pathlib import Path
+from pkgutil import iter_modules
+
+import asyncio_channel
+
+from . import __path__ as package_path
+from ._suite import measure, registered
+
+
+def _commit():
+    """Return the current git commit, or None."""
+    try:
+        out = subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'],
+            capture_output=True, text=True, check=True)
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return out.stdout.strip()
+
+
+def _key(result):
+    return result['benchmark'], json.dumps(result['params'], sort_keys=True)
+
+
+def _label(result):
+    params = ' '.join(f'{k}={v}' for k, v in result['params'].items())
+    return f'{result["benchmark"]} {params}'
+
+
+def _compare(results, path):
+    with open(path) as f:
+        baseline = {_key(r): r for r in json.load(f)['results']}
+
+    print(f'\ncompared with {path}:')
+    for result in results:
+        old = baseline.get(_key(result))
+        if old is None:
+            continue
+        change = result['ns_per_item'] / old['ns_per_item'] - 1
+        print(f'{_label(result):<64} {old["ns_per_item"]:10.0f} '
+              f'{result["ns_per_item"]:10.0f}ns/item {change:+8.1%}')
+
+
+def main(argv=None):
+    parser = ArgumentParser(prog='python -m benchmarks',
+                            description=__doc__.strip().splitlines()[0])
+    parser.add_argument('-k', dest='pattern', default='',
+                        help='only run benchmarks whose name matches this '
+                             'regular expression')
+    parser.add_argument('-o', dest='output',
+                        help='write results here, by default '
+                             'bench-<commit>.json')
+    parser.add_argument('--repeat', type=int, default=3,
+                        help='run each benchmark this many times and keep '
+                             'the fastest (default: 3)')
+    parser.add_argument('--scale', type=float, default=1.0,
+                        help='multiply the number of items by this')
+    parser.add_argument('--compare', metavar='BASELINE',
+                        help='compare with the results in this file')
+    args = parser.parse_args(argv)
+
+    for module in iter_modules(package_path):
+        if module.name.startswith('bench_'):
+            import_module(f'{__package__}.{module.name}')
+
+    pattern = re.compile(args.pattern)
+    results = []
+    for name, n, params, fn in registered():
+        if not pattern.search(name):
+            continue
+        n = max(int(n * args.scale), 1)
+        result = min((measure(fn, n, params) for _ in range(args.repeat)),
+                     key=lambda r: r['seconds'])
+        result = dict(benchmark=name, params=params, **result)
+        result['ns_per_item'] = result['seconds'] / result['items'] * 1e9
+        results.append(result)
+        print(f'{_label(result):<64} {result["ns_per_item"]:10.0f}ns/item',
+              flush=True)
+
+    commit = _commit()
+    output = Path(args.output or f'bench-{commit or "local"}.json')
+    with open(output, 'w') as f:
+        json.dump({
+            'commit': commit,
+            'version': asyncio_channel.__version__,
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'time': datetime.now(timezone.utc).isoformat(),
+            'results': results
+        }, f, indent=2)
+    print(f'\nwrote {output}')
+
+    if args.compare:
+        _compare(results, args.compare)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,74 @@
+"""
+Benchmark registry and helpers shared by the benchmark modules.
+"""
+
+from asyncio import run, sleep
+from inspect import iscoroutinefunction
+from itertools import product
+
+from asyncio_channel import (create_blocking_buffer, create_channel,
+                             create_dropping_buffer, create_sliding_buffer)
+
+# Buffer types which scenarios are parameterized by.
+BUFFERS = {
+    'blocking': create_blocking_buffer,
+    'dropping': create_dropping_buffer,
+    'sliding': create_sliding_buffer
+}
+
+_registry = []
+
+
+def benchmark(n, **grid):
+    """Register a benchmark, run once per combination of values in grid.
+
+    The decorated function is called as fn(n, **params) and may be a
+    coroutine function.  It returns the elapsed seconds, or a dict of
+    results which includes 'seconds'.  Results are for n items, unless the
+    dict includes 'items'.
+    """
+    def register(fn):
+        module = fn.__module__.rpartition('.')[2]
+        name = f'{module[len("bench_"):]}.{fn.__name__}'
+        keys = tuple(grid)
+        for values in product(*grid.values()):
+            _registry.append((name, n, dict(zip(keys, values)), fn))
+        return fn
+    return register
+
+
+def registered():
+    """Return the registered (name, n, params, fn) benchmarks."""
+    return list(_registry)
+
+
+def measure(fn, n, params):
+    """Run a benchmark once, return a dict of results."""
+    if iscoroutinefunction(fn):
+        result = run(fn(n, **params))
+    else:
+        result = fn(n, **params)
+    if not isinstance(result, dict):
+        result = {'seconds': result}
+    result.setdefault('items', n)
+    return result
+
+
+def make_channel(buffer, size):
+    """Create a channel with a buffer of the named type."""
+    return create_channel(BUFFERS[buffer](size))
+
+
+def percentiles(samples, ps=(50, 90, 99)):
+    """Return a dict of percentiles, and the maximum, of samples."""
+    samples = sorted(samples)
+    last = len(samples) - 1
+    result = {f'p{p}': samples[round(last * p / 100)] for p in ps}
+    result['max'] = samples[last]
+    return result
+
+
+async def drained(*chs):
+    """Wait until every channel in chs is empty."""
+    while not all(ch.empty() for ch in chs):
+        await sleep(0)
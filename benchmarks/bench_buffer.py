@@ -0,0 +1,72 @@
+"""
+Compare channels backed by the built-in buffers with asyncio.Queue.
+
+Run from the repository root:
+
+    $ python -m benchmarks.bench_buffer
+"""
+
+from asyncio import Queue, create_task, gather, run
+from time import perf_counter
+
+from asyncio_channel import create_blocking_buffer, create_channel
+
+from ._suite import benchmark
+
+N = 200_000
+SIZE = 64
+
+QUEUES = {
+    'asyncio.Queue': lambda: create_channel(Queue(SIZE)),
+    'BlockingBuffer': lambda: create_channel(create_blocking_buffer(SIZE))
+}
+
+
+@benchmark(N, queue=QUEUES)
+def offer_poll(n, queue):
+    """Fill and drain the channel synchronously."""
+    ch = QUEUES[queue]()
+    offer = ch.offer
+    poll = ch.poll
+    start = perf_counter()
+    for i in range(n // SIZE):
+        for x in range(SIZE):
+            offer(x)
+        for _ in range(SIZE):
+            poll()
+    return perf_counter() - start
+
+
+@benchmark(N, queue=QUEUES)
+async def put_take(n, queue):
+    """Move n items from a producer to a consumer coroutine."""
+    ch = QUEUES[queue]()
+
+    async def produce():
+        put = ch.put
+        for x in range(n):
+            await put(x)
+        ch.close()
+
+    async def consume():
+        async for _ in ch:
+            pass
+
+    start = perf_counter()
+    await gather(create_task(produce()), create_task(consume()))
+    return perf_counter() - start
+
+
+def report(name, elapsed, n=N):
+    print(f'{name:<32} {elapsed:8.3f}s {n / elapsed:12,.0f} items/s')
+
+
+def main():
+    for queue in QUEUES:
+        report(f'offer/poll {queue}', offer_poll(N, queue))
+    for queue in QUEUES:
+        report(f'put/take {queue}', run(put_take(N, queue)))
+
+
+if __name__ == '__main__':
+    main()
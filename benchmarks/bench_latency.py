@@ -0,0 +1,44 @@
+"""
+Measure round trip latency between two coroutines, as in
+examples/ping-pong.py.
+
+Run from the repository root:
+
+    $ python -m benchmarks -k latency
+"""
+
+from asyncio import create_task
+from time import perf_counter
+
+from ._suite import BUFFERS, benchmark, make_channel, percentiles
+
+
+@benchmark(20_000, buffer=BUFFERS)
+async def ping_pong(n, buffer):
+    """Send a message and wait for the reply, n times."""
+    ping = make_channel(buffer, 1)
+    pong = make_channel(buffer, 1)
+
+    async def player():
+        put = pong.put
+        async for msg in ping:
+            await put(msg)
+        pong.close()
+
+    task = create_task(player())
+    put = ping.put
+    take = pong.take
+    rtts = []
+    start = perf_counter()
+    for x in range(n):
+        sent = perf_counter()
+        await put(x)
+        await take()
+        rtts.append(perf_counter() - sent)
+    elapsed = perf_counter() - start
+    ping.close()
+    await task
+
+    result = {'seconds': elapsed}
+    result.update((f'{k}_us', v * 1e6) for k, v in percentiles(rtts).items())
+    return result
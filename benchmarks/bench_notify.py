@@ -0,0 +1,76 @@
+"""
+Measure readiness notification overhead on offer() and poll().
+
+Run from the repository root:
+
+    $ python -m benchmarks.bench_notify
+"""
+
+from asyncio import create_task, gather, run, sleep
+from time import perf_counter
+
+from asyncio_channel import create_channel
+
+from ._suite import benchmark
+
+N = 100_000
+SIZE = 16
+REPEAT = 5
+
+
+@benchmark(N)
+def offer_poll(n):
+    """offer() and poll() in a loop with nobody waiting."""
+    ch = create_channel(SIZE)
+    offer = ch.offer
+    poll = ch.poll
+    start = perf_counter()
+    for _ in range(n // SIZE):
+        for x in range(SIZE):
+            offer(x)
+        for _ in range(SIZE):
+            poll()
+    return perf_counter() - start
+
+
+@benchmark(N, waiters=(1, 8, 100))
+async def put_to_waiters(n, waiters):
+    """Put items while many consumers are blocked on item()."""
+    ch = create_channel(SIZE)
+
+    async def consume():
+        item = ch.item
+        poll = ch.poll
+        while await item():
+            poll()
+
+    async def produce():
+        put = ch.put
+        for x in range(n):
+            await put(x)
+            if not x % SIZE:
+                # Let consumers run between bursts.
+                await sleep(0)
+        ch.close()
+
+    tasks = [create_task(consume()) for _ in range(waiters)]
+    await sleep(0)
+    start = perf_counter()
+    await produce()
+    await gather(*tasks)
+    return perf_counter() - start
+
+
+def report(name, elapsed, n=N):
+    print(f'{name:<24} {elapsed:8.3f}s {elapsed / n * 1e9:8.0f}ns/item')
+
+
+def main():
+    report('offer/poll', min(offer_poll(N) for _ in range(REPEAT)))
+    for waiters in (1, 8, 100):
+        report(f'put to {waiters} waiters',
+               min(run(put_to_waiters(N, waiters)) for _ in range(REPEAT)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,72 @@
+"""
+Compare an unbuffered channel with a buffered channel plus an ack channel.
+
+Both give a producer that only proceeds once the consumer has its item.
+
+Run from the repository root:
+
+    $ python -m benchmarks.bench_rendezvous
+"""
+
+from asyncio import create_task, gather, run
+from time import perf_counter
+
+from asyncio_channel import create_channel
+
+from ._suite import benchmark
+
+N = 100_000
+
+
+@benchmark(N)
+async def rendezvous(n):
+    ch = create_channel(0)
+
+    async def produce():
+        put = ch.put
+        for x in range(n):
+            await put(x)
+        ch.close()
+
+    async def consume():
+        async for _ in ch:
+            pass
+
+    start = perf_counter()
+    await gather(create_task(produce()), create_task(consume()))
+    return perf_counter() - start
+
+
+@benchmark(N)
+async def ack_channel(n):
+    ch = create_channel(1)
+    ack = create_channel(1)
+
+    async def produce():
+        put = ch.put
+        take = ack.take
+        for x in range(n):
+            await put(x)
+            await take()
+        ch.close()
+
+    async def consume():
+        put = ack.put
+        async for _ in ch:
+            await put(True)
+
+    start = perf_counter()
+    await gather(create_task(produce()), create_task(consume()))
+    return perf_counter() - start
+
+
+def main():
+    for name, bench in (('unbuffered', rendezvous),
+                        ('buffered + ack', ack_channel)):
+        elapsed = run(bench(N))
+        print(f'{name:<16} {elapsed:8.3f}s '
+              f'{elapsed / N * 1e6:8.2f}us/handoff')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,105 @@
+"""
+Measure moving items from a child process onto the event loop.
+
+Compares create_shared_channel() with a multiprocessing.Queue, read by the
+event loop through a thread.
+
+Run from the repository root:
+
+    $ python -m benchmarks.bench_shared
+"""
+
+from asyncio import get_running_loop, run
+from multiprocessing import get_context
+from time import perf_counter
+
+from asyncio_channel import create_shared_channel
+
+from ._suite import benchmark
+
+N = 100_000
+REPEAT = 3
+
+ctx = get_context('fork')
+
+
+def produce_shared(ch, n):
+    async def main():
+        put = ch.put
+        for x in range(n):
+            await put(('item', x))
+        ch.close()
+    run(main())
+
+
+def produce_queue(q, n):
+    put = q.put
+    for x in range(n):
+        put(('item', x))
+    put(None)
+
+
+@benchmark(N)
+async def shared_channel(n):
+    ch = create_shared_channel(1 << 20)
+    p = ctx.Process(target=produce_shared, args=(ch, n))
+    start = perf_counter()
+    p.start()
+    async for _ in ch:
+        pass
+    elapsed = perf_counter() - start
+    p.join()
+    ch.unlink()
+    return elapsed
+
+
+# Not registered, as it is too slow to run as part of the suite.
+async def multiprocessing_queue(n):
+    loop = get_running_loop()
+    q = ctx.Queue(10_000)
+    p = ctx.Process(target=produce_queue, args=(q, n))
+    start = perf_counter()
+    p.start()
+    get = q.get
+    while await loop.run_in_executor(None, get) is not None:
+        pass
+    elapsed = perf_counter() - start
+    p.join()
+    return elapsed
+
+
+@benchmark(N)
+async def multiprocessing_queue_batched(n):
+    """Drain everything available per executor call, to be fair."""
+    loop = get_running_loop()
+    q = ctx.Queue(10_000)
+    p = ctx.Process(target=produce_queue, args=(q, n))
+
+    def get_batch():
+        xs = [q.get()]
+        while not q.empty() and xs[-1] is not None:
+            xs.append(q.get())
+        return xs
+
+    start = perf_counter()
+    p.start()
+    while (await loop.run_in_executor(None, get_batch))[-1] is not None:
+        pass
+    elapsed = perf_counter() - start
+    p.join()
+    return elapsed
+
+
+def report(name, elapsed, n=N):
+    print(f'{name:<24} {elapsed:8.3f}s {elapsed / n * 1e9:8.0f}ns/item')
+
+
+def main():
+    for name, bench in [('shared channel', shared_channel),
+                        ('mp.Queue', multiprocessing_queue),
+                        ('mp.Queue batched', multiprocessing_queue_batched)]:
+        report(name, min(run(bench(N)) for _ in range(REPEAT)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,72 @@
+"""
+Measure the cost of channel statistics.
+
+A channel created without stats is a plain Channel, so its hot path is
+the same code whether or not statistics exist.
+
+Run from the repository root:
+
+    $ python -m benchmarks.bench_stats
+"""
+
+from asyncio import create_task, run
+from time import perf_counter
+
+from asyncio_channel import create_channel
+from asyncio_channel._channel import Channel
+
+from ._suite import benchmark
+
+N = 100_000
+SIZE = 16
+REPEAT = 5
+
+
+@benchmark(N, stats=(False, True))
+def offer_poll(n, stats):
+    ch = create_channel(SIZE, stats=stats)
+    offer = ch.offer
+    poll = ch.poll
+    start = perf_counter()
+    for _ in range(n // SIZE):
+        for x in range(SIZE):
+            offer(x)
+        for _ in range(SIZE):
+            poll()
+    return perf_counter() - start
+
+
+@benchmark(N, stats=(False, True))
+async def put_take(n, stats):
+    ch = create_channel(SIZE, stats=stats)
+
+    async def produce():
+        put = ch.put
+        for x in range(n):
+            await put(x)
+        ch.close()
+
+    start = perf_counter()
+    task = create_task(produce())
+    async for _ in ch:
+        pass
+    await task
+    return perf_counter() - start
+
+
+def report(name, elapsed, n=N):
+    print(f'{name:<24} {elapsed:8.3f}s {elapsed / n * 1e9:8.0f}ns/item')
+
+
+def main():
+    assert type(create_channel(stats=False)) is Channel
+    for stats in (False, True):
+        label = 'stats' if stats else 'plain'
+        report(f'offer/poll {label}',
+               min(offer_poll(N, stats) for _ in range(REPEAT)))
+        report(f'put/take {label}',
+               min(run(put_take(N, stats)) for _ in range(REPEAT)))
+
+
+if __name__ == '__main__':
+    main()
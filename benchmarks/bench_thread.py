@@ -0,0 +1,113 @@
+"""
+Measure moving items from a thread onto the event loop.
+
+Compares create_threadsafe_channel() with a two-sided queue that wakes the
+event loop once per item, in the style of janus.  janus itself is measured
+too when it is installed.
+
+Run from the repository root:
+
+    $ python -m benchmarks.bench_thread
+"""
+
+from asyncio import Queue, get_running_loop, run
+from threading import BoundedSemaphore
+from time import perf_counter
+
+from asyncio_channel import create_threadsafe_channel
+
+from ._suite import benchmark
+
+try:
+    import janus
+except ImportError:
+    janus = None
+
+N = 100_000
+SIZE = 1024
+REPEAT = 3
+
+
+@benchmark(N)
+async def threadsafe_channel(n):
+    ch = create_threadsafe_channel(SIZE)
+
+    def produce():
+        put = ch.put_blocking
+        for x in range(n):
+            put(x)
+        ch.close_threadsafe()
+
+    start = perf_counter()
+    producer = get_running_loop().run_in_executor(None, produce)
+    async for _ in ch:
+        pass
+    await producer
+    return perf_counter() - start
+
+
+@benchmark(N)
+async def per_item_wakeup(n):
+    """A semaphore bounds the thread; each put is one call_soon_threadsafe."""
+    loop = get_running_loop()
+    q = Queue()
+    slots = BoundedSemaphore(SIZE)
+
+    def produce():
+        acquire = slots.acquire
+        call = loop.call_soon_threadsafe
+        put = q.put_nowait
+        for x in range(n):
+            acquire()
+            call(put, x)
+        call(put, None)
+
+    start = perf_counter()
+    producer = loop.run_in_executor(None, produce)
+    get = q.get
+    release = slots.release
+    while await get() is not None:
+        release()
+    await producer
+    return perf_counter() - start
+
+
+async def janus_queue(n):
+    q = janus.Queue(SIZE)
+
+    def produce():
+        put = q.sync_q.put
+        for x in range(n):
+            put(x)
+        put(None)
+
+    start = perf_counter()
+    producer = get_running_loop().run_in_executor(None, produce)
+    get = q.async_q.get
+    while await get() is not None:
+        pass
+    await producer
+    q.close()
+    await q.wait_closed()
+    return perf_counter() - start
+
+
+if janus is not None:
+    janus_queue = benchmark(N)(janus_queue)
+
+
+def report(name, elapsed, n=N):
+    print(f'{name:<24} {elapsed:8.3f}s {elapsed / n * 1e9:8.0f}ns/item')
+
+
+def main():
+    benches = [('threadsafe channel', threadsafe_channel),
+               ('per-item wakeup', per_item_wakeup)]
+    if janus is not None:
+        benches.append(('janus', janus_queue))
+    for name, bench in benches:
+        report(name, min(run(bench(N)) for _ in range(REPEAT)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,84 @@
+"""
+Measure throughput between producer and consumer coroutines.
+
+Run from the repository root:
+
+    $ python -m benchmarks -k throughput
+"""
+
+from asyncio import create_task, gather
+from time import perf_counter
+
+from ._suite import BUFFERS, benchmark, make_channel
+
+N = 100_000
+
+
+@benchmark(N, buffer=BUFFERS, size=(1, 64))
+async def spsc(n, buffer, size):
+    """One producer and one consumer."""
+    ch = make_channel(buffer, size)
+    received = 0
+
+    async def produce():
+        put = ch.put
+        for x in range(n):
+            await put(x)
+        ch.close()
+
+    async def consume():
+        nonlocal received
+        async for _ in ch:
+            received += 1
+
+    start = perf_counter()
+    await gather(create_task(produce()), create_task(consume()))
+    return {'seconds': perf_counter() - start, 'received': received}
+
+
+@benchmark(N, buffer=BUFFERS, max_items=(16, 256), max_delay=(None, 0.001))
+async def spsc_batches(n, buffer, max_items, max_delay):
+    """One producer, and one consumer reading with batches()."""
+    ch = make_channel(buffer, 1024)
+    received = 0
+
+    async def produce():
+        put = ch.put
+        for x in range(n):
+            await put(x)
+        ch.close()
+
+    async def consume():
+        nonlocal received
+        async for xs in ch.batches(max_items, max_delay=max_delay):
+            received += len(xs)
+
+    start = perf_counter()
+    await gather(create_task(produce()), create_task(consume()))
+    return {'seconds': perf_counter() - start, 'received': received}
+
+
+@benchmark(N, buffer=BUFFERS, producers=(1, 4, 16), consumers=(1, 4, 16))
+async def contention(n, buffer, producers, consumers, size=64):
+    """Several producers and consumers sharing one channel."""
+    ch = make_channel(buffer, size)
+    received = 0
+
+    async def produce(k):
+        put = ch.put
+        for x in range(k):
+            await put(x)
+
+    async def consume():
+        nonlocal received
+        async for _ in ch:
+            received += 1
+
+    start = perf_counter()
+    consumer_tasks = [create_task(consume()) for _ in range(consumers)]
+    await gather(*(produce(n // producers) for _ in range(producers)))
+    ch.close()
+    await gather(*consumer_tasks)
+    return {'seconds': perf_counter() - start,
+            'items': n // producers * producers,
+            'received': received}
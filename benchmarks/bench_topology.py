@@ -0,0 +1,423 @@
+"""
+Measure throughput through the combinators: chains, fan-in and fan-out.
+
+Run from the repository root:
+
+    $ python -m benchmarks -k topology
+"""
+
+from asyncio import create_task, gather, sleep
+from concurrent.futures import ProcessPoolExecutor
+from operator import add, sub
+from time import perf_counter
+
+from asyncio_channel import (complete_one, create_channel, create_mix,
+                             create_multiple, create_pipeline,
+                             create_publication, create_selector, map,
+                             map_batches, merge, onto_channel, partition,
+                             pipe, split, window_reduce)
+
+from ._suite import BUFFERS, benchmark, drained, make_channel
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+N = 10_000
+SIZE = 64
+WIDTHS = (2, 8, 32)
+
+
+async def _produce(ch, n, *, close=True):
+    put = ch.put
+    for x in range(n):
+        await put(x)
+    if close:
+        ch.close()
+
+
+async def _count(ch):
+    n = 0
+    async for _ in ch:
+        n += 1
+    return n
+
+
+def _spin(x):
+    """About 20us of CPU-bound work, picklable for a process pool."""
+    for _ in range(500):
+        x = (x * 31 + 7) % 1_000_003
+    return x
+
+
+@benchmark(N * 10, size=(SIZE, N * 10))
+async def onto(n, size):
+    """A list copied onto a channel by onto_channel(), drained in bulk."""
+    xs = list(range(n))
+    ch = make_channel('blocking', size)
+
+    start = perf_counter()
+    onto_channel(xs, ch)
+    received = 0
+    async for batch in ch.batches(size):
+        received += len(batch)
+    return {'seconds': perf_counter() - start, 'received': received}
+
+
+@benchmark(N, stage=('map', 'pipeline'))
+async def fused_chain(n, stage):
+    """Five x + 1 stages, chained map() calls or a fused pipeline."""
+    src = make_channel('blocking', SIZE)
+    if stage == 'map':
+        out = src
+        for _ in range(5):
+            out = map(lambda x: x + 1, (out,), SIZE)
+    else:
+        p = create_pipeline(src)
+        for _ in range(5):
+            p = p.map(lambda x: x + 1)
+        out = p.channel(SIZE)
+
+    start = perf_counter()
+    consumer = create_task(_count(out))
+    await _produce(src, n)
+    received = await consumer
+    return {'seconds': perf_counter() - start, 'received': received}
+
+
+@benchmark(N, stage=('map', 'xform'))
+async def xform_chain(n, stage):
+    """An x + 1 stage, as map() or as a channel's xform, copied in bulk."""
+    xs = list(range(n))
+    if stage == 'map':
+        src = make_channel('blocking', SIZE)
+        out = map(lambda x: x + 1, (src,), SIZE)
+    else:
+        out = src = create_channel(SIZE, xform=lambda xs: [x + 1 for x in xs])
+
+    start = perf_counter()
+    onto_channel(xs, src)
+    received = 0
+    async for batch in out.batches(SIZE):
+        received += len(batch)
+    return {'seconds': perf_counter() - start, 'received': received}
+
+
+@benchmark(N, buffer=BUFFERS, depth=(1, 4, 16))
+async def pipe_chain(n, buffer, depth):
+    """Items pass through a chain of depth pipes."""
+    chs = [make_channel(buffer, SIZE) for _ in range(depth + 1)]
+    for src, dest in zip(chs, chs[1:]):
+        pipe(src, dest)
+
+    start = perf_counter()
+    _, received = await gather(_produce(chs[0], n), _count(chs[-1]))
+    return {'seconds': perf_counter() - start, 'received': received}
+
+
+@benchmark(N, buffer=BUFFERS, width=WIDTHS)
+async def merge_in(n, buffer, width):
+    """Producers on width channels, merged into one."""
+    chs = [make_channel(buffer, SIZE) for _ in range(width)]
+    out = merge(chs, BUFFERS[buffer](SIZE))
+
+    start = perf_counter()
+    consumer = create_task(_count(out))
+    await gather(*(_produce(ch, n // width) for ch in chs))
+    received = await consumer
+    return {'seconds': perf_counter() - start,
+            'items': n // width * width, 'received': received}
+
+
+@benchmark(N, buffer=BUFFERS, width=WIDTHS)
+async def merge_batch_in(n, buffer, width):
+    """Producers on width channels, merged into one in batches."""
+    chs = [make_channel(buffer, SIZE) for _ in range(width)]
+    out = merge(chs, BUFFERS[buffer](SIZE), batch=True, max_batch=SIZE)
+
+    async def count_batches():
+        received = 0
+        while True:
+            xs = await out.take_many(SIZE)
+            if not xs:
+                return received
+            received += len(xs)
+
+    start = perf_counter()
+    consumer = create_task(count_batches())
+    await gather(*(_produce(ch, n // width) for ch in chs))
+    received = await consumer
+    return {'seconds': perf_counter() - start,
+            'items': n // width * width, 'received': received}
+
+
+@benchmark(N, buffer=BUFFERS, width=WIDTHS)
+async def map_in(n, buffer, width):
+    """Producers on width channels, zipped and mapped into one."""
+    chs = [make_channel(buffer, SIZE) for _ in range(width)]
+    out = map(lambda *xs: xs[0], chs, BUFFERS[buffer](SIZE))
+
+    start = perf_counter()
+    consumer = create_task(_count(out))
+    await gather(*(_produce(ch, n) for ch in chs))
+    received = await consumer
+    return {'seconds': perf_counter() - start, 'received': received}
+
+
+@benchmark(N // 10, concurrency=(1, 8, 64), ordered=(True, False))
+async def map_async(n, concurrency, ordered):
+    """A coroutine function, which waits 100us, mapped over a channel."""
+    async def fn(x):
+        await sleep(0.0001)
+        return x
+
+    src = make_channel('blocking', SIZE)
+    out = map(fn, (src,), SIZE, concurrency=concurrency, ordered=ordered)
+
+    start = perf_counter()
+    consumer = create_task(_count(out))
+    await _produce(src, n)
+    received = await consumer
+    return {'seconds': perf_counter() - start, 'received': received}
+
+
+@benchmark(N, chunksize=(0, 1, 64), concurrency=(1, 4))
+async def map_executor(n, chunksize, concurrency):
+    """A CPU-bound function mapped over a channel in a process pool.
+
+    chunksize 0 maps in the event loop, without an executor.
+    """
+    src = make_channel('blocking', SIZE)
+    with ProcessPoolExecutor(concurrency) as executor:
+        if chunksize:
+            out = map(_spin, (src,), SIZE, executor=executor,
+                      chunksize=chunksize, concurrency=concurrency)
+        else:
+            out = map(_spin, (src,), SIZE)
+        # Start the workers before timing.
+        executor.submit(_spin, 0).result()
+
+        start = perf_counter()
+        consumer = create_task(_count(out))
+        await _produce(src, n)
+        received = await consumer
+        return {'seconds': perf_counter() - start, 'received': received}
+
+
+@benchmark(N, stage=('map', 'batches') + (('array',) if numpy else ()),
+           batch_size=(16, 256))
+async def map_batches_in(n, stage, batch_size):
+    """x * 2 + 1 mapped per item with map(), or per batch with map_batches().
+
+    batch_size does not apply to map().
+    """
+    src = make_channel('blocking', SIZE)
+    if stage == 'map':
+        out = map(lambda x: x * 2 + 1, (src,), SIZE)
+    elif stage == 'batches':
+        out = map_batches(lambda xs: [x * 2 + 1 for x in xs], src, SIZE,
+                          batch_size=batch_size)
+    else:
+        out = map_batches(lambda xs: xs * 2 + 1, src, SIZE,
+                          batch_size=batch_size, as_array=True)
+
+    start = perf_counter()
+    consumer = create_task(_count(out))
+    await _produce(src, n)
+    received = await consumer
+    return {'seconds': perf_counter() - start, 'received': received}
+
+
+@benchmark(N, buffer=BUFFERS, width=WIDTHS)
+async def mix_in(n, buffer, width):
+    """Producers on width channels, mixed into one."""
+    chs = [make_channel(buffer, SIZE) for _ in range(width)]
+    out = make_channel(buffer, SIZE)
+    m = create_mix(out)
+    for ch in chs:
+        m.add_input(ch)
+
+    start = perf_counter()
+    consumer = create_task(_count(out))
+    await gather(*(_produce(ch, n // width, close=False) for ch in chs))
+    # A mix does not close its output, so wait for it to pass everything
+    # on first.
+    await drained(out, *chs)
+    out.close()
+    received = await consumer
+    return {'seconds': perf_counter() - start,
+            'items': n // width * width, 'received': received}
+
+
+@benchmark(N, buffer=BUFFERS, width=WIDTHS)
+async def multiple_out(n, buffer, width):
+    """Every item copied to width channels."""
+    src = make_channel(buffer, SIZE)
+    m = create_multiple(src)
+    outs = [make_channel(buffer, SIZE) for _ in range(width)]
+    for ch in outs:
+        m.add_output(ch)
+
+    start = perf_counter()
+    consumers = [create_task(_count(ch)) for ch in outs]
+    await _produce(src, n)
+    received = sum(await gather(*consumers))
+    return {'seconds': perf_counter() - start, 'received': received}
+
+
+@benchmark(N, buffer=BUFFERS, width=WIDTHS)
+async def publication_out(n, buffer, width):
+    """Items published to width topics, with one subscriber each."""
+    src = make_channel(buffer, SIZE)
+    p = create_publication(src, lambda x: x % width,
+                           n_or_buffer=BUFFERS[buffer](SIZE))
+    outs = [make_channel(buffer, SIZE) for _ in range(width)]
+    for topic, ch in enumerate(outs):
+        p.subscribe(topic, ch)
+
+    start = perf_counter()
+    consumers = [create_task(_count(ch)) for ch in outs]
+    await _produce(src, n)
+    received = sum(await gather(*consumers))
+    return {'seconds': perf_counter() - start, 'received': received}
+
+
+@benchmark(N, width=(2, 8), stage=('partition', 'split'))
+async def partition_out(n, width, stage):
+    """Items spread over width channels by key.
+
+    stage 'split' chains split() calls into a tree, as before partition().
+    """
+    src = make_channel('blocking', SIZE)
+    if stage == 'partition':
+        outs = partition(lambda x: x, src, width, SIZE).outputs
+    else:
+        outs = [src]
+        bit = 1
+        while len(outs) < width:
+            outs = [o for ch in outs
+                    for o in split(lambda x, bit=bit: x & bit, ch, SIZE, SIZE)]
+            bit <<= 1
+
+    start = perf_counter()
+    consumers = [create_task(_count(ch)) for ch in outs]
+    await _produce(src, n)
+    received = sum(await gather(*consumers))
+    return {'seconds': perf_counter() - start, 'received': received}
+
+
+@benchmark(N, count=(16, 1024), inverse=(False, True))
+async def window_sliding(n, count, inverse):
+    """A running sum over the last count items, at every item."""
+    src = make_channel('blocking', SIZE)
+    out = window_reduce(add, src, 0, SIZE, count=count, slide=1,
+                        inverse=sub if inverse else None)
+
+    start = perf_counter()
+    consumer = create_task(_count(out))
+    await _produce(src, n)
+    received = await consumer
+    return {'seconds': perf_counter() - start, 'received': received}
+
+
+@benchmark(N, buffer=BUFFERS, width=WIDTHS)
+async def select(n, buffer, width):
+    """complete_one() over width channels, each with a producer."""
+    chs = [make_channel(buffer, SIZE) for _ in range(width)]
+
+    async def consume():
+        received = 0
+        open_chs = chs
+        while open_chs:
+            x, _ = await complete_one(*open_chs)
+            if x is None:
+                open_chs = [ch for ch in open_chs
+                            if not (ch.is_closed() and ch.empty())]
+            else:
+                received += 1
+        return received
+
+    start = perf_counter()
+    consumer = create_task(consume())
+    await gather(*(_produce(ch, n // width) for ch in chs))
+    received = await consumer
+    return {'seconds': perf_counter() - start,
+            'items': n // width * width, 'received': received}
+
+
+@benchmark(N, buffer=BUFFERS, width=WIDTHS)
+async def select_blocked(n, buffer, width):
+    """complete_one() over width channels, blocking for every item."""
+    chs = [make_channel(buffer, 1) for _ in range(width)]
+
+    async def produce():
+        for x in range(n):
+            await chs[x % width].put(x)
+        for ch in chs:
+            ch.close()
+
+    async def consume():
+        received = 0
+        while True:
+            x, _ = await complete_one(*chs)
+            if x is None:
+                return received
+            received += 1
+
+    start = perf_counter()
+    consumer = create_task(consume())
+    await produce()
+    received = await consumer
+    return {'seconds': perf_counter() - start, 'received': received}
+
+
+@benchmark(N, buffer=BUFFERS, width=WIDTHS)
+async def selector_blocked(n, buffer, width):
+    """A selector over width channels, blocking for every item."""
+    chs = [make_channel(buffer, 1) for _ in range(width)]
+    s = create_selector(*chs)
+
+    async def produce():
+        for x in range(n):
+            await chs[x % width].put(x)
+        for ch in chs:
+            ch.close()
+
+    async def consume():
+        received = 0
+        while True:
+            x, _ = await s.select()
+            if x is None:
+                return received
+            received += 1
+
+    start = perf_counter()
+    consumer = create_task(consume())
+    await produce()
+    received = await consumer
+    return {'seconds': perf_counter() - start, 'received': received}
+
+
+@benchmark(N, idle=(10, 100, 1000), via=('complete_one', 'selector'))
+async def select_idle(n, idle, via):
+    """Select over one busy channel and many idle ones."""
+    busy = make_channel('blocking', 1)
+    chs = [busy] + [make_channel('blocking', 1) for _ in range(idle)]
+    if via == 'selector':
+        select = create_selector(*chs).select
+    else:
+        async def select():
+            return await complete_one(*chs)
+
+    async def produce():
+        put = busy.put
+        for x in range(n):
+            await put(x)
+
+    start = perf_counter()
+    producer = create_task(produce())
+    for _ in range(n):
+        await select()
+    await producer
+    return perf_counter() - start
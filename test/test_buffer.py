@@ -1,4 +1,6 @@
-from asyncio_channel._buffer import create_blocking_buffer
+from asyncio_channel._buffer import create_blocking_buffer, \
+                                    create_dropping_buffer, \
+                                    create_sliding_buffer
 
 import asyncio
 import pytest
@@ -9,9 +11,13 @@ def test_blocking_buffer():
     WHEN
         n is a positive integer.
     EXPECT
-        Returns an asyncio.Queue.
+        Returns an empty buffer with maxsize n.
     """
-    assert isinstance(create_blocking_buffer(1), asyncio.Queue)
+    buf = create_blocking_buffer(1)
+    assert buf.maxsize == 1
+    assert buf.empty()
+    assert not buf.full()
+    assert buf.qsize() == 0
 
 def test_blocking_buffer_not_int():
     """
@@ -23,7 +29,105 @@ def test_blocking_buffer_not_int():
     with pytest.raises(TypeError):
         create_blocking_buffer('a')
 
-def test_blocking_buffer_nonpositive_int():
+def test_blocking_buffer_negative_int():
+    """
+    WHEN
+        n is a negative integer.
+    EXPECT
+        Throws a ValueError.
+    """
+    with pytest.raises(ValueError):
+        create_blocking_buffer(-1)
+
+def test_blocking_buffer_zero():
+    """
+    WHEN
+        n is zero.
+    EXPECT
+        Returns a buffer that is both empty and full.
+    """
+    buf = create_blocking_buffer(0)
+    assert buf.empty()
+    assert buf.full()
+
+def test_blocking_buffer_fifo():
+    """
+    GIVEN
+        Buffer is not full.
+    WHEN
+        Put items, then get them.
+    EXPECT
+        Items are returned in the order they were added.
+    """
+    buf = create_blocking_buffer(2)
+    buf.put_nowait('a')
+    buf.put_nowait('b')
+    assert buf.qsize() == 2
+    assert buf.get_nowait() == 'a'
+    assert buf.get_nowait() == 'b'
+
+def test_blocking_buffer_full():
+    """
+    GIVEN
+        Buffer is full.
+    WHEN
+        Put an item.
+    EXPECT
+        Raises QueueFull.
+    """
+    buf = create_blocking_buffer(1)
+    buf.put_nowait('a')
+    assert buf.full()
+    with pytest.raises(asyncio.QueueFull):
+        buf.put_nowait('b')
+    assert buf.get_nowait() == 'a'
+
+def test_blocking_buffer_empty():
+    """
+    GIVEN
+        Buffer is empty.
+    WHEN
+        Get an item.
+    EXPECT
+        Raises QueueEmpty.
+    """
+    buf = create_blocking_buffer(1)
+    with pytest.raises(asyncio.QueueEmpty):
+        buf.get_nowait()
+
+def test_dropping_buffer_put_nowait():
+    """
+    GIVEN
+        Buffer is not full.
+    WHEN
+        Put an item.
+    EXPECT
+        Item is added.
+    """
+    buf = create_dropping_buffer(1)
+    a = 'a'
+    buf.put_nowait(a)
+    assert buf.get_nowait() == a
+
+def test_dropping_buffer_put_nowait_full():
+    """
+    GIVEN
+        Buffer is full.
+    WHEN
+        Put an item.
+    EXPECT
+        Item is dropped.
+    """
+    buf = create_dropping_buffer(1)
+    a = 'a'
+    buf.put_nowait(a)
+    assert not buf.full()
+    b = 'b'
+    buf.put_nowait(b)
+    assert buf.qsize() == 1
+    assert buf.get_nowait() == a
+
+def test_dropping_buffer_nonpositive_int():
     """
     WHEN
         n is a non-positive integer.
@@ -31,4 +135,96 @@ def test_blocking_buffer_nonpositive_int():
         Throws a ValueError.
     """
     with pytest.raises(ValueError):
-        create_blocking_buffer(0)
+        create_dropping_buffer(0)
+
+def test_sliding_buffer_put_nowait():
+    """
+    GIVEN
+        Buffer is not full.
+    WHEN
+        Put an item.
+    EXPECT
+        Item is added.
+    """
+    buf = create_sliding_buffer(1)
+    a = 'a'
+    buf.put_nowait(a)
+    assert buf.get_nowait() == a
+
+def test_sliding_buffer_put_nowait_full():
+    """
+    GIVEN
+        Buffer is full.
+    WHEN
+        Put an item.
+    EXPECT
+        Item is added and the oldest item is discarded.
+    """
+    buf = create_sliding_buffer(2)
+    for x in ('a', 'b', 'c'):
+        buf.put_nowait(x)
+    assert not buf.full()
+    assert buf.qsize() == 2
+    assert buf.get_nowait() == 'b'
+    assert buf.get_nowait() == 'c'
+
+def test_sliding_buffer_nonpositive_int():
+    """
+    WHEN
+        n is a non-positive integer.
+    EXPECT
+        Throws a ValueError.
+    """
+    with pytest.raises(ValueError):
+        create_sliding_buffer(0)
+
+def test_blocking_buffer_many():
+    """
+    GIVEN
+        Buffer has room for the items.
+    WHEN
+        Put many items, then get many.
+    EXPECT
+        Items are returned in order; get is bounded by the items
+        available.
+    """
+    buf = create_blocking_buffer(3)
+    buf.put_many_nowait(['a', 'b'])
+    assert buf.get_many_nowait(5) == ['a', 'b']
+    assert buf.get_many_nowait(5) == []
+
+def test_blocking_buffer_many_full():
+    """
+    GIVEN
+        Buffer lacks room for the items.
+    WHEN
+        Put many items.
+    EXPECT
+        Raises QueueFull and adds nothing.
+    """
+    buf = create_blocking_buffer(2)
+    with pytest.raises(asyncio.QueueFull):
+        buf.put_many_nowait(['a', 'b', 'c'])
+    assert buf.empty()
+
+def test_dropping_buffer_many():
+    """
+    WHEN
+        Put more items than the buffer holds.
+    EXPECT
+        The newest items are dropped.
+    """
+    buf = create_dropping_buffer(2)
+    buf.put_many_nowait(['a', 'b', 'c'])
+    assert buf.get_many_nowait(3) == ['a', 'b']
+
+def test_sliding_buffer_many():
+    """
+    WHEN
+        Put more items than the buffer holds.
+    EXPECT
+        The oldest items are discarded.
+    """
+    buf = create_sliding_buffer(2)
+    buf.put_many_nowait(['a', 'b', 'c'])
+    assert buf.get_many_nowait(3) == ['b', 'c']
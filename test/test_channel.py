@@ -1,3 +1,4 @@
+from asyncio_channel import create_channel, create_sliding_buffer
 from asyncio_channel._channel import Channel
 
 import asyncio
@@ -668,3 +669,894 @@ async def test_aiter():
     async for x in ch:
         buf.append(x)
     assert buf == xs
+
+@pytest.mark.asyncio
+async def test_offer_hands_to_taker():
+    """
+    GIVEN
+        Channel is open and empty, and a coroutine is blocked on take.
+    WHEN
+        Offered an item.
+    EXPECT
+        The item is given directly to the blocked taker, bypassing the
+        queue.
+    """
+    q = asyncio.Queue(1)
+    ch = Channel(q)
+    x = 'x'
+    task = asyncio.create_task(ch.take())
+    await asyncio.sleep(0)
+    assert ch.offer(x)
+    assert q.empty()
+    assert await asyncio.wait_for(task, timeout=0.05) == x
+
+@pytest.mark.asyncio
+async def test_take_fifo():
+    """
+    GIVEN
+        Channel is open and empty, and several coroutines are blocked
+        on take.
+    WHEN
+        Items are offered.
+    EXPECT
+        Takers receive items in the order they blocked.
+    """
+    q = asyncio.Queue(1)
+    ch = Channel(q)
+    tasks = [asyncio.create_task(ch.take()) for _ in range(3)]
+    await asyncio.sleep(0)
+    for x in ('a', 'b', 'c'):
+        assert ch.offer(x)
+    results = await asyncio.wait_for(asyncio.gather(*tasks), timeout=0.05)
+    assert results == ['a', 'b', 'c']
+
+@pytest.mark.asyncio
+async def test_put_fifo():
+    """
+    GIVEN
+        Channel is open and full, and several coroutines are blocked
+        on put.
+    WHEN
+        Items are polled.
+    EXPECT
+        Puts complete, and their items are queued, in the order they
+        blocked.
+    """
+    q = asyncio.Queue(1)
+    ch = Channel(q)
+    assert ch.offer('a')
+    tasks = [asyncio.create_task(ch.put(x)) for x in ('b', 'c')]
+    await asyncio.sleep(0)
+    assert [ch.poll(), ch.poll(), ch.poll()] == ['a', 'b', 'c']
+    assert await asyncio.wait_for(asyncio.gather(*tasks), timeout=0.05) \
+        == [True, True]
+
+@pytest.mark.asyncio
+async def test_take_cancelled_skipped():
+    """
+    GIVEN
+        Channel is open and empty, and two coroutines are blocked on
+        take.
+    WHEN
+        The first taker is cancelled, then an item is offered.
+    EXPECT
+        The second taker receives the item.
+    """
+    q = asyncio.Queue(1)
+    ch = Channel(q)
+    first = asyncio.create_task(ch.take())
+    second = asyncio.create_task(ch.take())
+    await asyncio.sleep(0)
+    first.cancel()
+    await asyncio.sleep(0)
+    x = 'x'
+    assert ch.offer(x)
+    assert await asyncio.wait_for(second, timeout=0.05) == x
+
+@pytest.mark.asyncio
+async def test_close_unblocks_put_and_take():
+    """
+    GIVEN
+        Coroutines blocked on put and take of full and empty channels.
+    WHEN
+        The channels are closed.
+    EXPECT
+        Put returns False and take returns the default value.
+    """
+    full = Channel(asyncio.Queue(1))
+    full.offer('a')
+    empty = Channel(asyncio.Queue(1))
+    put = asyncio.create_task(full.put('b'))
+    take = asyncio.create_task(empty.take(default='d'))
+    await asyncio.sleep(0)
+    full.close()
+    empty.close()
+    assert not await asyncio.wait_for(put, timeout=0.05)
+    assert await asyncio.wait_for(take, timeout=0.05) == 'd'
+    assert full.poll() == 'a'
+
+def test_offer_many():
+    """
+    GIVEN
+        Channel has capacity for some of the items.
+    WHEN
+        Offered many items.
+    EXPECT
+        Items are added until the channel is full, and the remaining
+        items are not taken from the iterator.
+    """
+    ch = create_channel(3)
+    it = iter(range(1, 6))
+    assert ch.offer_many(it) == 3
+    assert ch.full()
+    assert next(it) == 4
+    assert ch.poll_many(10) == [1, 2, 3]
+
+def test_offer_many_closed():
+    """
+    GIVEN
+        Channel is closed.
+    WHEN
+        Offered many items.
+    EXPECT
+        Nothing is added and returns 0.
+    """
+    ch = create_channel(3)
+    ch.close()
+    assert ch.offer_many([1, 2]) == 0
+    assert ch.empty()
+
+def test_offer_many_none():
+    """
+    GIVEN
+        Channel has capacity.
+    WHEN
+        Offered many items, one of which is None.
+    EXPECT
+        Items preceding None are added and raises ValueError.
+    """
+    ch = create_channel(5)
+    with pytest.raises(ValueError,
+            match='None is not allowed on channel'):
+        ch.offer_many([1, 2, None, 3])
+    assert ch.poll_many(5) == [1, 2]
+
+def test_offer_many_sliding():
+    """
+    GIVEN
+        Channel with a sliding buffer.
+    WHEN
+        Offered more items than it holds.
+    EXPECT
+        All items are accepted, and the newest are kept.
+    """
+    ch = create_channel(create_sliding_buffer(2))
+    assert ch.offer_many(range(1, 6)) == 5
+    assert ch.poll_many(5) == [4, 5]
+
+def test_poll_many_admits_putters():
+    """
+    GIVEN
+        Channel is full and has no blocked putters.
+    WHEN
+        Polled for fewer items than it holds.
+    EXPECT
+        Returns that many items, oldest first.
+    """
+    ch = create_channel(3)
+    ch.offer_many('abc')
+    assert ch.poll_many(2) == ['a', 'b']
+    assert ch.poll_many(2) == ['c']
+    assert ch.poll_many(2) == []
+
+@pytest.mark.asyncio
+async def test_poll_many_blocked_putters():
+    """
+    GIVEN
+        Channel is full and coroutines are blocked on put.
+    WHEN
+        Polled for many items.
+    EXPECT
+        Blocked puts are admitted in order as slots free up.
+    """
+    ch = create_channel(2)
+    ch.offer_many('ab')
+    tasks = [asyncio.create_task(ch.put(x)) for x in 'cd']
+    await asyncio.sleep(0)
+    assert ch.poll_many(10) == ['a', 'b', 'c', 'd']
+    assert await asyncio.wait_for(asyncio.gather(*tasks), timeout=0.05) \
+        == [True, True]
+
+@pytest.mark.asyncio
+async def test_offer_many_hands_to_takers():
+    """
+    GIVEN
+        Channel is empty and coroutines are blocked on take.
+    WHEN
+        Offered many items.
+    EXPECT
+        Takers receive the first items, the rest are buffered.
+    """
+    ch = create_channel(2)
+    tasks = [asyncio.create_task(ch.take()) for _ in range(2)]
+    await asyncio.sleep(0)
+    assert ch.offer_many('abcd') == 4
+    assert await asyncio.wait_for(asyncio.gather(*tasks), timeout=0.05) \
+        == ['a', 'b']
+    assert ch.poll_many(5) == ['c', 'd']
+
+@pytest.mark.asyncio
+async def test_put_many():
+    """
+    GIVEN
+        Channel is full.
+    WHEN
+        Put many items, and an item is polled while blocked.
+    EXPECT
+        Returns once at least one item was added.
+    """
+    ch = create_channel(1)
+    ch.offer('a')
+    asyncio.get_running_loop().call_later(0.05, ch.poll)
+    assert await asyncio.wait_for(ch.put_many('bc'), timeout=0.1) == 1
+    assert ch.poll() == 'b'
+
+@pytest.mark.asyncio
+async def test_put_many_all():
+    """
+    GIVEN
+        Channel has less capacity than items.
+    WHEN
+        Put many items with all=True, while a consumer takes them.
+    EXPECT
+        Returns once all items were added.
+    """
+    ch = create_channel(2)
+    xs = list(range(1, 11))
+    taken = []
+    async def consume():
+        async for x in ch:
+            taken.append(x)
+    task = asyncio.create_task(consume())
+    assert await asyncio.wait_for(ch.put_many(xs, all=True),
+                                  timeout=0.1) == len(xs)
+    ch.close()
+    await asyncio.wait_for(task, timeout=0.05)
+    assert taken == xs
+
+@pytest.mark.asyncio
+async def test_put_many_timeout():
+    """
+    GIVEN
+        Channel is full.
+    WHEN
+        Put many items and a timeout is given.
+    EXPECT
+        Returns 0.
+    """
+    ch = create_channel(1)
+    ch.offer('a')
+    assert await ch.put_many('bc', timeout=0.05) == 0
+    assert ch.poll_many(2) == ['a']
+
+@pytest.mark.asyncio
+async def test_take_many():
+    """
+    GIVEN
+        Channel is empty.
+    WHEN
+        Take many items, and items are offered while blocked.
+    EXPECT
+        Returns available items once at least one is present.
+    """
+    ch = create_channel(3)
+    asyncio.get_running_loop().call_later(0.05, ch.offer_many, 'ab')
+    assert await asyncio.wait_for(ch.take_many(5), timeout=0.1) \
+        == ['a', 'b']
+
+@pytest.mark.asyncio
+async def test_take_many_all_closed():
+    """
+    GIVEN
+        Channel is open.
+    WHEN
+        Take many items with all=True, and the channel is closed before
+        enough items arrive.
+    EXPECT
+        Returns the items that arrived.
+    """
+    ch = create_channel(3)
+    ch.offer('a')
+    asyncio.get_running_loop().call_later(0.05, ch.close)
+    assert await asyncio.wait_for(ch.take_many(5, all=True),
+                                  timeout=0.1) == ['a']
+
+@pytest.mark.asyncio
+async def test_take_many_timeout():
+    """
+    GIVEN
+        Channel is empty.
+    WHEN
+        Take many items and a timeout is given.
+    EXPECT
+        Returns an empty list.
+    """
+    ch = create_channel(3)
+    assert await ch.take_many(5, timeout=0.05) == []
+
+def test_unbuffered_offer():
+    """
+    GIVEN
+        Unbuffered channel with no blocked takers.
+    WHEN
+        Offered an item.
+    EXPECT
+        The item is not added and offer returns False.
+    """
+    ch = create_channel(0)
+    assert not ch.offer('x')
+    assert ch.poll() is None
+
+@pytest.mark.asyncio
+async def test_unbuffered_put_waits_for_take():
+    """
+    GIVEN
+        Unbuffered channel.
+    WHEN
+        Put an item.
+    EXPECT
+        Put blocks until the item is taken, and the item is taken
+        directly from the putter.
+    """
+    ch = create_channel(0)
+    x = 'x'
+    put = asyncio.create_task(ch.put(x))
+    await asyncio.sleep(0.01)
+    assert not put.done()
+    assert not ch.empty()
+    assert await asyncio.wait_for(ch.take(), timeout=0.05) == x
+    assert await asyncio.wait_for(put, timeout=0.05)
+    assert ch.empty()
+
+@pytest.mark.asyncio
+async def test_unbuffered_offer_to_taker():
+    """
+    GIVEN
+        Unbuffered channel with a blocked taker.
+    WHEN
+        Offered an item.
+    EXPECT
+        The taker receives the item.
+    """
+    ch = create_channel(0)
+    take = asyncio.create_task(ch.take())
+    await asyncio.sleep(0)
+    assert not ch.full()
+    x = 'x'
+    assert ch.offer(x)
+    assert await asyncio.wait_for(take, timeout=0.05) == x
+    assert ch.full()
+
+@pytest.mark.asyncio
+async def test_unbuffered_put_timeout():
+    """
+    GIVEN
+        Unbuffered channel.
+    WHEN
+        Put an item, and nothing takes it before the timeout.
+    EXPECT
+        Put returns False and the item is withdrawn.
+    """
+    ch = create_channel(0)
+    assert not await ch.put('x', timeout=0.05)
+    assert ch.empty()
+    assert ch.poll() is None
+
+@pytest.mark.asyncio
+async def test_unbuffered_item_capacity():
+    """
+    GIVEN
+        Unbuffered channel.
+    WHEN
+        Wait for item while a put blocks, and for capacity while a take
+        blocks.
+    EXPECT
+        Both unblock and return True.
+    """
+    ch = create_channel(0)
+    asyncio.get_running_loop().call_later(
+        0.02, asyncio.ensure_future, ch.put('a'))
+    assert await ch.item(timeout=0.1)
+    assert ch.poll_many(5) == ['a']
+    asyncio.get_running_loop().call_later(
+        0.02, asyncio.ensure_future, ch.take())
+    assert await ch.capacity(timeout=0.1)
+    assert ch.offer('b')
+
+@pytest.mark.asyncio
+async def test_unbuffered_aiter():
+    """
+    GIVEN
+        Unbuffered channel.
+    WHEN
+        A producer puts items and then closes the channel, while a
+        consumer iterates.
+    EXPECT
+        Consumer receives every item in order.
+    """
+    ch = create_channel(0)
+    xs = ['a', 'b', 'c']
+    async def produce():
+        for x in xs:
+            assert await ch.put(x)
+        ch.close()
+    task = asyncio.create_task(produce())
+    taken = []
+    async for x in ch:
+        taken.append(x)
+    await asyncio.wait_for(task, timeout=0.05)
+    assert taken == xs
+
+@pytest.mark.asyncio
+async def test_take_deadline():
+    """
+    GIVEN
+        Channel is open and empty.
+    WHEN
+        Take an item with a deadline.
+    EXPECT
+        Returns default once the loop time reaches the deadline.
+    """
+    ch = create_channel()
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + 0.05
+    x = 'x'
+    assert await ch.take(deadline=deadline, default=x) == x
+    assert loop.time() >= deadline
+
+@pytest.mark.asyncio
+async def test_put_take_shared_deadline():
+    """
+    GIVEN
+        A full channel and an empty channel.
+    WHEN
+        Put then take, sharing one deadline.
+    EXPECT
+        The time spent blocked in put reduces the time left for take.
+    """
+    full = create_channel()
+    full.offer('a')
+    empty = create_channel()
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    deadline = start + 0.1
+    loop.call_later(0.05, full.poll)
+    assert await full.put('b', deadline=deadline)
+    assert await empty.take(deadline=deadline) is None
+    assert 0.1 <= loop.time() - start < 0.15
+
+@pytest.mark.asyncio
+async def test_timeout_and_deadline():
+    """
+    GIVEN
+        Channel is open and full.
+    WHEN
+        Put an item with a timeout and a later deadline.
+    EXPECT
+        The earlier of the two applies.
+    """
+    ch = create_channel()
+    ch.offer('a')
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    assert not await ch.put('b', timeout=0.05, deadline=start + 10)
+    assert loop.time() - start < 1
+
+@pytest.mark.asyncio
+async def test_deadline_passed():
+    """
+    GIVEN
+        Channel is open and empty.
+    WHEN
+        Take an item with a deadline that has passed.
+    EXPECT
+        Returns default without registering a waiter.
+    """
+    ch = create_channel()
+    loop = asyncio.get_running_loop()
+    assert await ch.take(deadline=loop.time() - 1) is None
+    assert not ch._takers
+
+@pytest.mark.asyncio
+async def test_item_deadline_spans_rewaits():
+    """
+    GIVEN
+        Channel is open and empty.
+    WHEN
+        Wait for an item with a timeout, while another consumer takes
+        each item that arrives.
+    EXPECT
+        Returns False once the timeout elapses overall.
+    """
+    ch = create_channel()
+    loop = asyncio.get_running_loop()
+    async def steal():
+        while not ch.is_closed():
+            await ch.take()
+    task = asyncio.create_task(steal())
+    for i in range(1, 4):
+        loop.call_later(0.03 * i, ch.offer, i)
+    start = loop.time()
+    assert not await ch.item(timeout=0.05)
+    assert loop.time() - start < 0.09
+    ch.close()
+    await asyncio.wait_for(task, timeout=0.05)
+
+@pytest.mark.asyncio
+async def test_item_batch_wakeup():
+    """
+    GIVEN
+        Channel is open and empty, and several coroutines are awaiting
+        an item and then take it.
+    WHEN
+        Multiple items are offered in one event loop iteration.
+    EXPECT
+        As many coroutines unblock as there are items, the rest remain
+        blocked.
+    """
+    ch = create_channel(5)
+    async def take_item():
+        if await ch.item():
+            return ch.poll()
+    tasks = [asyncio.create_task(take_item()) for _ in range(4)]
+    await asyncio.sleep(0)
+    assert ch.offer_many('ab') == 2
+    assert ch.offer('c')
+    done, pending = await asyncio.wait(tasks, timeout=0.05)
+    assert sorted(t.result() for t in done) == ['a', 'b', 'c']
+    assert len(pending) == 1
+    ch.close()
+    assert await asyncio.wait_for(pending.pop(), timeout=0.05) is None
+
+@pytest.mark.asyncio
+async def test_stats():
+    """
+    GIVEN
+        Channel is created with stats enabled.
+    WHEN
+        Items are offered, put, polled and taken, including while full
+        or empty.
+    EXPECT
+        stats() counts the items, rejections and blocked calls.
+    """
+    ch = create_channel(2, stats=True)
+    assert ch.offer('a')
+    assert ch.offer_many('bc') == 1
+    assert not ch.offer('d')
+    loop = asyncio.get_running_loop()
+    loop.call_later(0.02, ch.poll)
+    assert await ch.put('d', timeout=0.5)
+    assert ch.poll_many(5) == ['b', 'd']
+    loop.call_later(0.02, ch.offer, 'e')
+    assert await ch.item(timeout=0.5)
+    assert await ch.take() == 'e'
+    loop.call_later(0.02, ch.offer, 'f')
+    assert await ch.take(timeout=0.5) == 'f'
+    ch.close()
+    stats = ch.stats()
+    assert stats['items_in'] == stats['items_out'] == 5
+    assert stats['offers_rejected'] == 1
+    assert stats['puts_blocked'] == 1
+    assert stats['takes_blocked'] == 1
+    assert stats['high_water'] == 2
+    assert stats['item_wait_time'] >= 0.01
+    assert stats['closed_at'] is not None
+    assert 'in=5' in repr(ch)
+
+@pytest.mark.asyncio
+async def test_stats_unbuffered():
+    """
+    GIVEN
+        Unbuffered channel is created with stats enabled.
+    WHEN
+        Items pass from blocked puts to polls and takes.
+    EXPECT
+        stats() counts the items.
+    """
+    ch = create_channel(0, stats=True)
+    tasks = [asyncio.create_task(ch.put(x)) for x in 'ab']
+    await asyncio.sleep(0)
+    assert ch.poll() == 'a'
+    assert await ch.take() == 'b'
+    await asyncio.gather(*tasks)
+    stats = ch.stats()
+    assert stats['items_in'] == stats['items_out'] == 2
+    assert stats['puts_blocked'] == 2
+    assert stats['high_water'] == 0
+
+def test_stats_disabled():
+    """
+    WHEN
+        Channel is created without stats.
+    EXPECT
+        It is a plain Channel, without a stats() method.
+    """
+    ch = create_channel()
+    assert type(ch) is Channel
+    assert not hasattr(ch, 'stats')
+
+@pytest.mark.asyncio
+async def test_finished_waiters_purged():
+    """
+    WHEN
+        Many take() and put() calls time out on an idle channel.
+    EXPECT
+        Their waiters do not accumulate.
+    """
+    ch = create_channel()
+    for _ in range(1000):
+        assert await ch.take(timeout=0) is None
+        assert await ch.take(timeout=0.0001) is None
+    assert len(ch._takers) < 128
+    ch.offer('x')
+    for _ in range(1000):
+        assert not await ch.put('y', timeout=0.0001)
+    assert len(ch._putters) < 128
+
+@pytest.mark.asyncio
+async def test_batches():
+    """
+    WHEN
+        Iterate over batches() without max_delay.
+    EXPECT
+        Lists of the items available, up to max_items, then a final partial
+        list once the channel is closed.
+    """
+    ch = create_channel(10)
+    ch.offer_many(range(5))
+    it = ch.batches(2)
+    assert await it.__anext__() == [0, 1]
+    assert await it.__anext__() == [2, 3]
+    assert await it.__anext__() == [4]
+    asyncio.get_running_loop().call_later(0.01, ch.offer, 5)
+    assert await asyncio.wait_for(it.__anext__(), timeout=0.1) == [5]
+    ch.offer(6)
+    ch.close()
+    assert [xs async for xs in it] == [[6]]
+
+@pytest.mark.asyncio
+async def test_batches_max_delay():
+    """
+    WHEN
+        Iterate over batches() with max_delay, as items arrive.
+    EXPECT
+        A list is returned once full, once max_delay passes after its first
+        item, or once the channel is closed.
+    """
+    ch = create_channel(0)
+    loop = asyncio.get_running_loop()
+    it = ch.batches(3, max_delay=0.05)
+
+    async def produce(xs, delay):
+        for x in xs:
+            await ch.put(x)
+            await asyncio.sleep(delay)
+
+    task = asyncio.create_task(produce(range(4), 0.001))
+    assert await asyncio.wait_for(it.__anext__(), timeout=0.1) == [0, 1, 2]
+    start = loop.time()
+    assert await asyncio.wait_for(it.__anext__(), timeout=0.1) == [3]
+    assert loop.time() - start >= 0.04
+    await task
+
+    loop.call_later(0.01, ch.close)
+    task = asyncio.create_task(produce('a', 0))
+    assert await asyncio.wait_for(it.__anext__(), timeout=0.04) == ['a']
+    with pytest.raises(StopAsyncIteration):
+        await it.__anext__()
+
+@pytest.mark.asyncio
+async def test_batches_closed_after_item():
+    """
+    GIVEN
+        A batch with a first item, waiting up to max_delay for more.
+    WHEN
+        A last item is added and the channel closed in the same step.
+    EXPECT
+        The batch is returned once the channel is closed, without waiting
+        for max_delay.
+    """
+    ch = create_channel(10)
+    it = ch.batches(10, max_delay=2.0)
+
+    def finish():
+        ch.offer('b')
+        ch.close()
+
+    loop = asyncio.get_running_loop()
+    loop.call_later(0.01, ch.offer, 'a')
+    loop.call_later(0.02, finish)
+    assert await asyncio.wait_for(it.__anext__(), timeout=0.1) == ['a', 'b']
+    with pytest.raises(StopAsyncIteration):
+        await it.__anext__()
+
+def test_batches_invalid():
+    """
+    WHEN
+        batches() is given an invalid max_items or max_delay.
+    EXPECT
+        Raises ValueError.
+    """
+    ch = create_channel()
+    with pytest.raises(ValueError):
+        ch.batches(0)
+    with pytest.raises(ValueError):
+        ch.batches(1, max_delay=-1)
+
+def _evens_doubled(xs):
+    return [x * 2 for x in xs if x % 2 == 0]
+
+def test_xform_offer():
+    """
+    GIVEN
+        Channel is created with an xform which filters and maps.
+    WHEN
+        Items are offered, including while full.
+    EXPECT
+        Only transformed items are buffered, dropped items are accepted
+        without using capacity, and every item is rejected while full.
+    """
+    ch = create_channel(2, xform=_evens_doubled)
+    assert ch.offer(1)
+    assert ch.offer(2)
+    assert ch.offer(4)
+    assert ch.full()
+    assert not ch.offer(3)
+    assert not ch.offer(6)
+    assert ch.poll_many(5) == [4, 8]
+    with pytest.raises(ValueError):
+        ch.offer(None)
+
+def test_xform_offer_many():
+    """
+    GIVEN
+        Channel is created with an xform which filters and maps.
+    WHEN
+        More items are offered than fit.
+    EXPECT
+        Items are taken until the channel is full, and transformed in bulk.
+    """
+    calls = []
+
+    def xform(xs):
+        calls.append(len(xs))
+        return _evens_doubled(xs)
+
+    ch = create_channel(3, xform=xform)
+    it = iter(range(10))
+    assert ch.offer_many(it) == 5
+    assert ch.poll_many(5) == [0, 4, 8]
+    assert next(it) == 5
+    assert calls == [3, 1, 1]
+
+@pytest.mark.asyncio
+async def test_xform_expand():
+    """
+    GIVEN
+        Channel is created with an xform which expands items.
+    WHEN
+        An expansion does not fit the buffer.
+    EXPECT
+        The item is accepted, and the rest of its expansion is added in
+        order as capacity frees up.
+    """
+    ch = create_channel(2, xform=lambda xs: [y for x in xs for y in x])
+    assert ch.offer('abc')
+    assert not ch.offer('d')
+    put = asyncio.create_task(ch.put('de'))
+    await asyncio.sleep(0)
+    assert not put.done()
+    taken = [await ch.take(timeout=0.05) for _ in range(5)]
+    assert taken == list('abcde')
+    assert await put
+
+@pytest.mark.asyncio
+async def test_xform_put_many():
+    """
+    GIVEN
+        Channel is created with an xform, and stats enabled.
+    WHEN
+        Items are put in bulk, and taken by a consumer.
+    EXPECT
+        Every transformed item arrives, in order.
+    """
+    ch = create_channel(4, stats=True, xform=_evens_doubled)
+
+    async def consume():
+        return [x async for x in ch]
+
+    task = asyncio.create_task(consume())
+    assert await ch.put_many(range(20), all=True) == 20
+    ch.close()
+    assert await asyncio.wait_for(task, timeout=0.1) == [
+        x * 2 for x in range(0, 20, 2)]
+    assert ch.stats()['items_in'] == 10
+
+@pytest.mark.asyncio
+async def test_xform_unbuffered():
+    """
+    GIVEN
+        Unbuffered channel is created with an xform.
+    WHEN
+        Items are put while a consumer takes them.
+    EXPECT
+        Items are transformed and handed over.
+    """
+    ch = create_channel(0, xform=_evens_doubled)
+    take = asyncio.create_task(ch.take())
+    await asyncio.sleep(0)
+    assert await ch.put(1)
+    assert await ch.put(2)
+    assert await asyncio.wait_for(take, timeout=0.05) == 4
+
+def test_xform_stats():
+    """
+    GIVEN
+        Channel is created with an xform, and stats enabled.
+    WHEN
+        Items are offered while full.
+    EXPECT
+        The rejected offers are counted, without calling xform.
+    """
+    calls = []
+
+    def xform(xs):
+        calls.append(xs)
+        return xs
+
+    ch = create_channel(1, stats=True, xform=xform)
+    assert ch.offer('a')
+    assert not ch.offer('b')
+    assert not ch.offer('c')
+    assert ch.stats()['offers_rejected'] == 2
+    assert ch.stats()['items_in'] == 1
+    assert calls == [['a']]
+
+def test_xform_offer_many_eq():
+    """
+    GIVEN
+        Channel is created with an xform.
+    WHEN
+        Items are offered in bulk which compare elementwise, as arrays do.
+    EXPECT
+        Items are added, as for a channel without xform.
+    """
+    class Elementwise:
+        def __eq__(self, other):
+            raise TypeError('ambiguous')
+
+    ch = create_channel(2, xform=lambda xs: xs)
+    xs = [Elementwise(), Elementwise()]
+    assert ch.offer_many(xs) == 2
+    assert ch.poll_many(2) == xs
+
+@pytest.mark.asyncio
+async def test_xform_put_blocked():
+    """
+    GIVEN
+        Full channel is created with an xform which expands items.
+    WHEN
+        A put() waits, and one times out.
+    EXPECT
+        The waiting put() is transformed, and the expansion of the timed
+        out put() is dropped with its first item.
+    """
+    ch = create_channel(1, xform=lambda xs: [y for x in xs for y in x])
+    assert ch.offer('a')
+    assert not await ch.put('xy', timeout=0.01)
+    put = asyncio.create_task(ch.put('bc'))
+    await asyncio.sleep(0)
+    taken = [await ch.take(timeout=0.05) for _ in range(3)]
+    assert taken == list('abc')
+    assert await put
+    assert ch.empty()
@@ -111,8 +111,8 @@ async def test_alts_multiple_ready_priority():
 async def test_alts_multiple_ready_first_fails():
     """
     WHEN
-        No ready ports and priority is True.  Multiple operations become
-        ready while blocked, but the first ready channel is closed.
+        No ready ports and priority is True.  The first channel is closed
+        while blocked, then the second becomes ready.
     EXPECT
         Return success and second channel.
     """
@@ -122,16 +122,16 @@ async def test_alts_multiple_ready_first_fails():
     b = 'b'
     ch2 = create_channel()
     ch2.offer(b)
-    def ready_both_close_ch1():
-        ch1.poll()
+    def close_ch1_ready_ch2():
         ch1.close()
         ch2.poll()
-    asyncio.get_running_loop().call_later(0.05, ready_both_close_ch1)
+    asyncio.get_running_loop().call_later(0.05, close_ch1_ready_ch2)
     c, d = 'c', 'd'
     out = await asyncio.wait_for(
         complete_one((ch1, c), (ch2, d), priority=True),
         timeout=0.1)
     assert out == (True, ch2)
+    assert ch1.poll() == a
     assert ch1.empty()
     assert ch2.poll() == d
 
@@ -139,9 +139,9 @@ async def test_alts_multiple_ready_first_fails():
 async def test_alts_multiple_ready_first_batch_fails():
     """
     WHEN
-        No ready ports.  Multiple operations become ready while blocked
-        but first batch of channels are closed. Later another batch of
-        channels become ready.
+        No ready ports.  A first batch of channels is closed while
+        blocked.  Later a third channel is closed and a fourth becomes
+        ready.
     EXPECT
         Return success and fourth channel.
     """
@@ -151,10 +151,8 @@ async def test_alts_multiple_ready_first_batch_fails():
     b = 'b'
     ch2 = create_channel()
     ch2.offer(b)
-    def ready_and_close_both():
-        ch1.poll()
+    def close_both():
         ch1.close()
-        ch2.poll()
         ch2.close()
     c = 'c'
     ch3 = create_channel()
@@ -162,18 +160,150 @@ async def test_alts_multiple_ready_first_batch_fails():
     d = 'd'
     ch4 = create_channel()
     ch4.offer(d)
-    def ready_and_close_ch3():
-        ch3.poll()
+    def close_ch3_ready_ch4():
         ch3.close()
         ch4.poll()
-    asyncio.get_running_loop().call_later(0.05, ready_and_close_both)
-    asyncio.get_running_loop().call_later(0.1, ready_and_close_ch3)
+    asyncio.get_running_loop().call_later(0.05, close_both)
+    asyncio.get_running_loop().call_later(0.1, close_ch3_ready_ch4)
     e, f, g, h = 'e', 'f', 'g', 'h'
     out = await asyncio.wait_for(
         complete_one((ch1, e), (ch2, f), (ch3, g), (ch4, h)),
         timeout=0.15)
     assert out == (True, ch4)
-    assert ch1.empty()
-    assert ch2.empty()
-    assert ch3.empty()
+    assert ch1.poll() == a
+    assert ch2.poll() == b
+    assert ch3.poll() == c
     assert ch4.poll() == h
+
+@pytest.mark.asyncio
+async def test_alts_unbuffered():
+    """
+    WHEN
+        Operations on unbuffered channels, and a putter or taker
+        arrives while blocked.
+    EXPECT
+        The matching operation completes.
+    """
+    ch1 = create_channel(0)
+    ch2 = create_channel(0)
+    put = asyncio.create_task(ch2.put('x'))
+    out = await asyncio.wait_for(complete_one(ch1, ch2), timeout=0.1)
+    assert out == ('x', ch2)
+    assert await asyncio.wait_for(put, timeout=0.05)
+    take = asyncio.create_task(ch1.take())
+    out = await asyncio.wait_for(complete_one((ch1, 'y'), (ch2, 'z')),
+                                 timeout=0.1)
+    assert out == (True, ch1)
+    assert await asyncio.wait_for(take, timeout=0.05) == 'y'
+
+@pytest.mark.asyncio
+async def test_alts_commits_first_ready():
+    """
+    WHEN
+        No ready ports.  The first channel becomes ready and is then closed,
+        in the same callback that makes the second ready.
+    EXPECT
+        The first operation completes as soon as it can, the second does
+        not.
+    """
+    ch1 = create_channel()
+    ch1.offer('a')
+    ch2 = create_channel()
+    ch2.offer('b')
+    def ready_both_close_ch1():
+        ch1.poll()
+        ch1.close()
+        ch2.poll()
+    asyncio.get_running_loop().call_later(0.05, ready_both_close_ch1)
+    out = await asyncio.wait_for(
+        complete_one((ch1, 'c'), (ch2, 'd'), priority=True),
+        timeout=0.1)
+    assert out == (True, ch1)
+    assert ch1.poll() == 'c'
+    assert ch2.empty()
+
+@pytest.mark.asyncio
+async def test_alts_no_tasks():
+    """
+    WHEN
+        Blocked on many operations.
+    EXPECT
+        No tasks are created.
+    """
+    chs = [create_channel() for _ in range(50)]
+    n_tasks = len(asyncio.all_tasks())
+    asyncio.get_running_loop().call_later(0.01, chs[-1].offer, 'x')
+    assert len(asyncio.all_tasks()) == n_tasks
+    out = await asyncio.wait_for(complete_one(*chs), timeout=0.1)
+    assert out == ('x', chs[-1])
+    assert len(asyncio.all_tasks()) == n_tasks
+
+@pytest.mark.asyncio
+async def test_alts_all_closed():
+    """
+    WHEN
+        Every channel is closed, before or while blocked.
+    EXPECT
+        Return (None, None).
+    """
+    ch1 = create_channel()
+    ch1.close()
+    assert await complete_one(ch1, (ch1, 'x')) == (None, None)
+    ch2 = create_channel()
+    ch3 = create_channel()
+    ch3.offer('y')
+    def close_both():
+        ch2.close()
+        ch3.close()
+    asyncio.get_running_loop().call_later(0.05, close_both)
+    out = await asyncio.wait_for(complete_one(ch2, (ch3, 'z')), timeout=0.1)
+    assert out == (None, None)
+
+@pytest.mark.asyncio
+async def test_alts_cancelled():
+    """
+    WHEN
+        Blocked operations are cancelled, including after an item was
+        handed over.
+    EXPECT
+        The channels forget the operations, and the item is not lost.
+    """
+    ch1 = create_channel()
+    ch2 = create_channel()
+    ch2.offer('x')
+    task = asyncio.create_task(complete_one(ch1, (ch2, 'y')))
+    await asyncio.sleep(0)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    assert ch1.offer('z')
+    assert ch2.poll() == 'x'
+    assert ch2.empty()
+    assert ch1.poll() == 'z'
+
+    task = asyncio.create_task(complete_one(ch1, ch2))
+    await asyncio.sleep(0)
+    ch1.offer('a')
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    assert ch1.poll() == 'a'
+
+@pytest.mark.asyncio
+async def test_alts_xform():
+    """
+    GIVEN
+        A full channel created with an xform.
+    WHEN
+        A put operation blocks on it.
+    EXPECT
+        The item is transformed once added.
+    """
+    ch = create_channel(1, xform=lambda xs: [x * 2 for x in xs])
+    assert ch.offer(1)
+    task = asyncio.create_task(complete_one((ch, 5)))
+    await asyncio.sleep(0)
+    assert not task.done()
+    assert await ch.take(timeout=0.05) == 2
+    assert await asyncio.wait_for(task, timeout=0.05) == (True, ch)
+    assert await ch.take(timeout=0.05) == 10
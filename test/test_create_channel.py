@@ -33,15 +33,27 @@ def test_chan_buffer():
     buf = create_sliding_buffer(2)
     assert isinstance(create_channel(buf), Channel)
 
-def test_chan_nonpositive_int():
+def test_chan_zero():
     """
     WHEN
-        n is not a positive integer.
+        n is zero.
+    EXPECT
+        Return an unbuffered Channel, which is empty and full.
+    """
+    ch = create_channel(0)
+    assert isinstance(ch, Channel)
+    assert ch.empty()
+    assert ch.full()
+
+def test_chan_negative_int():
+    """
+    WHEN
+        n is a negative integer.
     EXPECT
         Throws a ValueError.
     """
     with pytest.raises(ValueError):
-        create_channel(0)
+        create_channel(-1)
 
 def test_chan_nonpositive_buffer():
     """
@@ -328,3 +328,31 @@ async def test_mute_restart():
     assert not ch1.empty()
     out.close()
     await asyncio.sleep(0.05)  # Give mix a chance to clean up.
+
+@pytest.mark.asyncio
+async def test_mix_no_mute():
+    """
+    GIVEN
+        A mix with an input channel which is not muted, so no input
+        channel is muted.
+    WHEN
+        Items are transfered, then the output channel is closed.
+    EXPECT
+        Neither task of the mix fails, and both end when output channel
+        is closed.
+    """
+    tasks = []
+
+    def create_task(coro):
+        tasks.append(asyncio.create_task(coro))
+
+    out = create_channel()
+    m = create_mix(out, _create_task=create_task)
+    ch = create_channel()
+    m.add_input(ch)
+    assert ch.offer('a')
+    assert await out.take(timeout=0.05) == 'a'
+    assert not any(t.done() for t in tasks)
+    out.close()
+    await asyncio.sleep(0.05)  # Give mix a chance to clean up.
+    assert all(t.done() and t.exception() is None for t in tasks)
@@ -0,0 +1,92 @@
+from asyncio_channel import create_channel, create_pipeline
+
+import asyncio
+import pytest
+
+
+@pytest.mark.asyncio
+async def test_pipeline():
+    """
+    GIVEN
+        map, filter and flat_map stages.
+    WHEN
+        Items are put on the input channel.
+    EXPECT
+        The items out of the last stage are put on the output channel, in
+        order, and it is closed with the input.
+    """
+    ch = create_channel(10)
+    out = (create_pipeline(ch)
+           .map(lambda x: x + 1)
+           .filter(lambda x: x % 2)
+           .flat_map(lambda x: [x] * x)
+           .channel(100))
+    ch.offer_many(range(6))
+    ch.close()
+    await asyncio.wait_for(out.closed(), timeout=0.05)
+    assert out.poll_many(100) == [1, 3, 3, 3, 5, 5, 5, 5, 5]
+
+@pytest.mark.asyncio
+async def test_pipeline_branch():
+    """
+    WHEN
+        Stages are added to a pipeline twice.
+    EXPECT
+        The pipeline is unchanged, each has its own stages.
+    """
+    ch = create_channel()
+    p = create_pipeline(ch).map(str)
+    assert len(p.map(len)) == 2
+    assert len(p.filter(bool)) == 2
+    assert len(p) == 1
+    ch.close()
+
+@pytest.mark.asyncio
+async def test_pipeline_onto():
+    """
+    GIVEN
+        An output channel, with close=False.
+    WHEN
+        The output channel is full.
+    EXPECT
+        Items are only taken while it has capacity, and it is not closed.
+    """
+    ch = create_channel(100)
+    ch.offer_many(range(100))
+    dest = create_channel(5)
+    create_pipeline(ch, max_batch=5).map(lambda x: -x).onto(dest, close=False)
+    await asyncio.sleep(0.01)
+    assert dest.poll_many(10) == [0, -1, -2, -3, -4]
+    assert ch._size() >= 90
+    ch.close()
+    assert not dest.is_closed()
+
+@pytest.mark.asyncio
+async def test_pipeline_split():
+    """
+    GIVEN
+        A map stage, and a split.
+    EXPECT
+        Items are mapped and sorted by the predicate.
+    """
+    ch = create_channel(10)
+    t_out, f_out = (create_pipeline(ch)
+                    .map(lambda x: x * 3)
+                    .split(lambda x: x % 2 == 0, 10, 10))
+    ch.offer_many(range(6))
+    ch.close()
+    await asyncio.wait_for(
+        asyncio.gather(t_out.closed(), f_out.closed()),
+        timeout=0.05)
+    assert t_out.poll_many(10) == [0, 6, 12]
+    assert f_out.poll_many(10) == [3, 9, 15]
+
+def test_pipeline_invalid():
+    """
+    WHEN
+        max_batch is not positive.
+    EXPECT
+        Raises ValueError.
+    """
+    with pytest.raises(ValueError):
+        create_pipeline(create_channel(), max_batch=0)
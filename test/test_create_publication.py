@@ -1,5 +1,6 @@
 from asyncio_channel import create_channel, create_publication
 
+from concurrent.futures import ThreadPoolExecutor
 import asyncio
 import operator
 import pytest
@@ -120,3 +121,29 @@ async def test_publication_unsubscribe_all_on_topic():
     assert b2_ch.empty()
     src.close()
     await asyncio.sleep(0.05)
+
+@pytest.mark.asyncio
+async def test_publication_executor():
+    """
+    GIVEN
+        topic_fn run in a thread pool executor, in small chunks.
+    WHEN
+        Items are put on src channel.
+    EXPECT
+        Items are put in order on their topic channels.
+    """
+    src = create_channel(10)
+    with ThreadPoolExecutor(2) as executor:
+        p = create_publication(src, operator.itemgetter('type'),
+                               executor=executor, chunksize=2,
+                               concurrency=2)
+        a_ch = create_channel(10)
+        b_ch = create_channel(10)
+        p.subscribe('a', a_ch)
+        p.subscribe('b', b_ch)
+        xs = [{'type': 'ab'[i % 2], 'value': i} for i in range(10)]
+        src.offer_many(xs)
+        src.close()
+        await asyncio.wait_for(a_ch.closed(), timeout=1)
+    assert a_ch.poll_many(10) == xs[::2]
+    assert b_ch.poll_many(10) == xs[1::2]
@@ -0,0 +1,196 @@
+from asyncio_channel import create_channel, create_selector
+
+import asyncio
+import pytest
+
+
+@pytest.mark.asyncio
+async def test_select_ready():
+    """
+    WHEN
+        Take and put operations are ready.
+    EXPECT
+        Complete them, as complete_one() would.
+    """
+    ch1 = create_channel()
+    ch2 = create_channel()
+    ch1.offer('a')
+    s = create_selector(ch1, (ch2, 'b'), priority=True)
+    assert len(s) == 2
+    assert await s.select() == ('a', ch1)
+    assert await s.select() == (True, ch2)
+    assert ch2.poll() == 'b'
+
+@pytest.mark.asyncio
+async def test_select_wait():
+    """
+    WHEN
+        No operation is ready, then one becomes ready.
+    EXPECT
+        Wait for it, and complete it.
+    """
+    ch1 = create_channel()
+    ch2 = create_channel()
+    ch2.offer('x')
+    s = create_selector(ch1, (ch2, 'y'))
+    asyncio.get_running_loop().call_later(0.01, ch1.offer, 'a')
+    assert await asyncio.wait_for(s.select(), timeout=0.1) == ('a', ch1)
+    asyncio.get_running_loop().call_later(0.01, ch2.poll)
+    assert await asyncio.wait_for(s.select(), timeout=0.1) == (True, ch2)
+    assert ch2.poll() == 'y'
+
+@pytest.mark.asyncio
+async def test_select_timeout():
+    """
+    WHEN
+        No operation becomes ready in time.
+    EXPECT
+        Return (None, None), and complete operations in later calls.
+    """
+    ch = create_channel()
+    s = create_selector(ch)
+    assert await s.select(timeout=0) == (None, None)
+    assert await s.select(timeout=0.01) == (None, None)
+    loop = asyncio.get_running_loop()
+    assert await s.select(deadline=loop.time() + 0.01) == (None, None)
+    ch.offer('x')
+    assert await s.select(timeout=0) == ('x', ch)
+
+@pytest.mark.asyncio
+async def test_select_round_robin():
+    """
+    WHEN
+        Several take operations stay ready.
+    EXPECT
+        They take turns.
+    """
+    chs = [create_channel(10) for _ in range(3)]
+    for ch in chs:
+        for x in range(3):
+            ch.offer(x)
+    s = create_selector(*chs)
+    out = [await s.select() for _ in range(9)]
+    assert out == [(x, ch) for x in range(3) for ch in chs]
+
+@pytest.mark.asyncio
+async def test_select_priority():
+    """
+    WHEN
+        Several take operations stay ready, and priority is True.
+    EXPECT
+        The first added is always completed first.
+    """
+    chs = [create_channel(10) for _ in range(3)]
+    for ch in reversed(chs):
+        for x in range(2):
+            ch.offer(x)
+    s = create_selector(*chs, priority=True)
+    out = [await s.select() for _ in range(6)]
+    assert out == [(x, ch) for ch in chs for x in range(2)]
+
+@pytest.mark.asyncio
+async def test_select_add_remove():
+    """
+    WHEN
+        Operations are added, replaced and removed.
+    EXPECT
+        Only the current operations are completed.
+    """
+    ch1 = create_channel()
+    ch2 = create_channel()
+    s = create_selector()
+    assert await s.select() == (None, None)
+    s.add(ch1)
+    s.add((ch2, 'a'))
+    s.add((ch2, 'b'))
+    assert len(s) == 2
+    assert await s.select() == (True, ch2)
+    assert ch2.poll() == 'b'
+    s.remove((ch2, 'b'))
+    s.remove(ch1)
+    s.remove(ch1)
+    assert len(s) == 0
+    ch1.offer('x')
+    assert await s.select() == (None, None)
+    s.add(ch1)
+    s.add(ch2)
+    s.remove_all()
+    assert len(s) == 0
+    assert ch1.poll() == 'x'
+    assert not ch1._item_waiters or all(w.done() for w in ch1._item_waiters)
+
+@pytest.mark.asyncio
+async def test_select_closed():
+    """
+    WHEN
+        Channels are closed, before or while waiting.
+    EXPECT
+        Their operations are removed, once a take has no items.
+    """
+    ch1 = create_channel()
+    ch2 = create_channel()
+    ch3 = create_channel()
+    ch1.offer('a')
+    ch1.close()
+    s = create_selector(ch1, ch2, (ch3, 'b'))
+    assert await s.select() == ('a', ch1)
+    assert await s.select() == (True, ch3)
+    def close_all():
+        ch2.close()
+        ch3.close()
+    asyncio.get_running_loop().call_later(0.01, close_all)
+    assert await asyncio.wait_for(s.select(), timeout=0.1) == (None, None)
+    assert len(s) == 0
+
+@pytest.mark.asyncio
+async def test_select_unbuffered():
+    """
+    WHEN
+        Operations on unbuffered channels, and a putter or taker arrives
+        while waiting.
+    EXPECT
+        The matching operation completes.
+    """
+    ch1 = create_channel(0)
+    ch2 = create_channel(0)
+    s = create_selector(ch1, (ch2, 'y'))
+    put = asyncio.create_task(ch1.put('x'))
+    assert await asyncio.wait_for(s.select(), timeout=0.1) == ('x', ch1)
+    assert await put
+    take = asyncio.create_task(ch2.take())
+    assert await asyncio.wait_for(s.select(), timeout=0.1) == (True, ch2)
+    assert await take == 'y'
+
+@pytest.mark.asyncio
+async def test_select_persistent():
+    """
+    WHEN
+        select() is called repeatedly over many idle channels.
+    EXPECT
+        Idle channels are registered once, not on every call.
+    """
+    chs = [create_channel() for _ in range(100)]
+    s = create_selector(*chs)
+    assert await s.select(timeout=0) == (None, None)
+    for i in range(10):
+        chs[0].offer(i)
+        assert await s.select() == (i, chs[0])
+    assert all(len(ch._item_waiters) == 1 for ch in chs)
+
+@pytest.mark.asyncio
+async def test_select_concurrent():
+    """
+    WHEN
+        select() is called while another call is waiting.
+    EXPECT
+        Raises RuntimeError.
+    """
+    s = create_selector(create_channel())
+    task = asyncio.create_task(s.select())
+    await asyncio.sleep(0)
+    with pytest.raises(RuntimeError):
+        await s.select()
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    assert await s.select(timeout=0) == (None, None)
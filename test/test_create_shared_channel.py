@@ -0,0 +1,158 @@
+from asyncio_channel import create_channel, create_shared_channel
+from asyncio_channel._channel import Channel
+from asyncio_channel._pipe import pipe
+
+import asyncio
+import multiprocessing
+import pickle
+import pytest
+
+fork = multiprocessing.get_context('fork')
+
+
+def produce(ch, n):
+    """Put n items on ch, from a child process, then close it."""
+    async def main():
+        for x in range(1, n + 1):
+            if not await ch.put(('item', x), timeout=5):
+                return
+        ch.close()
+    asyncio.run(main())
+
+def consume(ch, n, results):
+    """Take n items from ch, from a child process, then close it."""
+    async def main():
+        results.put([await ch.take(timeout=5) for _ in range(n)])
+        ch.close()
+    asyncio.run(main())
+
+@pytest.fixture
+def shared_channel():
+    chs = []
+    def create(*args, **kwargs):
+        ch = create_shared_channel(*args, **kwargs)
+        chs.append(ch)
+        return ch
+    yield create
+    for ch in chs:
+        ch.unlink()
+
+def test_create_shared_channel(shared_channel):
+    """
+    WHEN
+        Called.
+    EXPECT
+        Return a Channel.
+    """
+    assert isinstance(shared_channel(), Channel)
+
+def test_create_shared_channel_invalid():
+    """
+    WHEN
+        max_item_size does not fit twice in nbytes.
+    EXPECT
+        Raises ValueError.
+    """
+    with pytest.raises(ValueError):
+        create_shared_channel(64, max_item_size=64)
+    with pytest.raises(ValueError):
+        create_shared_channel(64, max_item_size=0)
+
+def test_offer_poll(shared_channel):
+    """
+    GIVEN
+        A shared channel used within one process.
+    WHEN
+        Items are offered until it is full, then polled.
+    EXPECT
+        Items are returned in order, and oversized items are rejected.
+    """
+    ch = shared_channel(256, max_item_size=32)
+    n = 0
+    while ch.offer(n):
+        n += 1
+    assert ch.full()
+    # The ring wraps around as items are removed and added.
+    polled = n * 3
+    for i in range(polled):
+        assert ch.poll() == i
+        while ch.offer(n):
+            n += 1
+    assert ch.poll_many(n) == list(range(polled, n))
+    assert ch.empty()
+    with pytest.raises(ValueError):
+        ch.offer('x' * 64)
+
+def test_pickle_peer(shared_channel):
+    """
+    WHEN
+        The end opened in another process is pickled.
+    EXPECT
+        Raises TypeError.
+    """
+    ch = shared_channel()
+    peer = pickle.loads(multiprocessing.reduction.ForkingPickler.dumps(ch))
+    with pytest.raises(TypeError):
+        multiprocessing.reduction.ForkingPickler.dumps(peer)
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('method', ['fork', 'spawn'])
+async def test_take_from_process(shared_channel, method):
+    """
+    GIVEN
+        A child process putting many items, then closing the channel.
+    WHEN
+        Iterating over the channel.
+    EXPECT
+        Receive every item in order, then iteration stops.
+    """
+    ch = shared_channel(1024)
+    n = 2000
+    p = multiprocessing.get_context(method).Process(target=produce,
+                                                    args=(ch, n))
+    p.start()
+    taken = [x async for x in ch]
+    await asyncio.get_running_loop().run_in_executor(None, p.join)
+    assert taken == [('item', x) for x in range(1, n + 1)]
+
+@pytest.mark.asyncio
+async def test_put_to_process(shared_channel):
+    """
+    GIVEN
+        A child process taking items.
+    WHEN
+        Putting more items than fit, then the child closes the channel.
+    EXPECT
+        The child receives every item, and a blocked put fails.
+    """
+    ch = shared_channel(256, max_item_size=32)
+    results = fork.SimpleQueue()
+    n = 100
+    p = fork.Process(target=consume, args=(ch, n, results))
+    p.start()
+    for x in range(n):
+        assert await ch.put(x, timeout=5)
+    await asyncio.wait_for(ch.closed(), timeout=5)
+    assert not await ch.put(n, timeout=5)
+    loop = asyncio.get_running_loop()
+    assert await loop.run_in_executor(None, results.get) == list(range(n))
+    await loop.run_in_executor(None, p.join)
+
+@pytest.mark.asyncio
+async def test_pipe_from_process(shared_channel):
+    """
+    GIVEN
+        A shared channel piped to a local channel.
+    WHEN
+        A child process puts items, then closes the shared channel.
+    EXPECT
+        The local channel receives every item, then is closed.
+    """
+    ch = shared_channel()
+    out = create_channel(4)
+    pipe(ch, out)
+    p = fork.Process(target=produce, args=(ch, 100))
+    p.start()
+    taken = [x async for x in out]
+    await asyncio.get_running_loop().run_in_executor(None, p.join)
+    assert taken == [('item', x) for x in range(1, 101)]
@@ -0,0 +1,165 @@
+from asyncio_channel import create_threadsafe_channel
+from asyncio_channel._channel import Channel
+
+import asyncio
+import pytest
+import threading
+
+
+def run_in_thread(fn, *args, **kwargs):
+    """Run fn in a new thread, return a future for its result."""
+    loop = asyncio.get_running_loop()
+    return loop.run_in_executor(None, lambda: fn(*args, **kwargs))
+
+@pytest.mark.asyncio
+async def test_create_threadsafe_channel():
+    """
+    WHEN
+        Called from a running event loop.
+    EXPECT
+        Return a Channel.
+    """
+    assert isinstance(create_threadsafe_channel(), Channel)
+    with pytest.raises(ValueError):
+        create_threadsafe_channel(-1)
+
+@pytest.mark.asyncio
+async def test_put_blocking():
+    """
+    GIVEN
+        A thread-safe channel with a small buffer.
+    WHEN
+        A thread puts many items and then closes the channel, while a
+        coroutine iterates over it.
+    EXPECT
+        The coroutine receives every item in order, then iteration stops.
+    """
+    ch = create_threadsafe_channel(4)
+    xs = list(range(1, 1001))
+    def produce():
+        for x in xs:
+            assert ch.put_blocking(x)
+        ch.close_threadsafe()
+    task = run_in_thread(produce)
+    taken = []
+    async for x in ch:
+        taken.append(x)
+    await asyncio.wait_for(task, timeout=1)
+    assert taken == xs
+
+@pytest.mark.asyncio
+async def test_put_blocking_coalesced():
+    """
+    GIVEN
+        A thread-safe channel with room for a burst of items.
+    WHEN
+        A thread puts the burst.
+    EXPECT
+        The event loop is woken far fewer times than there are items.
+    """
+    ch = create_threadsafe_channel(1000)
+    drains = []
+    drain = ch._drain
+    def count_drain():
+        drains.append(1)
+        drain()
+    ch._drain = count_drain
+    def produce():
+        for x in range(1, 1001):
+            ch.put_blocking(x)
+    await asyncio.wait_for(run_in_thread(produce), timeout=1)
+    await asyncio.sleep(0.01)
+    assert ch.poll_many(1000) == list(range(1, 1001))
+    assert len(drains) < 100
+
+@pytest.mark.asyncio
+async def test_put_blocking_timeout():
+    """
+    GIVEN
+        A thread-safe channel which is full and backed up.
+    WHEN
+        A thread puts an item with a timeout.
+    EXPECT
+        Returns False.
+    """
+    ch = create_threadsafe_channel(1)
+    ch.offer('a')
+    assert await run_in_thread(ch.put_blocking, 'b')
+    assert not await run_in_thread(ch.put_blocking, 'c', timeout=0.05)
+    assert ch.poll() == 'a'
+    await asyncio.sleep(0)
+    assert ch.poll() == 'b'
+    assert ch.empty()
+
+@pytest.mark.asyncio
+async def test_put_blocking_close():
+    """
+    GIVEN
+        A thread blocked putting on a backed up thread-safe channel.
+    WHEN
+        The channel is closed on the event loop.
+    EXPECT
+        The put returns False.
+    """
+    ch = create_threadsafe_channel(1)
+    ch.offer('a')
+    assert await run_in_thread(ch.put_blocking, 'b')
+    task = run_in_thread(ch.put_blocking, 'c')
+    await asyncio.sleep(0.05)
+    ch.close()
+    assert not await asyncio.wait_for(task, timeout=0.1)
+    assert not await run_in_thread(ch.put_blocking, 'd')
+
+@pytest.mark.asyncio
+async def test_take_blocking():
+    """
+    GIVEN
+        A thread-safe channel.
+    WHEN
+        A thread takes items while a coroutine puts them, and then the
+        channel is closed.
+    EXPECT
+        The thread receives the items, then the default value.
+    """
+    ch = create_threadsafe_channel()
+    def consume():
+        taken = []
+        while True:
+            x = ch.take_blocking(default='done')
+            if x == 'done':
+                return taken
+            taken.append(x)
+    task = run_in_thread(consume)
+    for x in 'abc':
+        assert await ch.put(x, timeout=0.5)
+    ch.close()
+    assert await asyncio.wait_for(task, timeout=0.5) == ['a', 'b', 'c']
+
+@pytest.mark.asyncio
+async def test_take_blocking_timeout():
+    """
+    GIVEN
+        An empty thread-safe channel.
+    WHEN
+        A thread takes an item with a timeout.
+    EXPECT
+        Returns the default value.
+    """
+    ch = create_threadsafe_channel()
+    x = 'x'
+    assert await run_in_thread(ch.take_blocking, timeout=0.05,
+                               default=x) == x
+
+@pytest.mark.asyncio
+async def test_blocking_on_loop_thread():
+    """
+    WHEN
+        Blocking methods are called from the event loop's thread.
+    EXPECT
+        Raises RuntimeError.
+    """
+    ch = create_threadsafe_channel()
+    with pytest.raises(RuntimeError):
+        ch.put_blocking('a')
+    with pytest.raises(RuntimeError):
+        ch.take_blocking()
@@ -1,4 +1,5 @@
-from asyncio_channel import create_channel, itermerge, iterzip
+from asyncio_channel import combine_latest, create_channel, itermerge, \
+                            iterzip, shield_from_close, shield_from_write
 
 import asyncio
 import itertools
@@ -19,7 +20,8 @@ async def test_itermerge():
         for x, ch in zip(seq, itertools.cycle(chs)):
             await ch.put(x)
             await asyncio.sleep(0.1 * random.random())
-        chs[0].close()
+        for ch in chs:
+            ch.close()
 
     ch1 = create_channel()
     ch2 = create_channel()
@@ -62,3 +64,268 @@ async def test_iterzip():
         if i == len(seq2):
             ch2.close()
     await asyncio.sleep(0.05)
+
+@pytest.mark.asyncio
+async def test_itermerge_unbuffered():
+    """
+    GIVEN
+        Multiple unbuffered input channels.
+    WHEN
+        Items put to each input channel.
+    EXPECT
+        An iteration for each item.
+    """
+    ch1 = create_channel(0)
+    ch2 = create_channel(0)
+    async def produce(ch, xs):
+        for x in xs:
+            await ch.put(x)
+        ch.close()
+    asyncio.create_task(produce(ch1, 'ab'))
+    asyncio.create_task(produce(ch2, 'xy'))
+    results = []
+    async for x in itermerge(ch1, ch2):
+        results.append(x)
+    assert sorted(results) == ['a', 'b', 'x', 'y']
+
+@pytest.mark.asyncio
+async def test_itermerge_closed():
+    """
+    GIVEN
+        Multiple input channels.
+    WHEN
+        Channels are closed one at a time, some with items left.
+    EXPECT
+        Iteration continues until all channels are closed and empty.
+    """
+    ch1 = create_channel(2)
+    ch2 = create_channel(2)
+    ch1.offer('a')
+    ch1.offer('b')
+    ch1.close()
+    results = []
+    async def close_ch2():
+        await asyncio.sleep(0.01)
+        ch2.offer('x')
+        await asyncio.sleep(0.01)
+        ch2.close()
+    asyncio.create_task(close_ch2())
+    async for x in itermerge(ch1, ch2):
+        results.append(x)
+    assert results == ['a', 'b', 'x']
+
+@pytest.mark.asyncio
+async def test_itermerge_round_robin():
+    """
+    GIVEN
+        Multiple input channels.
+    WHEN
+        Each channel has several items.
+    EXPECT
+        The channels take turns.
+    """
+    chs = [create_channel(3) for _ in range(3)]
+    for i, ch in enumerate(chs):
+        for j in range(3):
+            ch.offer((i, j))
+        ch.close()
+    results = [x async for x in itermerge(*chs)]
+    assert results == [(i, j) for j in range(3) for i in range(3)]
+
+@pytest.mark.asyncio
+async def test_itermerge_no_tasks():
+    """
+    GIVEN
+        Many input channels.
+    WHEN
+        Iterate while waiting for items.
+    EXPECT
+        No tasks are created.
+    """
+    chs = [create_channel() for _ in range(100)]
+    it = itermerge(*chs)
+    n_tasks = len(asyncio.all_tasks())
+    loop = asyncio.get_running_loop()
+    for i in range(3):
+        loop.call_soon(chs[-1].offer, i)
+        assert await it.__anext__() == i
+        assert len(asyncio.all_tasks()) == n_tasks
+
+@pytest.mark.asyncio
+async def test_itermerge_batch():
+    """
+    GIVEN
+        Multiple input channels, and batch is True.
+    WHEN
+        Items are available on several channels.
+    EXPECT
+        Each iteration returns every available item, up to max_batch.
+    """
+    ch1 = create_channel(5)
+    ch2 = create_channel(5)
+    ch1.offer_many('abc')
+    ch2.offer_many('xy')
+    it = itermerge(ch1, ch2, batch=True, max_batch=4)
+    assert await it.__anext__() == ['a', 'b', 'c', 'x']
+    assert await it.__anext__() == ['y']
+    asyncio.get_running_loop().call_later(0.01, ch2.offer, 'z')
+    assert await asyncio.wait_for(it.__anext__(), timeout=0.1) == ['z']
+    ch1.close()
+    ch2.close()
+    with pytest.raises(StopAsyncIteration):
+        await it.__anext__()
+    with pytest.raises(ValueError):
+        itermerge(ch1, batch=True, max_batch=0)
+
+@pytest.mark.asyncio
+async def test_itermerge_shielded():
+    """
+    GIVEN
+        Input channels shielded from close and from write.
+    WHEN
+        Items put to each input channel, while waiting on them.
+    EXPECT
+        An iteration for each item, stopped once the channels are closed.
+    """
+    ch1 = create_channel()
+    ch2 = create_channel()
+    loop = asyncio.get_running_loop()
+    loop.call_later(0.01, ch1.offer, 1)
+    loop.call_later(0.02, ch2.offer, 2)
+    loop.call_later(0.03, ch1.close)
+    loop.call_later(0.03, ch2.close)
+    results = []
+    async for x in itermerge(shield_from_close(ch1), shield_from_write(ch2)):
+        results.append(x)
+    assert results == [1, 2]
+
+@pytest.mark.asyncio
+async def test_iterzip_closed_while_waiting():
+    """
+    GIVEN
+        Multiple input channels, one with an item.
+    WHEN
+        The channel with an item is closed, then an empty channel is closed
+        while waiting on it.
+    EXPECT
+        Iteration stops once the empty channel is closed, and no tasks are
+        created.
+    """
+    ch1 = create_channel()
+    ch2 = create_channel()
+    ch1.offer('a')
+    ch1.close()
+    n_tasks = len(asyncio.all_tasks())
+    it = iterzip(ch1, ch2)
+    with pytest.raises(asyncio.TimeoutError):
+        await asyncio.wait_for(it.__anext__(), timeout=0.01)
+    asyncio.get_running_loop().call_later(0.01, ch2.close)
+    with pytest.raises(StopAsyncIteration):
+        await asyncio.wait_for(it.__anext__(), timeout=0.1)
+    assert len(asyncio.all_tasks()) == n_tasks
+
+@pytest.mark.asyncio
+async def test_iterzip_abandoned():
+    """
+    GIVEN
+        Long-lived input channels.
+    WHEN
+        Many zip iterators wait on them, then are abandoned after one
+        tuple.
+    EXPECT
+        The channels do not keep a close waiter for each iterator.
+    """
+    ch1 = create_channel()
+    ch2 = create_channel()
+    loop = asyncio.get_running_loop()
+    for i in range(1000):
+        ch1.offer(i)
+        loop.call_soon(ch2.offer, i)
+        async for zs in iterzip(ch1, ch2):
+            assert zs == (i, i)
+            break
+    assert len(ch1._close_waiters) <= 64
+    assert len(ch2._close_waiters) <= 64
+
+@pytest.mark.asyncio
+async def test_iterzip_shielded():
+    """
+    GIVEN
+        Multiple input channels, one shielded from close.
+    WHEN
+        Items put to each input channel, while waiting on them.
+    EXPECT
+        A tuple of the items, and iteration stops once the shielded
+        channel is closed.
+    """
+    ch1 = create_channel()
+    ch2 = create_channel()
+    it = iterzip(shield_from_close(ch1), ch2)
+    loop = asyncio.get_running_loop()
+    loop.call_later(0.01, ch1.offer, 7)
+    loop.call_later(0.02, ch2.offer, 1)
+    assert await asyncio.wait_for(it.__anext__(), timeout=0.1) == (7, 1)
+    loop.call_later(0.01, ch1.close)
+    with pytest.raises(StopAsyncIteration):
+        await asyncio.wait_for(it.__anext__(), timeout=0.1)
+
+@pytest.mark.asyncio
+async def test_iterzip_unbuffered():
+    """
+    GIVEN
+        Multiple unbuffered input channels.
+    WHEN
+        Items put to each input channel, one at a time.
+    EXPECT
+        A tuple of the items.
+    """
+    ch1 = create_channel(0)
+    ch2 = create_channel(0)
+    it = iterzip(ch1, ch2)
+    loop = asyncio.get_running_loop()
+    loop.call_later(0.01, asyncio.ensure_future, ch2.put('x'))
+    loop.call_later(0.02, asyncio.ensure_future, ch1.put('a'))
+    assert await asyncio.wait_for(it.__anext__(), timeout=0.1) == ('a', 'x')
+
+@pytest.mark.asyncio
+async def test_combine_latest():
+    """
+    GIVEN
+        A slow and a fast input channel.
+    WHEN
+        Items put on each channel.
+    EXPECT
+        Once both have an item, a tuple of the latest items for each item.
+        Iteration continues after the slow channel is closed, until both
+        are closed.
+    """
+    config = create_channel()
+    data = create_channel(10)
+    data.offer(1)
+    it = combine_latest(config, data)
+    asyncio.get_running_loop().call_later(0.01, config.offer, 'A')
+    assert await asyncio.wait_for(it.__anext__(), timeout=0.1) == ('A', 1)
+    data.offer(2)
+    assert await it.__anext__() == ('A', 2)
+    config.offer('B')
+    config.close()
+    data.offer(3)
+    data.close()
+    assert [xs async for xs in it] == [('B', 2), ('B', 3)]
+
+@pytest.mark.asyncio
+async def test_combine_latest_never_ready():
+    """
+    GIVEN
+        Multiple input channels.
+    WHEN
+        A channel is closed before it has an item.
+    EXPECT
+        Iteration stops.
+    """
+    ch1 = create_channel()
+    ch2 = create_channel(10)
+    ch1.close()
+    ch2.offer(1)
+    with pytest.raises(StopAsyncIteration):
+        await combine_latest(ch1, ch2).__anext__()
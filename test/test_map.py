@@ -1,8 +1,10 @@
 from asyncio_channel import create_channel, map
 
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 import asyncio
 import operator
 import pytest
+import threading
 
 
 @pytest.mark.asyncio
@@ -26,3 +28,175 @@ async def test_map():
     assert x == (a + b)
     ch1.close()
     await asyncio.wait_for(out.closed(), timeout=0.05)
+
+@pytest.mark.asyncio
+async def test_map_async():
+    """
+    GIVEN
+        A coroutine function.
+    WHEN
+        Items are put on the input channel.
+    EXPECT
+        The awaited results are put on the output channel.
+    """
+    async def double(x):
+        await asyncio.sleep(0)
+        return 2 * x
+
+    ch = create_channel(10)
+    ch.offer_many(range(5))
+    ch.close()
+    out = map(double, (ch,))
+    assert [x async for x in out] == [0, 2, 4, 6, 8]
+
+@pytest.mark.asyncio
+async def test_map_concurrent_ordered():
+    """
+    GIVEN
+        A coroutine function, concurrency 3 and ordered True.
+    WHEN
+        Calls finish out of order.
+    EXPECT
+        No more than 3 calls run at once, and results are put in input
+        order.
+    """
+    running = 0
+    most = 0
+
+    async def fn(x):
+        nonlocal running, most
+        running += 1
+        most = max(most, running)
+        await asyncio.sleep(0.01 * (x % 3))
+        running -= 1
+        return x
+
+    ch = create_channel(20)
+    ch.offer_many(range(12))
+    ch.close()
+    out = map(fn, (ch,), concurrency=3)
+    results = await asyncio.wait_for(out.take_many(20, all=True), timeout=1)
+    assert results == list(range(12))
+    assert most == 3
+
+@pytest.mark.asyncio
+async def test_map_concurrent_unordered():
+    """
+    GIVEN
+        A coroutine function, concurrency 3 and ordered False.
+    WHEN
+        Calls finish out of order.
+    EXPECT
+        Results are put in the order calls finish.
+    """
+    async def fn(x):
+        await asyncio.sleep(0.01 * (2 - x))
+        return x
+
+    ch = create_channel(3)
+    ch.offer_many(range(3))
+    ch.close()
+    out = map(fn, (ch,), concurrency=3, ordered=False)
+    results = await asyncio.wait_for(out.take_many(3, all=True), timeout=1)
+    assert results == [2, 1, 0]
+    await asyncio.wait_for(out.closed(), timeout=0.05)
+
+@pytest.mark.asyncio
+async def test_map_concurrent_backpressure():
+    """
+    GIVEN
+        A coroutine function, and concurrency 2.
+    WHEN
+        The output channel is not read.
+    EXPECT
+        Items stop being taken from the input channel.
+    """
+    calls = 0
+
+    async def fn(x):
+        nonlocal calls
+        calls += 1
+        return x
+
+    ch = create_channel(100)
+    ch.offer_many(range(100))
+    out = map(fn, (ch,), concurrency=2, ordered=False)
+    await asyncio.sleep(0.05)
+    assert calls < 10
+    assert out.full()
+    ch.close()
+
+def test_map_invalid():
+    """
+    WHEN
+        concurrency is not positive.
+    EXPECT
+        Raises ValueError.
+    """
+    with pytest.raises(ValueError):
+        map(operator.neg, (create_channel(),), concurrency=0)
+
+@pytest.mark.asyncio
+async def test_map_executor():
+    """
+    GIVEN
+        A thread pool executor, small chunks and concurrency 3.
+    WHEN
+        Items are put on two input channels.
+    EXPECT
+        fn runs in the executor, results are put in order.
+    """
+    ch1 = create_channel(100)
+    ch2 = create_channel(100)
+    ch1.offer_many(range(50))
+    ch2.offer_many(range(50))
+    ch1.close()
+    threads = set()
+
+    def fn(x, y):
+        threads.add(threading.get_ident())
+        return x + y
+
+    with ThreadPoolExecutor(3) as executor:
+        out = map(fn, (ch1, ch2), 100, executor=executor, chunksize=4,
+                  concurrency=3)
+        await asyncio.wait_for(out.closed(), timeout=1)
+    assert out.poll_many(100) == [2 * x for x in range(50)]
+    assert threading.get_ident() not in threads
+
+@pytest.mark.asyncio
+async def test_map_process_executor():
+    """
+    GIVEN
+        A process pool executor, and unordered.
+    WHEN
+        Items are put on the input channel.
+    EXPECT
+        Every result is put on the output channel.
+    """
+    ch = create_channel(100)
+    ch.offer_many(range(100))
+    ch.close()
+    with ProcessPoolExecutor(2) as executor:
+        out = map(operator.neg, (ch,), 100, executor=executor, chunksize=16,
+                  concurrency=2, ordered=False)
+        await asyncio.wait_for(out.closed(), timeout=5)
+    assert sorted(out.poll_many(100)) == sorted(-x for x in range(100))
+
+def test_map_executor_invalid():
+    """
+    WHEN
+        chunksize is not positive, or fn is a coroutine function with an
+        executor.
+    EXPECT
+        Raises ValueError.
+    """
+    async def fn(x):
+        return x
+
+    with ThreadPoolExecutor(1) as executor:
+        with pytest.raises(ValueError):
+            map(operator.neg, (create_channel(),), executor=executor,
+                chunksize=0)
+        with pytest.raises(ValueError):
+            map(fn, (create_channel(),), executor=executor)
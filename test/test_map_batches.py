@@ -0,0 +1,89 @@
+from asyncio_channel import create_channel, map_batches
+
+import asyncio
+import pytest
+
+
+@pytest.mark.asyncio
+async def test_map_batches():
+    """
+    GIVEN
+        fn which records the size of each batch.
+    WHEN
+        More items than batch_size are on the input channel.
+    EXPECT
+        fn is called once per batch, and the results are put in order.
+    """
+    sizes = []
+
+    def fn(xs):
+        sizes.append(len(xs))
+        return [x * 2 for x in xs]
+
+    ch = create_channel(10)
+    ch.offer_many(range(10))
+    ch.close()
+    out = map_batches(fn, ch, 10, batch_size=4)
+    await asyncio.wait_for(out.closed(), timeout=0.05)
+    assert out.poll_many(10) == [x * 2 for x in range(10)]
+    assert sizes == [4, 4, 2]
+
+@pytest.mark.asyncio
+async def test_map_batches_max_delay():
+    """
+    GIVEN
+        A max_delay.
+    WHEN
+        Items arrive one at a time, within max_delay.
+    EXPECT
+        They are mapped as one batch.
+    """
+    sizes = []
+
+    def fn(xs):
+        sizes.append(len(xs))
+        return xs
+
+    ch = create_channel(10)
+    out = map_batches(fn, ch, 10, batch_size=3, max_delay=0.05)
+    for x in range(3):
+        ch.offer(x)
+        await asyncio.sleep(0.005)
+    assert await out.take_many(3, all=True, timeout=0.1) == [0, 1, 2]
+    assert sizes == [3]
+    ch.close()
+
+@pytest.mark.asyncio
+async def test_map_batches_array():
+    """
+    GIVEN
+        as_array is True.
+    EXPECT
+        fn is called with a NumPy array, and results are Python values.
+    """
+    numpy = pytest.importorskip('numpy')
+    ch = create_channel(10)
+    ch.offer_many(range(1, 6))
+    ch.close()
+
+    def fn(xs):
+        assert isinstance(xs, numpy.ndarray)
+        return xs * 2
+
+    out = map_batches(fn, ch, 10, as_array=True)
+    await asyncio.wait_for(out.closed(), timeout=0.05)
+    results = out.poll_many(10)
+    assert results == [2, 4, 6, 8, 10]
+    assert all(type(x) is int for x in results)
+
+def test_map_batches_invalid():
+    """
+    WHEN
+        batch_size is not positive, or as_array is True without NumPy.
+    EXPECT
+        Raises ValueError, or RuntimeError.
+    """
+    with pytest.raises(ValueError):
+        map_batches(list, create_channel(), batch_size=0)
+    with pytest.raises(RuntimeError):
+        map_batches(list, create_channel(), as_array=True, _numpy=None)
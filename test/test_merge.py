@@ -1,4 +1,4 @@
-from asyncio_channel import create_channel, merge
+from asyncio_channel import create_channel, merge, shield_from_close
 
 import asyncio
 import pytest
@@ -27,3 +27,53 @@ async def test_merge():
     ch1.close()
     ch2.close()
     await asyncio.wait_for(out.closed(), timeout=0.05)
+
+@pytest.mark.asyncio
+async def test_merge_batch():
+    """
+    GIVEN
+        Merge created with batch True and multiple input channels.
+    WHEN
+        Items put on input channels.
+    EXPECT
+        All items are put on output channel, which is closed once the
+        inputs are.
+    """
+    ch1 = create_channel(10)
+    ch2 = create_channel(10)
+    out = merge([ch1, ch2], 4, batch=True, max_batch=3)
+    ch1.offer_many(range(10))
+    ch2.offer_many(range(10, 20))
+    ch1.close()
+    ch2.close()
+    xs = await asyncio.wait_for(out.take_many(100, all=True), timeout=0.1)
+    assert sorted(xs) == list(range(20))
+    assert out.is_closed()
+
+@pytest.mark.asyncio
+async def test_merge_shielded():
+    """
+    GIVEN
+        Merge created with an input channel shielded from close.
+    WHEN
+        An item is put on the input channel, which is then closed.
+    EXPECT
+        The item is put on output channel, which is closed once the input
+        is.
+    """
+    ch = create_channel()
+    out = merge([shield_from_close(ch)])
+    asyncio.get_running_loop().call_later(0.01, ch.offer, 'a')
+    assert await out.take(timeout=0.05) == 'a'
+    ch.close()
+    await asyncio.wait_for(out.closed(), timeout=0.05)
+
+def test_merge_batch_invalid():
+    """
+    WHEN
+        max_batch is not positive.
+    EXPECT
+        Raises ValueError.
+    """
+    with pytest.raises(ValueError):
+        merge([create_channel()], batch=True, max_batch=0)
@@ -1,7 +1,9 @@
 from asyncio_channel import create_channel, onto_channel, to_channel
 
+from concurrent.futures import ThreadPoolExecutor
 import asyncio
 import pytest
+import threading
 
 
 @pytest.mark.asyncio
@@ -71,3 +73,123 @@ async def test_to_channel():
         taken.append(x)
     assert tuple(taken) == coll
     assert out.is_closed()
+
+@pytest.mark.asyncio
+async def test_onto_channel_bulk():
+    """
+    WHEN
+        Called with a large collection and a channel with capacity for it.
+    EXPECT
+        All items are added without waiting on the event loop.
+    """
+    coll = range(100000)
+    ch = create_channel(len(coll))
+    done = onto_channel(coll, ch)
+    await asyncio.sleep(0)
+    assert done.is_closed()
+    assert ch.poll_many(len(coll)) == list(coll)
+
+@pytest.mark.asyncio
+async def test_onto_channel_iterator_capacity():
+    """
+    GIVEN
+        A channel without capacity for every item.
+    EXPECT
+        Items are only taken from the iterator as the channel has capacity.
+    """
+    it = iter(range(10))
+    ch = create_channel(4)
+    done = onto_channel(it, ch)
+    await asyncio.sleep(0.01)
+    # The blocked put of 4 is admitted as items are taken.
+    assert ch.poll_many(10) == [0, 1, 2, 3, 4]
+    assert next(it) == 5
+    await asyncio.wait_for(done.closed(), timeout=0.05)
+    assert ch.poll_many(10) == [6, 7, 8, 9]
+
+@pytest.mark.asyncio
+async def test_onto_channel_async():
+    """
+    WHEN
+        Called with an asynchronous generator.
+    EXPECT
+        All items to be put on channel and then closed.
+    """
+    async def gen():
+        for x in range(5):
+            await asyncio.sleep(0)
+            yield x
+
+    ch = create_channel(10)
+    done = onto_channel(gen(), ch)
+    await asyncio.wait_for(done.closed(), timeout=0.05)
+    assert ch.poll_many(10) == [0, 1, 2, 3, 4]
+    assert ch.is_closed()
+
+@pytest.mark.asyncio
+async def test_onto_channel_async_dest_closed():
+    """
+    GIVEN
+        An asynchronous generator.
+    WHEN
+        The channel is closed while items remain.
+    EXPECT
+        The generator is closed.
+    """
+    closed = False
+
+    async def gen():
+        nonlocal closed
+        try:
+            for x in range(100):
+                yield x
+        finally:
+            closed = True
+
+    ch = create_channel(2)
+    done = onto_channel(gen(), ch)
+    await asyncio.sleep(0.01)
+    ch.close()
+    await asyncio.wait_for(done.closed(), timeout=0.05)
+    assert closed
+
+@pytest.mark.asyncio
+async def test_onto_channel_executor():
+    """
+    GIVEN
+        A thread pool executor, and a small chunksize.
+    EXPECT
+        The iterable is read on a thread, and every item is put in order.
+    """
+    threads = set()
+
+    def read():
+        for x in range(20):
+            threads.add(threading.get_ident())
+            yield x
+
+    with ThreadPoolExecutor(1) as executor:
+        out = to_channel(read(), 5, executor=executor, chunksize=3)
+        taken = []
+        async for x in out:
+            taken.append(x)
+    assert taken == list(range(20))
+    assert threading.get_ident() not in threads
+
+def test_onto_channel_invalid():
+    """
+    WHEN
+        chunksize is not positive, or executor is given with an
+        asynchronous iterable.
+    EXPECT
+        Raises ValueError.
+    """
+    async def gen():
+        yield 1
+
+    with pytest.raises(ValueError):
+        onto_channel([1], create_channel(), chunksize=0)
+    with ThreadPoolExecutor(1) as executor:
+        it = gen()
+        with pytest.raises(ValueError):
+            onto_channel(it, create_channel(), executor=executor)
@@ -0,0 +1,133 @@
+from asyncio_channel import create_channel, partition
+
+import asyncio
+import pytest
+
+
+def _key(item):
+    return item[0]
+
+
+@pytest.mark.asyncio
+async def test_partition():
+    """
+    GIVEN
+        Items with several keys, and 4 outputs.
+    WHEN
+        The input channel is closed.
+    EXPECT
+        Items with equal keys are on the same output, in order, and every
+        output is closed.
+    """
+    ch = create_channel(100)
+    xs = [(k, i) for i in range(10) for k in range(10)]
+    ch.offer_many(xs)
+    ch.close()
+    p = partition(_key, ch, 4, 100)
+    assert len(p) == 4
+    await asyncio.wait_for(
+        asyncio.gather(*(out.closed() for out in p.outputs)),
+        timeout=0.05)
+    seen = []
+    for out in p.outputs:
+        ys = out.poll_many(100)
+        seen += ys
+        for k in {k for k, _ in ys}:
+            assert p.output(k) is out
+            assert [y for y in ys if y[0] == k] == [(k, i) for i in range(10)]
+    assert sorted(seen) == sorted(xs)
+    assert sum(1 for out in p.outputs if out.is_closed()) == 4
+
+@pytest.mark.asyncio
+async def test_partition_spread():
+    """
+    WHEN
+        Many keys are partitioned.
+    EXPECT
+        Every output gets a share of them.
+    """
+    p = partition(_key, create_channel(), 8)
+    counts = [0] * 8
+    for k in range(8000):
+        counts[p.outputs.index(p.output(k))] += 1
+    assert min(counts) > 500
+
+@pytest.mark.asyncio
+async def test_partition_resize():
+    """
+    WHEN
+        Outputs are added, then removed.
+    EXPECT
+        Only keys of the added or removed outputs move, and removed
+        outputs are closed.
+    """
+    ch = create_channel()
+    p = partition(_key, ch, 4)
+    before = {k: p.output(k) for k in range(4000)}
+    outs = p.resize(5)
+    assert len(outs) == 5
+    moved = [k for k in before if p.output(k) is not before[k]]
+    assert all(p.output(k) is outs[4] for k in moved)
+    assert 400 < len(moved) < 1400
+    p.resize(4)
+    assert outs[4].is_closed()
+    assert all(p.output(k) is before[k] for k in before)
+    ch.close()
+
+@pytest.mark.asyncio
+async def test_partition_resize_blocked():
+    """
+    GIVEN
+        The router is blocked putting on an output.
+    WHEN
+        That output is removed.
+    EXPECT
+        The remaining items are routed to the other outputs.
+    """
+    ch = create_channel(10)
+    p = partition(_key, ch, 2, 1)
+    last = p.outputs[1]
+    keys = [k for k in range(100) if p.output(k) is last][:3]
+    ch.offer_many([(k, 0) for k in keys])
+    await asyncio.sleep(0.01)
+    assert p.lag() == [0, 1]
+    p.resize(1)
+    first = p.outputs[0]
+    assert await first.take_many(2, all=True, timeout=0.05) == [
+        (k, 0) for k in keys[1:]]
+    assert last.poll() == (keys[0], 0)
+    ch.close()
+    await asyncio.wait_for(first.closed(), timeout=0.05)
+
+@pytest.mark.asyncio
+async def test_partition_lag():
+    """
+    WHEN
+        Items wait on the outputs.
+    EXPECT
+        lag() counts them per output.
+    """
+    ch = create_channel(10)
+    p = partition(_key, ch, 3, 10)
+    xs = [(k, 0) for k in range(9)]
+    ch.offer_many(xs)
+    await asyncio.sleep(0.01)
+    expected = [sum(1 for k, _ in xs if p.output(k) is out)
+                for out in p.outputs]
+    assert p.lag() == expected
+    assert sum(expected) == 9
+    ch.close()
+
+def test_partition_invalid():
+    """
+    WHEN
+        n, replicas or max_batch is not positive.
+    EXPECT
+        Raises ValueError.
+    """
+    with pytest.raises(ValueError):
+        partition(_key, create_channel(), 0)
+    with pytest.raises(ValueError):
+        partition(_key, create_channel(), 2, replicas=0)
+    with pytest.raises(ValueError):
+        partition(_key, create_channel(), 2, max_batch=0)
@@ -77,3 +77,96 @@ async def test_pipe_close():
     assert await dest.take(timeout=0.05) == x
     assert src.empty()
     await asyncio.wait_for(dest.closed(), timeout=0.05)
+
+@pytest.mark.asyncio
+async def test_pipe_unbuffered():
+    """
+    GIVEN
+        Unbuffered src and dest channels.
+    WHEN
+        Items put to src.
+    EXPECT
+        Items are transfered to dest channel.
+    """
+    src = create_channel(0)
+    dest = create_channel(0)
+    pipe(src, dest)
+    async def produce():
+        for x in 'abc':
+            await src.put(x)
+        src.close()
+    asyncio.create_task(produce())
+    taken = []
+    async for x in dest:
+        taken.append(x)
+    assert taken == ['a', 'b', 'c']
+
+@pytest.mark.asyncio
+async def test_pipe_backlog():
+    """
+    GIVEN
+        A src channel with a backlog, and a dest channel with room for it.
+    WHEN
+        Pipe src to dest.
+    EXPECT
+        The backlog is transfered in order, in one event loop step.
+    """
+    src = create_channel(1000)
+    dest = create_channel(1000)
+    src.offer_many(range(1000))
+    pipe(src, dest, max_batch=100)
+    await asyncio.sleep(0)
+    assert src.empty()
+    assert dest.poll_many(1000) == list(range(1000))
+
+@pytest.mark.asyncio
+async def test_pipe_backpressure():
+    """
+    GIVEN
+        A src channel with a backlog, and a smaller dest channel.
+    WHEN
+        Pipe src to dest, and take from dest.
+    EXPECT
+        Only a batch is taken from src ahead of dest, and all items are
+        transfered in order.
+    """
+    src = create_channel(100)
+    dest = create_channel(5)
+    src.offer_many(range(100))
+    src.close()
+    pipe(src, dest, max_batch=10)
+    await asyncio.sleep(0)
+    assert dest.full()
+    assert src._size() == 90
+    taken = []
+    async for x in dest:
+        taken.append(x)
+    assert taken == list(range(100))
+
+def test_pipe_invalid():
+    """
+    WHEN
+        max_batch is not positive.
+    EXPECT
+        Raises ValueError.
+    """
+    with pytest.raises(ValueError):
+        pipe(create_channel(), create_channel(), max_batch=0)
+
+@pytest.mark.asyncio
+async def test_pipe_xform():
+    """
+    GIVEN
+        dest is created with an xform.
+    WHEN
+        A backlog is piped.
+    EXPECT
+        Items are transformed as they are added to dest.
+    """
+    src = create_channel(100)
+    src.offer_many(range(100))
+    src.close()
+    dest = create_channel(10, xform=lambda xs: [-x for x in xs if x % 3])
+    pipe(src, dest)
+    taken = [x async for x in dest]
+    assert taken == [-x for x in range(100) if x % 3]
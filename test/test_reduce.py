@@ -1,5 +1,6 @@
 from asyncio_channel import create_channel, onto_channel, reduce
 
+from concurrent.futures import ThreadPoolExecutor
 import asyncio
 import operator
 import pytest
@@ -17,3 +18,20 @@ async def test_reduce():
     result = await out.take(timeout=0.05)
     assert result == 6
     assert out.empty()
+
+@pytest.mark.asyncio
+async def test_reduce_executor():
+    """
+    GIVEN
+        fn run in a thread pool executor, in small chunks.
+    EXPECT
+        The result put on the output channel.
+    """
+    ch = create_channel(10)
+    ch.offer_many(range(10))
+    ch.close()
+    with ThreadPoolExecutor(1) as executor:
+        out = reduce(operator.add, ch, init=0, executor=executor,
+                     chunksize=3)
+        result = await out.take(timeout=1)
+    assert result == 45
@@ -0,0 +1,44 @@
+from asyncio_channel import create_channel, onto_channel, scan
+
+import asyncio
+import operator
+import pytest
+
+
+@pytest.mark.asyncio
+async def test_scan():
+    """
+    EXPECT
+        Each running result put on the output channel.
+    """
+    ch = create_channel()
+    onto_channel(range(5), ch)
+    out = scan(operator.add, ch, 0, 10)
+    await asyncio.wait_for(out.closed(), timeout=0.05)
+    assert out.poll_many(10) == [0, 1, 3, 6, 10]
+
+@pytest.mark.asyncio
+async def test_scan_open():
+    """
+    GIVEN
+        An input channel which is not closed.
+    EXPECT
+        Results are put as items arrive.
+    """
+    ch = create_channel()
+    out = scan(operator.add, ch, 0)
+    ch.offer(2)
+    assert await out.take(timeout=0.05) == 2
+    ch.offer(3)
+    assert await out.take(timeout=0.05) == 5
+    ch.close()
+
+def test_scan_invalid():
+    """
+    WHEN
+        max_batch is not positive.
+    EXPECT
+        Raises ValueError.
+    """
+    with pytest.raises(ValueError):
+        scan(operator.add, create_channel(), 0, max_batch=0)
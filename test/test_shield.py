@@ -215,3 +215,52 @@ async def test_shield_combined():
         dch.offer('a')
     with pytest.raises(ProhibitedOperationError, match='put'):
         await dch.put('b')
+
+@pytest.mark.asyncio
+async def test_shield_bulk():
+    """
+    GIVEN
+        An open channel, shielded from read or write operations.
+    WHEN
+        Bulk read or write operations are called.
+    EXPECT
+        Unshielded operations are forwarded, shielded operations return
+        defaults or raise ProhibitedOperationError.
+    """
+    ch = create_channel(3)
+    rch = shield_from_read(ch)
+    assert rch.offer_many('ab') == 2
+    with pytest.raises(ProhibitedOperationError, match='poll_many'):
+        rch.poll_many(2)
+    with pytest.raises(ProhibitedOperationError, match='take_many'):
+        await rch.take_many(2)
+    assert shield_from_read(ch, silent=True).poll_many(2) == []
+    wch = shield_from_write(ch)
+    assert wch.poll_many(1) == ['a']
+    with pytest.raises(ProhibitedOperationError, match='offer_many'):
+        wch.offer_many('c')
+    with pytest.raises(ProhibitedOperationError, match='put_many'):
+        await wch.put_many('c')
+    assert await shield_from_write(ch, silent=True).put_many('c') == 0
+    assert await wch.take_many(2) == ['b']
+
+@pytest.mark.asyncio
+async def test_shield_batches():
+    """
+    GIVEN
+        A channel, shielded from read or write operations.
+    WHEN
+        Iterate over batches().
+    EXPECT
+        A write shield forwards it, a read shield raises
+        ProhibitedOperationError or, if silent, stops at once.
+    """
+    ch = create_channel(3)
+    ch.offer_many('ab')
+    ch.close()
+    with pytest.raises(ProhibitedOperationError, match='batches'):
+        shield_from_read(ch).batches(2)
+    rch = shield_from_read(ch, silent=True)
+    assert [xs async for xs in rch.batches(2)] == []
+    wch = shield_from_write(ch)
+    assert [xs async for xs in wch.batches(2)] == [['a', 'b']]
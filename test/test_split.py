@@ -1,5 +1,6 @@
 from asyncio_channel import create_channel, split
 
+from concurrent.futures import ThreadPoolExecutor
 import asyncio
 import pytest
 
@@ -32,3 +33,26 @@ async def test_split():
     await asyncio.wait_for(
         asyncio.wait((t_out.closed(), f_out.closed())),
         timeout=0.05)
+
+@pytest.mark.asyncio
+async def test_split_executor():
+    """
+    GIVEN
+        A predicate run in a thread pool executor, in small chunks.
+    WHEN
+        Numbers are put on the input channel.
+    EXPECT
+        Numbers are sorted in order onto the output channels.
+    """
+    is_even = lambda n: n % 2 == 0
+    ch = create_channel(20)
+    ch.offer_many(range(20))
+    ch.close()
+    with ThreadPoolExecutor(2) as executor:
+        t_out, f_out = split(is_even, ch, 20, 20, executor=executor,
+                             chunksize=3, concurrency=2)
+        await asyncio.wait_for(
+            asyncio.gather(t_out.closed(), f_out.closed()),
+            timeout=1)
+    assert t_out.poll_many(20) == list(range(0, 20, 2))
+    assert f_out.poll_many(20) == list(range(1, 20, 2))
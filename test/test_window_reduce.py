@@ -0,0 +1,171 @@
+from asyncio_channel import create_channel, shield_from_close, window_reduce
+
+import asyncio
+import operator
+import pytest
+
+
+async def _results(ch, xs, out):
+    ch.offer_many(xs)
+    ch.close()
+    await asyncio.wait_for(out.closed(), timeout=0.05)
+    return out.poll_many(100)
+
+@pytest.mark.asyncio
+async def test_window_count_tumbling():
+    """
+    WHEN
+        Items are reduced in tumbling windows of 3.
+    EXPECT
+        A result per window, and for the final partial window.
+    """
+    ch = create_channel(10)
+    out = window_reduce(operator.add, ch, 0, 10, count=3)
+    assert await _results(ch, range(8), out) == [3, 12, 13]
+
+@pytest.mark.asyncio
+async def test_window_count_sliding():
+    """
+    WHEN
+        Items are reduced in windows of 3, sliding by 2, with and without
+        an inverse.
+    EXPECT
+        The same results, for the last 3 items every 2 items.
+    """
+    expected = [1, 6, 12, 18]
+    ch = create_channel(10)
+    out = window_reduce(operator.add, ch, 0, 10, count=3, slide=2)
+    assert await _results(ch, range(8), out) == expected
+    ch = create_channel(10)
+    out = window_reduce(operator.add, ch, 0, 10, count=3, slide=2,
+                        inverse=operator.sub)
+    assert await _results(ch, range(8), out) == expected
+
+@pytest.mark.asyncio
+async def test_window_count_inverse():
+    """
+    GIVEN
+        An inverse function.
+    EXPECT
+        Items leaving the window are removed with it, not refolded.
+    """
+    calls = 0
+
+    def add(a, b):
+        nonlocal calls
+        calls += 1
+        return a + b
+
+    ch = create_channel(100)
+    out = window_reduce(add, ch, 0, 100, count=10, slide=1,
+                        inverse=operator.sub)
+    results = await _results(ch, range(50), out)
+    assert results[-1] == sum(range(40, 50))
+    assert calls == 50
+
+@pytest.mark.asyncio
+async def test_window_time_tumbling():
+    """
+    WHEN
+        Items arrive in tumbling time windows.
+    EXPECT
+        A result per window, including empty windows.
+    """
+    ch = create_channel(10)
+    out = window_reduce(operator.add, ch, 0, 10, duration=0.05)
+    ch.offer_many([1, 2])
+    assert await out.take(timeout=0.1) == 3
+    assert await out.take(timeout=0.1) == 0
+    ch.offer(4)
+    assert await out.take(timeout=0.1) == 4
+    ch.close()
+    await asyncio.wait_for(out.closed(), timeout=0.1)
+
+@pytest.mark.asyncio
+async def test_window_time_sliding():
+    """
+    WHEN
+        Items arrive in windows of 0.1s, sliding by 0.05s.
+    EXPECT
+        Items count in the two windows following their arrival.
+    """
+    ch = create_channel(10)
+    out = window_reduce(operator.add, ch, 0, 10, duration=0.1, slide=0.05,
+                        inverse=operator.sub)
+    ch.offer(1)
+    assert await out.take(timeout=0.1) == 1
+    ch.offer(2)
+    assert await out.take(timeout=0.1) == 3
+    assert await out.take(timeout=0.1) == 2
+    assert await out.take(timeout=0.1) == 0
+    ch.close()
+    await asyncio.wait_for(out.closed(), timeout=0.1)
+
+@pytest.mark.asyncio
+async def test_window_time_closed():
+    """
+    WHEN
+        The input is closed part way through a window.
+    EXPECT
+        A result for the partial window, then the output is closed.
+    """
+    ch = create_channel(10)
+    out = window_reduce(operator.add, ch, 0, 10, duration=10)
+    ch.offer_many([1, 2, 3])
+    await asyncio.sleep(0.01)
+    ch.close()
+    await asyncio.wait_for(out.closed(), timeout=0.05)
+    assert out.poll_many(10) == [6]
+
+@pytest.mark.asyncio
+async def test_window_time_closed_while_blocked():
+    """
+    WHEN
+        The input is closed while the stage is blocked putting a result.
+    EXPECT
+        Results for the windows already due, then the output is closed.
+    """
+    ch = create_channel()
+    out = window_reduce(operator.add, ch, 0, duration=0.05)
+    await asyncio.sleep(0.2)
+    ch.close()
+    xs = await asyncio.wait_for(out.take_many(100, all=True), timeout=0.2)
+    # One for each window of the 0.2 seconds, and any partial window.
+    assert 1 <= len(xs) <= 6
+    assert set(xs) == {0}
+    assert out.is_closed()
+
+@pytest.mark.asyncio
+async def test_window_time_shielded():
+    """
+    GIVEN
+        An input channel shielded from close.
+    WHEN
+        Items are added over a time window, then the channel is closed.
+    EXPECT
+        Results for the windows, then the output is closed.
+    """
+    ch = create_channel(10)
+    out = window_reduce(operator.add, shield_from_close(ch), 0, 10,
+                        duration=0.05)
+    loop = asyncio.get_running_loop()
+    loop.call_later(0.01, ch.offer_many, [1, 2])
+    loop.call_later(0.02, ch.offer, 3)
+    loop.call_later(0.03, ch.close)
+    await asyncio.wait_for(out.closed(), timeout=0.1)
+    assert out.poll_many(10) == [6]
+
+def test_window_invalid():
+    """
+    WHEN
+        Both or neither of count and duration, a window or slide that is
+        not positive, or slide larger than the window.
+    EXPECT
+        Raises ValueError.
+    """
+    ch = create_channel()
+    for kwargs in ({}, {'count': 2, 'duration': 1}, {'count': 0},
+                   {'duration': 1, 'slide': 0}, {'count': 2, 'slide': 3},
+                   {'count': 2, 'max_batch': 0}):
+        with pytest.raises(ValueError):
+            window_reduce(operator.add, ch, 0, **kwargs)